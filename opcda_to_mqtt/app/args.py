@@ -92,6 +92,196 @@ class ArgumentParser:
             default=None,
             help="Number of worker threads"
         )
+        self._parser.add_argument(
+            "--mode",
+            choices=["poll", "subscribe"],
+            default=None,
+            help="Poll tags or subscribe to data changes"
+        )
+        self._parser.add_argument(
+            "--adaptive-max",
+            type=int,
+            default=None,
+            help="Slow static tags down to one read per milliseconds"
+        )
+        self._parser.add_argument(
+            "--phase",
+            choices=["none", "hash", "even"],
+            default=None,
+            help="Spread first reads of chunks over the interval"
+        )
+        self._parser.add_argument(
+            "--scheduler",
+            choices=["relative", "fixed"],
+            default=None,
+            help="Wait interval after reads or keep a fixed period"
+        )
+        self._parser.add_argument(
+            "--timer",
+            choices=["heap", "wheel"],
+            default=None,
+            help="Heap timer or hashed timing wheel"
+        )
+        self._parser.add_argument(
+            "--timer-tick",
+            type=int,
+            default=None,
+            help="Timing wheel slot width in milliseconds"
+        )
+        self._parser.add_argument(
+            "--queue-capacity",
+            type=int,
+            default=None,
+            help="Maximum waiting read tasks, 0 for unbounded"
+        )
+        self._parser.add_argument(
+            "--queue-policy",
+            choices=["block", "drop-oldest", "coalesce"],
+            default=None,
+            help="What to do when the read queue is full"
+        )
+        self._parser.add_argument(
+            "--queue-coalesce",
+            action="store_true",
+            default=None,
+            help="Answer new reads of waiting tags from the waiting read"
+        )
+        self._parser.add_argument(
+            "--device-depth",
+            type=int,
+            default=None,
+            help="Tag path segments naming a device, 0 to disable"
+        )
+        self._parser.add_argument(
+            "--device-limit",
+            type=int,
+            default=None,
+            help="Maximum concurrent reads per device"
+        )
+        self._parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Split tags between this many bridge processes"
+        )
+        self._parser.add_argument(
+            "--shards",
+            choices=["none", "hash", "device"],
+            default=None,
+            help="Give each worker its own queue of tags"
+        )
+        self._parser.add_argument(
+            "--latency-target",
+            type=int,
+            default=None,
+            help="Read latency in milliseconds the concurrency limit "
+                 "aims for"
+        )
+        self._parser.add_argument(
+            "--reconnect-min",
+            type=int,
+            default=None,
+            help="Milliseconds before the first reconnect of a worker"
+        )
+        self._parser.add_argument(
+            "--reconnect-max",
+            type=int,
+            default=None,
+            help="Longest milliseconds between reconnects of a worker"
+        )
+        self._parser.add_argument(
+            "--read-deadline",
+            type=int,
+            default=None,
+            help="Milliseconds an OPC call may hang before its worker "
+                 "is replaced, 0 to wait forever"
+        )
+        self._parser.add_argument(
+            "--breaker-threshold",
+            type=int,
+            default=None,
+            help="Consecutive Bad or Error reads that hold back a tag, "
+                 "0 to read every tag at full rate"
+        )
+        self._parser.add_argument(
+            "--breaker-probe",
+            type=int,
+            default=None,
+            help="Milliseconds between probe reads of a held back tag"
+        )
+        self._parser.add_argument(
+            "--worker-drain",
+            type=int,
+            default=None,
+            help="Maximum read tasks a worker takes per wakeup"
+        )
+        self._parser.add_argument(
+            "--publish-stage",
+            action="store_true",
+            default=None,
+            help="Publish results on a separate thread"
+        )
+        self._parser.add_argument(
+            "--publish-capacity",
+            type=int,
+            default=None,
+            help="Maximum read results waiting to be published"
+        )
+        self._parser.add_argument(
+            "--publish-policy",
+            choices=["block", "drop-oldest"],
+            default=None,
+            help="What to do when the publish queue is full"
+        )
+        self._parser.add_argument(
+            "--batch",
+            type=int,
+            default=None,
+            help="Number of tags read in one OPC request"
+        )
+        self._parser.add_argument(
+            "--discover-connections",
+            type=int,
+            default=None,
+            help="OPC connections browsing sibling branches in parallel "
+                 "during discovery"
+        )
+        self._parser.add_argument(
+            "--validate",
+            action="store_true",
+            default=None,
+            help="Read every tag once at startup and drop unreadable ones"
+        )
+        self._parser.add_argument(
+            "--validate-batch",
+            type=int,
+            default=None,
+            help="Tags read in one startup validation request"
+        )
+        self._parser.add_argument(
+            "--groups",
+            action="store_true",
+            default=None,
+            help="Read batches through persistent OPC groups"
+        )
+        self._parser.add_argument(
+            "--exception",
+            action="store_true",
+            default=None,
+            help="Publish only changed values"
+        )
+        self._parser.add_argument(
+            "--heartbeat",
+            type=int,
+            default=None,
+            help="Republish unchanged values after milliseconds"
+        )
+        self._parser.add_argument(
+            "--stats-interval",
+            type=int,
+            default=None,
+            help="Log statistics every milliseconds, 0 to disable"
+        )
         self._parser.add_argument(
             "--dry-run",
             action="store_true",
@@ -201,6 +201,288 @@ class MergedConfig:
         """
         return self.get("workers", 50)
 
+    def mode(self):
+        """
+        Get acquisition mode.
+
+        Returns:
+            "poll" for timed reads or "subscribe" for data-change
+            notifications
+        """
+        return self.get("mode", "poll")
+
+    def scan_classes(self):
+        """
+        Get scan class rules.
+
+        Returns:
+            List of dicts with pattern and interval in milliseconds
+        """
+        return self.get("scan_classes", [])
+
+    def adaptive_max(self):
+        """
+        Get longest adaptive polling period in milliseconds.
+
+        Returns:
+            Ceiling integer, 0 to poll static tags at full rate
+        """
+        return self.get("adaptive_max", 0)
+
+    def phase(self):
+        """
+        Get phase spread of first reads.
+
+        Returns:
+            "none", "hash" or "even"
+        """
+        return self.get("phase", "none")
+
+    def scheduler(self):
+        """
+        Get poll scheduler mode.
+
+        Returns:
+            "relative" to wait interval after each read, or "fixed"
+            to keep reads on an absolute period
+        """
+        return self.get("scheduler", "relative")
+
+    def timer(self):
+        """
+        Get poll timer implementation.
+
+        Returns:
+            "heap" for TimerThread or "wheel" for WheelTimer
+        """
+        return self.get("timer", "heap")
+
+    def timer_tick(self):
+        """
+        Get timing wheel slot width in milliseconds.
+
+        Returns:
+            Tick integer
+        """
+        return self.get("timer_tick", 10)
+
+    def queue_capacity(self):
+        """
+        Get maximum number of waiting read tasks.
+
+        Returns:
+            Capacity integer, 0 for unbounded
+        """
+        return self.get("queue_capacity", 0)
+
+    def queue_policy(self):
+        """
+        Get overload policy of a full queue.
+
+        Returns:
+            "block", "drop-oldest" or "coalesce"
+        """
+        return self.get("queue_policy", "drop-oldest")
+
+    def queue_coalesce(self):
+        """
+        Check if waiting reads absorb new reads of the same tags.
+
+        Returns:
+            True if per-tag coalescing is enabled
+        """
+        return self.get("queue_coalesce", False)
+
+    def device_depth(self):
+        """
+        Get number of tag path segments naming a device.
+
+        Returns:
+            Depth integer, 0 to disable per-device scheduling
+        """
+        return self.get("device_depth", 0)
+
+    def device_limit(self):
+        """
+        Get maximum concurrent reads per device.
+
+        Returns:
+            Limit integer
+        """
+        return self.get("device_limit", 1)
+
+    def processes(self):
+        """
+        Get number of bridge processes.
+
+        Returns:
+            Process count integer, 1 to run in this process
+        """
+        return self.get("processes", 1)
+
+    def shards(self):
+        """
+        Get how tags are split between worker queues.
+
+        Returns:
+            "none", "hash" or "device"
+        """
+        return self.get("shards", "none")
+
+    def latency_target(self):
+        """
+        Get read latency the adaptive concurrency limit aims for.
+
+        Returns:
+            Milliseconds integer, 0 to run every worker at once
+        """
+        return self.get("latency_target", 0)
+
+    def reconnect_min(self):
+        """
+        Get delay before the first reconnect of a worker.
+
+        Returns:
+            Milliseconds integer
+        """
+        return self.get("reconnect_min", 1000)
+
+    def reconnect_max(self):
+        """
+        Get longest delay between reconnects of a worker.
+
+        Returns:
+            Milliseconds integer
+        """
+        return self.get("reconnect_max", 60000)
+
+    def read_deadline(self):
+        """
+        Get longest time an OPC call may take before its worker is
+        replaced.
+
+        Returns:
+            Milliseconds integer, 0 to never abandon calls
+        """
+        return self.get("read_deadline", 0)
+
+    def breaker_threshold(self):
+        """
+        Get consecutive bad reads after which a tag is held back.
+
+        Returns:
+            Read count integer, 0 to never hold back tags
+        """
+        return self.get("breaker_threshold", 0)
+
+    def breaker_probe(self):
+        """
+        Get time between probe reads of a held back tag.
+
+        Returns:
+            Milliseconds integer
+        """
+        return self.get("breaker_probe", 60000)
+
+    def worker_drain(self):
+        """
+        Get maximum read tasks a worker takes per wakeup.
+
+        Returns:
+            Task count integer
+        """
+        return self.get("worker_drain", 1)
+
+    def publish_stage(self):
+        """
+        Check if results are published on a separate thread.
+
+        Returns:
+            True if the publish stage is enabled
+        """
+        return self.get("publish_stage", False)
+
+    def publish_capacity(self):
+        """
+        Get maximum number of read results waiting to be published.
+
+        Returns:
+            Capacity integer, 0 for unbounded
+        """
+        return self.get("publish_capacity", 0)
+
+    def publish_policy(self):
+        """
+        Get overload policy of a full publish queue.
+
+        Returns:
+            "block" or "drop-oldest"
+        """
+        return self.get("publish_policy", "block")
+
+    def batch(self):
+        """
+        Get number of tags read in one OPC request.
+
+        Returns:
+            Batch size integer
+        """
+        return self.get("batch", 1)
+
+    def groups(self):
+        """
+        Check if batches are read through persistent OPC groups.
+
+        Returns:
+            True if OPC groups are enabled
+        """
+        return self.get("groups", False)
+
+    def exception(self):
+        """
+        Check if only changed values are published.
+
+        Returns:
+            True if report-by-exception is enabled
+        """
+        return self.get("exception", False)
+
+    def heartbeat(self):
+        """
+        Get maximum silence for unchanged tags in milliseconds.
+
+        Returns:
+            Heartbeat integer, 0 to disable
+        """
+        return self.get("heartbeat", 0)
+
+    def deadband(self):
+        """
+        Get deadband rules.
+
+        Returns:
+            List of dicts with pattern and absolute or percent band
+        """
+        return self.get("deadband", [])
+
+    def compression(self):
+        """
+        Get swinging-door compression rules.
+
+        Returns:
+            List of dicts with pattern and deviation
+        """
+        return self.get("compression", [])
+
+    def stats_interval(self):
+        """
+        Get interval between statistics log lines in milliseconds.
+
+        Returns:
+            Interval integer, 0 to disable
+        """
+        return self.get("stats_interval", 60000)
+
     def exclude(self):
         """
         Get tag exclusion patterns.
@@ -210,6 +492,35 @@ class MergedConfig:
         """
         return self.get("exclude", [])
 
+    def discover_connections(self):
+        """
+        Get number of connections browsing in parallel during
+        discovery.
+
+        Returns:
+            Connection count integer
+        """
+        return self.get("discover_connections", 4)
+
+    def validate(self):
+        """
+        Check if tags are read once at startup to prune unreadable
+        ones.
+
+        Returns:
+            True if startup validation is enabled
+        """
+        return self.get("validate", False)
+
+    def validate_batch(self):
+        """
+        Get number of tags read in one validation request.
+
+        Returns:
+            Batch size integer
+        """
+        return self.get("validate_batch", 200)
+
     def dry_run(self):
         """
         Check if dry-run mode is enabled.
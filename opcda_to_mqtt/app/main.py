@@ -14,17 +14,41 @@ Example:
 from __future__ import print_function
 
 import fnmatch
+import json
+import multiprocessing
+import Queue
 import signal
 import sys
+import time
+import zlib
 
 from opcda_to_mqtt.app.args import ArgumentParser
 from opcda_to_mqtt.app.config import JsonConfig, MergedConfig
 from opcda_to_mqtt.app.log import LogConfig
 from opcda_to_mqtt.domain.path import TagPath
 from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.filter.filter import ChainFilter
+from opcda_to_mqtt.filter.exception import ExceptionFilter
+from opcda_to_mqtt.filter.deadband import Deadband, DeadbandFilter
+from opcda_to_mqtt.filter.compression import CompressionFilter
+from opcda_to_mqtt.result.optional import Some, Empty
 from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.device import DeviceQueue
+from opcda_to_mqtt.sync.shard import ShardedQueue
+from opcda_to_mqtt.sync.publish import InlineStage, PublishStage
+from opcda_to_mqtt.sync.limit import ConcurrencyLimit, LimitedQueue
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.sync.clock import SOURCE, WALL
+from opcda_to_mqtt.sync.watchdog import Watchdog
+from opcda_to_mqtt.sync.breaker import NoBreaker, TagBreaker
 from opcda_to_mqtt.sync.timer import TimerThread
+from opcda_to_mqtt.sync.wheel import WheelTimer
+from opcda_to_mqtt.sync.scan import ScanClass
 from opcda_to_mqtt.sync.bridge import Bridge
+from opcda_to_mqtt.sync.subscriber import ClientSubscriber
+from opcda_to_mqtt.sync.subscription import SubscriptionBridge
+
+STOP_TIMEOUT = 10
 
 
 def _matches(text, patterns):
@@ -44,6 +68,679 @@ def _matches(text, patterns):
     return False
 
 
+def _bands(rules, tags, ranges):
+    """
+    Compute deadband widths of tags.
+
+    The first rule matching a tag decides its band.
+
+    Args:
+        rules: List of Deadband rules
+        tags: List of TagPath
+        ranges: Dict of TagPath to (low, high) EU range
+
+    Returns:
+        Dict mapping tag path strings to band widths
+    """
+    bands = {}
+    for tag in tags:
+        for rule in rules:
+            if rule.matches(tag):
+                span = Some(ranges[tag]) if tag in ranges else Empty()
+                width = rule.width(span)
+                if width.is_present():
+                    bands[tag.text()] = width.otherwise(0.0)
+                break
+    return bands
+
+
+def _deadband(cfg, source, tags, logger):
+    """
+    Resolve configured deadband rules to per-tag band widths.
+
+    EU ranges are read from the source only for tags matched
+    by a percent rule.
+
+    Args:
+        cfg: MergedConfig
+        source: DaSource for EU range lookup
+        tags: List of TagPath
+        logger: Logger for progress messages
+
+    Returns:
+        Dict mapping tag path strings to band widths
+    """
+    rules = [
+        Deadband(r["pattern"], r.get("absolute", 0), r.get("percent", 0))
+        for r in cfg.deadband()
+    ]
+    if not rules:
+        return {}
+    spanned = [
+        t for t in tags
+        if any(r.needs_span() and r.matches(t) for r in rules)
+    ]
+    ranges = {}
+    if spanned:
+        result = source.ranges(spanned)
+        if not result.is_right():
+            logger.warning("EU range lookup failed: %s" % result.fold(
+                lambda e: e.text(), lambda _: ""
+            ))
+        ranges = result.fold(lambda e: {}, lambda r: r)
+    bands = _bands(rules, tags, ranges)
+    logger.info("Deadband on %d tags" % len(bands))
+    return bands
+
+
+def _validate(cfg, source, tags, logger):
+    """
+    Drop tags that cannot be read.
+
+    Tags are read in batches on one connection per worker. When
+    validation itself fails every tag is kept.
+
+    Args:
+        cfg: MergedConfig
+        source: DaSource checking the tags
+        tags: List of TagPath
+        logger: Logger for the validation summary
+
+    Returns:
+        List of readable TagPath
+    """
+    result = source.validate(tags, cfg.validate_batch(), cfg.workers())
+    if not result.is_right():
+        logger.warning("Tag validation failed: %s" % result.fold(
+            lambda e: e.text(), lambda _: ""
+        ))
+        return tags
+    readable, unreadable = result.fold(lambda e: (tags, []), lambda r: r)
+    logger.info("Validated %d tags: %d readable, %d dropped" % (
+        len(tags), len(readable), len(unreadable)
+    ))
+    for tag in unreadable:
+        logger.warning("  - unreadable: %s" % tag.text())
+    return readable
+
+
+def _deviations(rules, tags):
+    """
+    Compute compression deviations of tags.
+
+    The first rule matching a tag decides its deviation.
+
+    Args:
+        rules: List of dicts with pattern and deviation
+        tags: List of TagPath
+
+    Returns:
+        Dict mapping tag path strings to deviations
+    """
+    deviations = {}
+    for tag in tags:
+        for rule in rules:
+            if fnmatch.fnmatch(tag.text(), rule["pattern"]):
+                deviations[tag.text()] = float(rule.get("deviation", 0))
+                break
+    return deviations
+
+
+def _filter(cfg, bands, deviations=None):
+    """
+    Build the publish filter chain from configuration.
+
+    Deadband runs first, so compression only sees significant
+    changes, and exception reporting drops what is left over.
+
+    Args:
+        cfg: MergedConfig
+        bands: Dict mapping tag path strings to deadband widths
+        deviations: Dict mapping tag path strings to compression
+            deviations, none when None
+
+    Returns:
+        ChainFilter of enabled filters
+    """
+    if deviations is None:
+        deviations = {}
+    heartbeat = Empty()
+    if cfg.heartbeat():
+        heartbeat = Some(Milliseconds(cfg.heartbeat()))
+    filters = []
+    if bands:
+        filters.append(DeadbandFilter(bands, heartbeat))
+    if deviations:
+        filters.append(CompressionFilter(deviations, heartbeat))
+    if cfg.exception():
+        filters.append(ExceptionFilter(heartbeat))
+    return ChainFilter(filters)
+
+
+def _ceiling(amount):
+    """
+    Build an adaptive polling ceiling.
+
+    Args:
+        amount: Milliseconds, 0 to disable
+
+    Returns:
+        Optional Milliseconds
+    """
+    return Some(Milliseconds(amount)) if amount else Empty()
+
+
+def _classes(cfg):
+    """
+    Build scan classes from configuration.
+
+    A class without its own "max" uses the global adaptive-max.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        List of ScanClass
+    """
+    return [
+        ScanClass(
+            r["pattern"], Milliseconds(r["interval"]),
+            _ceiling(r.get("max", cfg.adaptive_max()))
+        )
+        for r in cfg.scan_classes()
+    ]
+
+
+def _queue(cfg):
+    """
+    Build the read task queue from configuration.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        ShardedQueue with one local queue per worker if sharding
+        is set, otherwise a single local queue
+    """
+    if cfg.shards() == "none":
+        return _local(cfg)
+    if cfg.shards() == "device":
+        key = lambda tag: tag.device(_depth(cfg))
+    else:
+        key = lambda tag: tag.text()
+    return ShardedQueue([_local(cfg) for _ in range(cfg.workers())], key)
+
+
+def _local(cfg):
+    """
+    Build one queue of read tasks from configuration.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        DeviceQueue if a device depth is set, otherwise TaskQueue,
+        either with the configured capacity, overload policy and
+        coalescing
+    """
+    if cfg.device_depth():
+        return DeviceQueue(
+            cfg.device_depth(), cfg.device_limit(), cfg.queue_capacity(),
+            cfg.queue_policy(), cfg.queue_coalesce()
+        )
+    return TaskQueue(
+        cfg.queue_capacity(), cfg.queue_policy(), cfg.queue_coalesce()
+    )
+
+
+def _depth(cfg):
+    """
+    Get the device depth chunks are split by.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        Configured device depth, at least 1 when sharding by device
+    """
+    if cfg.shards() == "device":
+        return cfg.device_depth() or 1
+    return cfg.device_depth()
+
+
+def _partition(depth):
+    """
+    Build the chunk partition function.
+
+    Args:
+        depth: Number of tag path segments naming the device,
+            0 to chunk across devices
+
+    Returns:
+        Function mapping TagPath to a device key
+    """
+    if not depth:
+        return lambda tag: ""
+    return lambda tag: tag.device(depth)
+
+
+def _shards(queue, count):
+    """
+    Pair each worker with the queue it reads and its health hooks.
+
+    Args:
+        queue: Queue built by _queue
+        count: Number of workers
+
+    Returns:
+        List of (queue, retire function, restore function) per
+        worker; retiring moves the tasks of a sharded worker to
+        the others until it is restored
+    """
+    if isinstance(queue, ShardedQueue):
+        return [
+            (shard, shard.retire, shard.restore)
+            for shard in [queue.shard(index) for index in range(count)]
+        ]
+    return [(queue, lambda: None, lambda: None)] * count
+
+
+def _failed(retire, logger):
+    """
+    Build the failure hook of a worker.
+
+    Args:
+        retire: Function taking the worker's shard off the ring
+        logger: Logger for the failure
+
+    Returns:
+        Function called with the error that stopped the worker
+    """
+    def failed(error):
+        logger.error("Worker lost its connection: %s" % error)
+        retire()
+    return failed
+
+
+def _limited(cfg):
+    """
+    Build the wrapper applying the adaptive concurrency limit.
+
+    All queues wrapped by one call share one limit, with the
+    number of workers as its maximum.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        Function wrapping a queue in LimitedQueue if a latency
+        target is set, otherwise returning it unchanged
+    """
+    target = cfg.latency_target()
+    limit = Some(ConcurrencyLimit(
+        cfg.workers(), Milliseconds(target).seconds()
+    )) if target else Empty()
+    return lambda queue: limit.fold(
+        lambda: queue, lambda shared: LimitedQueue(queue, shared)
+    )
+
+
+def _stage(cfg):
+    """
+    Build the publish stage from configuration.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        PublishStage with the configured capacity and overload
+        policy if enabled, otherwise InlineStage
+    """
+    if not cfg.publish_stage():
+        return InlineStage()
+    return PublishStage(cfg.publish_capacity(), cfg.publish_policy())
+
+
+def _timer(cfg, interval):
+    """
+    Build the poll timer from configuration.
+
+    The wheel gets enough slots for one interval to fit in a
+    single turn.
+
+    Args:
+        cfg: MergedConfig
+        interval: Milliseconds between reads
+
+    Returns:
+        TimerThread or WheelTimer
+    """
+    if cfg.timer() != "wheel":
+        return TimerThread()
+    tick = Milliseconds(cfg.timer_tick())
+    slots = max(1, int(interval.seconds() / tick.seconds()) + 1)
+    return WheelTimer(tick.seconds(), slots)
+
+
+def _bridge(cfg, source, broker, tags, logger):
+    """
+    Build the bridge of the configured mode.
+
+    Args:
+        cfg: MergedConfig
+        source: OpenOpcSource for EU ranges
+        broker: MqttBroker to publish to
+        tags: List of TagPath to monitor
+        logger: Logger for progress messages
+
+    Returns:
+        Bridge or SubscriptionBridge, not started
+    """
+    from opcda_to_mqtt.sync.openopc_worker import OpenOpcWorker
+    from opcda_to_mqtt.sync.openopc_subscriber import (
+        OpenOpcSubscriptionClient
+    )
+    bands = _deadband(cfg, source, tags, logger)
+    deviations = _deviations(cfg.compression(), tags)
+    if deviations:
+        logger.info("Compression on %d tags" % len(deviations))
+    screen = _filter(cfg, bands, deviations)
+    backoff = Backoff(
+        Milliseconds(cfg.reconnect_min()).seconds(),
+        Milliseconds(cfg.reconnect_max()).seconds()
+    )
+    if cfg.mode() == "subscribe":
+        subscribers = [
+            ClientSubscriber(
+                OpenOpcSubscriptionClient(cfg.da_progid(), cfg.da_host()),
+                failed=_failed(lambda: None, logger), backoff=backoff
+            )
+            for _ in range(cfg.workers())
+        ]
+        logger.info("Subscription mode: publishing reported changes")
+        return SubscriptionBridge(subscribers, broker, screen)
+    queue = _queue(cfg)
+    limited = _limited(cfg)
+    timer = _timer(cfg, Milliseconds(cfg.interval()))
+    grouped = _grouped(cfg, logger)
+    workers = [
+        OpenOpcWorker(
+            limited(local), cfg.da_progid(), cfg.da_host(), grouped,
+            cfg.worker_drain(), _failed(retire, logger), restore, backoff
+        )
+        for local, retire, restore in _shards(queue, cfg.workers())
+    ]
+    return Bridge(
+        limited(queue), workers, timer, broker, cfg.batch(), screen,
+        cfg.scheduler() == "fixed", _classes(cfg),
+        _ceiling(cfg.adaptive_max()), cfg.phase(),
+        _partition(_depth(cfg)), _stage(cfg), _watchdog(cfg, workers),
+        _breaker(cfg), grouped
+    )
+
+
+def _grouped(cfg, logger):
+    """
+    Decide whether batches are read through persistent OPC groups.
+
+    Groups only pay off when every chunk sticks to one worker;
+    without shards each connection would build a group for every
+    chunk it happens to read.
+
+    Args:
+        cfg: MergedConfig
+        logger: Logger for the warning when shards are missing
+
+    Returns:
+        True if groups are enabled and tasks are sharded
+    """
+    if not cfg.groups():
+        return False
+    if cfg.shards() == "none":
+        logger.warning("OPC groups need shards, reading without groups")
+        return False
+    return True
+
+
+def _breaker(cfg):
+    """
+    Build the per-tag circuit breaker from configuration.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        TagBreaker, or NoBreaker when breaker_threshold is 0
+    """
+    if not cfg.breaker_threshold():
+        return NoBreaker()
+    return TagBreaker(
+        cfg.breaker_threshold(), Milliseconds(cfg.breaker_probe()).seconds()
+    )
+
+
+def _watchdog(cfg, workers):
+    """
+    Build the hung call watchdog from configuration.
+
+    Args:
+        cfg: MergedConfig
+        workers: List of SupervisedWorker to watch
+
+    Returns:
+        Optional Watchdog, empty when read_deadline is 0
+    """
+    if not cfg.read_deadline():
+        return Empty()
+    return Some(
+        Watchdog(workers, Milliseconds(cfg.read_deadline()).seconds())
+    )
+
+
+def _serve(cfg, bridge, tags, running, report):
+    """
+    Run a bridge until told to stop.
+
+    Args:
+        cfg: MergedConfig
+        bridge: Bridge to run
+        tags: List of TagPath to monitor
+        running: Function returning False once the bridge should stop
+        report: Function called with bridge stats every stats
+            interval
+    """
+    bridge.start(tags, Milliseconds(cfg.interval()), cfg.mqtt_topic())
+    period = cfg.stats_interval() / 1000.0
+    logged = time.time()
+    while running():
+        time.sleep(1)
+        if period and time.time() - logged >= period:
+            logged = time.time()
+            report(bridge.stats())
+    bridge.stop()
+
+
+def _broker(cfg):
+    """
+    Build the MQTT broker from configuration.
+
+    Args:
+        cfg: MergedConfig
+
+    Returns:
+        ConsoleBroker in dry-run mode, otherwise PahoBroker
+    """
+    if cfg.dry_run():
+        from opcda_to_mqtt.mqtt.console import ConsoleBroker
+        return ConsoleBroker()
+    from opcda_to_mqtt.mqtt.paho import PahoBroker
+    return PahoBroker(cfg.mqtt_host(), cfg.mqtt_port())
+
+
+def _split(tags, count):
+    """
+    Split tags between processes by a stable hash of their path.
+
+    Args:
+        tags: List of TagPath
+        count: Number of processes
+
+    Returns:
+        List of count lists of TagPath, in input order
+    """
+    shards = [[] for _ in range(count)]
+    for tag in tags:
+        text = tag.text().encode("utf-8")
+        shards[(zlib.crc32(text) & 0xffffffff) % count].append(tag)
+    return shards
+
+
+def _aggregate(reports, alive):
+    """
+    Combine the latest stats of every process.
+
+    Args:
+        reports: Dict mapping process index to its latest stats
+        alive: Number of processes still running
+
+    Returns:
+        Dict with live process count, summed overruns and read
+        rates, and the stats of each process
+    """
+    reads = {"base": 0.0, "actual": 0.0, "saved": 0.0}
+    overruns = 0
+    for stats in reports.values():
+        overruns += stats.get("overruns", 0)
+        for key in reads:
+            reads[key] += stats.get("reads", {}).get(key, 0.0)
+    return {
+        "alive": alive,
+        "overruns": overruns,
+        "reads": dict((k, round(v, 3)) for k, v in reads.items()),
+        "processes": dict((str(k), v) for k, v in reports.items())
+    }
+
+
+def _collect(reports, latest):
+    """
+    Take every waiting report off the reports queue.
+
+    Args:
+        reports: Queue of (index, stats)
+        latest: Dict mapping process index to its latest stats,
+            updated in place
+    """
+    while True:
+        try:
+            index, stats = reports.get_nowait()
+        except Queue.Empty:
+            return
+        latest[index] = stats
+
+
+def _child(cfg, texts, index, stop, reports):
+    """
+    Run the bridge of one process over its share of tags.
+
+    Stops when the parent sets stop or the process gets SIGTERM.
+    SIGINT is left to the parent.
+
+    Args:
+        cfg: MergedConfig
+        texts: List of tag path strings of this process
+        index: Process index
+        stop: multiprocessing.Event set by the parent
+        reports: multiprocessing.Queue receiving (index, stats)
+    """
+    from opcda_to_mqtt.da.openopc import OpenOpcSource
+    logger = LogConfig().setup()
+    terminated = []
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda sig, frame: terminated.append(sig))
+    tags = [TagPath(text) for text in texts]
+    source = OpenOpcSource(cfg.da_progid(), cfg.da_host())
+    bridge = _bridge(cfg, source, _broker(cfg), tags, logger)
+    logger.info("Process %d monitoring %d tags" % (index, len(tags)))
+    _serve(
+        cfg, bridge, tags, lambda: not (terminated or stop.is_set()),
+        lambda stats: reports.put((index, stats))
+    )
+
+
+def _supervise(cfg, tags, logger):
+    """
+    Run the bridge in several processes and report for them.
+
+    Each process reads its own share of tags with its own OPC
+    connections and MQTT client. The parent logs the combined
+    stats, reports processes that exit, and on SIGINT or SIGTERM
+    stops every process before returning. Reports are drained
+    while the processes stop, so none blocks on a full queue.
+
+    Args:
+        cfg: MergedConfig
+        tags: List of TagPath to monitor
+        logger: Logger for health and stats
+
+    Returns:
+        Exit status, 1 if every process died before shutdown
+    """
+    stop = multiprocessing.Event()
+    reports = multiprocessing.Queue()
+    processes = dict(
+        (index, multiprocessing.Process(
+            target=_child,
+            args=(cfg, [t.text() for t in shard], index, stop, reports)
+        ))
+        for index, shard in enumerate(_split(tags, cfg.processes()))
+        if shard
+    )
+    running = [True]
+
+    def handler(sig, frame):
+        logger.info("Shutting down")
+        running[0] = False
+
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
+    for process in processes.values():
+        process.start()
+    logger.info("Started %d processes" % len(processes))
+    latest = {}
+    lost = set()
+    period = cfg.stats_interval() / 1000.0
+    logged = time.time()
+    while running[0] and len(lost) < len(processes):
+        time.sleep(1)
+        _collect(reports, latest)
+        for index, process in processes.items():
+            if index not in lost and not process.is_alive():
+                lost.add(index)
+                logger.error("Process %d exited with code %s" % (
+                    index, process.exitcode
+                ))
+        if period and time.time() - logged >= period:
+            logged = time.time()
+            logger.info("Stats: %s" % json.dumps(
+                _aggregate(latest, len(processes) - len(lost)),
+                sort_keys=True
+            ))
+    stop.set()
+    deadline = time.time() + STOP_TIMEOUT
+    for process in processes.values():
+        while process.is_alive() and time.time() < deadline:
+            _collect(reports, latest)
+            process.join(0.1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    if len(lost) == len(processes):
+        logger.error("All processes exited")
+        return 1
+    logger.info("All processes stopped")
+    return 0
+
+
 def main():
     """
     Main entry point.
@@ -53,6 +750,10 @@ def main():
     args = ArgumentParser().parse(sys.argv[1:])
     logger = LogConfig().setup()
     logger.info("Starting OPC-DA to MQTT bridge")
+    if SOURCE == WALL:
+        logger.warning(
+            "No monotonic clock available, scheduling on wall-clock time"
+        )
     file = JsonConfig(args.config).load().fold(lambda e: {}, lambda c: c)
     cfg = MergedConfig(file, args)
     if not cfg.da_progid():
@@ -66,31 +767,21 @@ def main():
         sys.exit(1)
     try:
         from opcda_to_mqtt.da.openopc import OpenOpcSource
-        from opcda_to_mqtt.sync.openopc_worker import OpenOpcWorker
-        if cfg.dry_run():
-            from opcda_to_mqtt.mqtt.console import ConsoleBroker
-        else:
-            from opcda_to_mqtt.mqtt.paho import PahoBroker
     except ImportError as e:
         logger.error("Missing dependency: %s" % e)
         sys.exit(1)
-    source = OpenOpcSource(cfg.da_progid(), cfg.da_host())
+    source = OpenOpcSource(
+        cfg.da_progid(), cfg.da_host(), cfg.discover_connections()
+    )
     if cfg.dry_run():
-        broker = ConsoleBroker()
         logger.info("Dry-run mode: printing to stdout")
-    else:
-        broker = PahoBroker(cfg.mqtt_host(), cfg.mqtt_port())
-    queue = TaskQueue()
-    timer = TimerThread()
-    workers = [
-        OpenOpcWorker(queue, cfg.da_progid(), cfg.da_host())
-        for _ in range(cfg.workers())
-    ]
-    bridge = Bridge(queue, workers, timer, broker)
     if cfg.tags():
         tags = [TagPath(t) for t in cfg.tags()]
     else:
         result = source.discover(cfg.prefix())
+        logger.info("Discovery: %s" % json.dumps(
+            source.stats().get("discovery", {}), sort_keys=True
+        ))
         if not result.is_right():
             logger.error("Discovery failed: %s" % result.fold(
                 lambda e: e.text(), lambda _: ""
@@ -102,14 +793,21 @@ def main():
         before = len(tags)
         tags = [t for t in tags if not _matches(t.text(), excludes)]
         logger.info("Excluded %d tags by pattern" % (before - len(tags)))
+    if cfg.validate():
+        tags = _validate(cfg, source, tags, logger)
     if not tags:
         logger.error("No tags to monitor")
         sys.exit(1)
     logger.info("Monitoring %d tags:" % len(tags))
     for tag in tags:
         logger.info("  - %s" % tag.text())
-    interval = Milliseconds(cfg.interval())
-    topic = cfg.mqtt_topic()
+    if cfg.processes() > 1:
+        sys.exit(_supervise(cfg, tags, logger))
+    try:
+        broker = _broker(cfg)
+    except ImportError as e:
+        logger.error("Missing dependency: %s" % e)
+        sys.exit(1)
     running = [True]
 
     def handler(sig, frame):
@@ -118,15 +816,13 @@ def main():
 
     signal.signal(signal.SIGINT, handler)
     signal.signal(signal.SIGTERM, handler)
-    bridge.start(tags, interval, topic)
-    try:
-        while running[0]:
-            signal.pause()
-    except AttributeError:
-        import time
-        while running[0]:
-            time.sleep(1)
-    bridge.stop()
+    bridge = _bridge(cfg, source, broker, tags, logger)
+    _serve(
+        cfg, bridge, tags, lambda: running[0],
+        lambda stats: logger.info("Stats: %s" % json.dumps(
+            stats, sort_keys=True
+        ))
+    )
     logger.info("Bridge stopped")
 
 
@@ -2,11 +2,13 @@
 """
 OPC-DA source components.
 
-Contains DaSource interface and implementations.
+Contains DaSource interface, implementations and the Browser
+walking the browse tree.
 """
 from __future__ import print_function
 
 from opcda_to_mqtt.da.source import DaSource
 from opcda_to_mqtt.da.fake import FakeDaSource
+from opcda_to_mqtt.da.browse import Browser
 
-__all__ = ['DaSource', 'FakeDaSource']
+__all__ = ['DaSource', 'FakeDaSource', 'Browser']
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Browser walking the OPC-DA browse tree over several connections.
+
+Example:
+    >>> browser = Browser(connect, 4)
+    >>> paths = browser.browse("COM1")
+    >>> browser.stats()["lists"]
+    1250
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.sync.clock import monotonic
+
+
+class Browser:
+    """
+    Parallel walk of the browse tree listing each node once.
+
+    A node's children are listed once: that listing both tells
+    whether the node is a branch and, for a branch, gives the
+    children it is walked with. Branches found are shared by a
+    pool of connections, so sibling branches are browsed at the
+    same time. Leaves come back in depth-first order whatever
+    the order branches were browsed in.
+
+    Example:
+        >>> browser = Browser(lambda: client, 1, lambda client: None)
+        >>> browser.browse("")
+        ['Root1', 'Root2']
+    """
+
+    def __init__(self, connect, connections=1,
+                 release=lambda client: client.close(), clock=monotonic):
+        """
+        Create a Browser.
+
+        Args:
+            connect: Function returning a connected OPC client,
+                called once on each browsing thread
+            connections: Number of threads browsing in parallel
+            release: Function called with each client when its
+                thread is done
+            clock: Function returning monotonic time in seconds
+        """
+        self._connect = connect
+        self._connections = max(1, connections)
+        self._release = release
+        self._clock = clock
+        self._found = {}
+        self._pending = []
+        self._outstanding = 0
+        self._errors = []
+        self._broken = False
+        self._lists = 0
+        self._branches = 0
+        self._leaves = 0
+        self._seconds = 0.0
+        self._condition = threading.Condition()
+
+    def browse(self, prefix):
+        """
+        List every leaf under a prefix.
+
+        Args:
+            prefix: Tag path prefix, "" for the whole tree
+
+        Returns:
+            List of leaf tag path strings
+
+        Raises:
+            Exception: First error of a failed list call, or of
+                connecting when no connection could be made
+        """
+        started = self._clock()
+        with self._condition:
+            self._found = {}
+            self._pending = [(prefix, None)]
+            self._outstanding = 1
+            self._errors = []
+            self._broken = False
+            self._lists = 0
+            self._branches = 0
+        threads = [
+            threading.Thread(target=self._run)
+            for _ in range(self._connections)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._condition:
+            self._seconds = self._clock() - started
+            if self._outstanding:
+                raise self._errors[0]
+        leaves = self._assemble(prefix)
+        with self._condition:
+            self._leaves = len(leaves)
+        return leaves
+
+    def _run(self):
+        """
+        Browse pending branches on one connection until none are
+        left.
+
+        A failed connection leaves the work to the other threads;
+        a failed list call stops every thread.
+        """
+        try:
+            client = self._connect()
+        except Exception as e:
+            with self._condition:
+                self._errors.append(e)
+            return
+        try:
+            while True:
+                with self._condition:
+                    while (not self._pending and self._outstanding and
+                           not self._broken):
+                        self._condition.wait()
+                    if not self._pending or self._broken:
+                        return
+                    path, children = self._pending.pop()
+                try:
+                    entries = self._expand(client, path, children)
+                except Exception as e:
+                    with self._condition:
+                        self._errors.append(e)
+                        self._broken = True
+                        self._condition.notify_all()
+                    return
+                branches = [e for e in entries if e[1] is not None]
+                with self._condition:
+                    self._found[path] = entries
+                    self._pending.extend(branches)
+                    self._branches += 1
+                    self._outstanding += len(branches) - 1
+                    self._condition.notify_all()
+        finally:
+            self._release(client)
+
+    def _expand(self, client, path, children):
+        """
+        List each child of a node once.
+
+        Args:
+            client: OpenOPC client
+            path: Path of the node
+            children: Children of the node, None if not listed yet
+
+        Returns:
+            List of (child path, its children or None for a leaf)
+        """
+        if children is None:
+            children = self._list(client, path)
+            if path and children == [path]:
+                return [(path, None)]
+        entries = []
+        for child in children:
+            full = self._join(path, child)
+            grandchildren = self._list(client, full)
+            if grandchildren and grandchildren != [full]:
+                entries.append((full, grandchildren))
+            else:
+                entries.append((full, None))
+        return entries
+
+    def _list(self, client, path):
+        """
+        List the children of a node, counting the call.
+
+        Args:
+            client: OpenOPC client
+            path: Path of the node, "" for the root
+
+        Returns:
+            List of child names
+        """
+        with self._condition:
+            self._lists += 1
+        if path:
+            return client.list(path)
+        return client.list()
+
+    def _join(self, path, child):
+        """
+        Build the full path of a child.
+
+        Servers return either names relative to the node or
+        full paths.
+
+        Args:
+            path: Path of the node
+            child: Name returned by list
+
+        Returns:
+            Full tag path string
+        """
+        if path and (child == path or child.startswith(path + ".")):
+            return child
+        if path:
+            return "%s.%s" % (path, child)
+        return child
+
+    def _assemble(self, path):
+        """
+        Collect the leaves under a browsed node depth-first.
+
+        Args:
+            path: Path of the node
+
+        Returns:
+            List of leaf tag path strings
+        """
+        leaves = []
+        for full, children in self._found.get(path, []):
+            if children is None:
+                leaves.append(full)
+            else:
+                leaves.extend(self._assemble(full))
+        return leaves
+
+    def stats(self):
+        """
+        Get counters of the last browse.
+
+        Returns:
+            Dict with list calls, branches and leaves found,
+            connections and seconds taken
+        """
+        with self._condition:
+            return {
+                "lists": self._lists,
+                "branches": self._branches,
+                "leaves": self._leaves,
+                "connections": self._connections,
+                "seconds": round(self._seconds, 3)
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Browser connection count
+        """
+        return "Browser(connections=%d)" % self._connections
@@ -26,14 +26,18 @@ class FakeDaSource(DaSource):
         True
     """
 
-    def __init__(self, tags):
+    def __init__(self, tags, ranges={}, unreadable=[]):
         """
         Create a FakeDaSource with predefined tags.
 
         Args:
             tags: List of TagPath objects to return
+            ranges: Dict mapping TagPath to (low, high) EU range
+            unreadable: List of TagPath that fail validation
         """
         self._tags = list(tags)
+        self._ranges = dict(ranges)
+        self._unreadable = list(unreadable)
 
     def discover(self, prefix):
         """
@@ -47,6 +51,37 @@ class FakeDaSource(DaSource):
         """
         return Right(list(self._tags))
 
+    def ranges(self, tags):
+        """
+        Return predefined ranges of the requested tags.
+
+        Args:
+            tags: List of TagPath to look up
+
+        Returns:
+            Right containing dict of TagPath to (low, high)
+        """
+        return Right(dict(
+            (tag, self._ranges[tag]) for tag in tags if tag in self._ranges
+        ))
+
+    def validate(self, tags, batch, connections):
+        """
+        Split tags by the predefined unreadable tags.
+
+        Args:
+            tags: List of TagPath to check
+            batch: Tags per request (ignored)
+            connections: Parallel connections (ignored)
+
+        Returns:
+            Right containing (readable tags, unreadable tags)
+        """
+        return Right((
+            [tag for tag in tags if tag not in self._unreadable],
+            [tag for tag in tags if tag in self._unreadable]
+        ))
+
     def tags(self):
         """
         Get the configured tags.
@@ -8,16 +8,24 @@ Example:
 """
 from __future__ import print_function
 
+import Queue
+import threading
+
+from opcda_to_mqtt.da.browse import Browser
 from opcda_to_mqtt.da.source import DaSource
 from opcda_to_mqtt.domain.path import TagPath
 from opcda_to_mqtt.result.either import Right, Left, Problem
 
+HIGH_EU = 102
+LOW_EU = 103
+
 
 class OpenOpcSource(DaSource):
     """
     Real OPC-DA tag discovery using OpenOPC.
 
-    Connects to OPC-DA server and lists available tags.
+    Connects to OPC-DA server and lists available tags, browsing
+    sibling branches over several connections.
 
     Example:
         >>> source = OpenOpcSource("OPC.Server.1", "localhost")
@@ -26,16 +34,20 @@ class OpenOpcSource(DaSource):
         True
     """
 
-    def __init__(self, progid, host):
+    def __init__(self, progid, host, connections=1):
         """
         Create an OpenOpcSource.
 
         Args:
             progid: OPC-DA server ProgID
             host: Server hostname
+            connections: Number of connections browsing in parallel
+                during discovery
         """
         self._progid = progid
         self._host = host
+        self._connections = connections
+        self._discovery = {}
 
     def discover(self, prefix):
         """
@@ -47,25 +59,224 @@ class OpenOpcSource(DaSource):
         Returns:
             Either[Problem, list of TagPath]
         """
+        browser = Browser(self._connect, self._connections)
+        try:
+            items = browser.browse(prefix)
+            return Right([TagPath(item) for item in items if item])
+        except Exception as e:
+            return Left(Problem(
+                "Discovery failed",
+                {"progid": self._progid, "host": self._host, "error": str(e)}
+            ))
+        finally:
+            self._discovery = browser.stats()
+
+    def _connect(self):
+        """
+        Open a connection to the OPC-DA server.
+
+        Returns:
+            Connected OpenOPC client
+        """
+        import OpenOPC
+        client = OpenOPC.client()
+        client.connect(self._progid, self._host)
+        return client
+
+    def stats(self):
+        """
+        Get counters of the last discovery.
+
+        Returns:
+            Dict with list calls, branches, leaves, connections
+            and seconds of the last discovery under "discovery"
+        """
+        return {"discovery": dict(self._discovery)}
+
+    def ranges(self, tags):
+        """
+        Look up engineering units ranges of tags.
+
+        Args:
+            tags: List of TagPath to look up
+
+        Returns:
+            Either[Problem, dict of TagPath to (low, high)]
+        """
         try:
             import OpenOPC
             client = OpenOPC.client()
             client.connect(self._progid, self._host)
             try:
-                items = self._flatten(client, prefix)
-                tags = [TagPath(item) for item in items if item]
-                return Right(tags)
+                return Right(self._ranges(client, tags))
             finally:
                 client.close()
         except Exception as e:
             return Left(Problem(
-                "Discovery failed",
+                "Range lookup failed",
                 {"progid": self._progid, "host": self._host, "error": str(e)}
             ))
 
+    def _ranges(self, client, tags):
+        """
+        Read High EU and Low EU item properties.
+
+        Tags whose properties are missing, unreadable or not
+        numeric are left out.
+
+        Args:
+            client: OpenOPC client
+            tags: List of TagPath to look up
+
+        Returns:
+            Dict of TagPath to (low, high)
+        """
+        result = {}
+        for tag in tags:
+            try:
+                high = client.properties(tag.text(), id=HIGH_EU)
+                low = client.properties(tag.text(), id=LOW_EU)
+                result[tag] = (float(low), float(high))
+            except Exception:
+                continue
+        return result
+
+    def validate(self, tags, batch, connections):
+        """
+        Find the tags that can be read.
+
+        Tags are read in batches, spread over several connections
+        that read in parallel. A tag is unreadable when the server
+        answers it with Error quality; tags that read Bad are kept,
+        since their device may come back. A batch whose read
+        raises is read again tag by tag, and a lone tag whose read
+        raises is only unreadable if the server still answers;
+        a lost connection fails the whole validation, so no tag
+        is dropped for it.
+
+        Args:
+            tags: List of TagPath to check
+            batch: Number of tags read in one request
+            connections: Number of connections reading in parallel
+
+        Returns:
+            Either[Problem, (readable TagPath list, unreadable
+            TagPath list)]
+        """
+        pending = Queue.Queue()
+        batches = [
+            tags[index:index + batch]
+            for index in range(0, len(tags), max(1, batch))
+        ]
+        for index, items in enumerate(batches):
+            pending.put((index, items))
+        verdicts = {}
+        errors = []
+        threads = [
+            threading.Thread(
+                target=self._validate, args=(pending, verdicts, errors)
+            )
+            for _ in range(max(1, min(connections, len(batches))))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if len(verdicts) < len(batches):
+            return Left(Problem(
+                "Validation failed",
+                {
+                    "progid": self._progid, "host": self._host,
+                    "error": str(errors[0]) if errors else "unknown"
+                }
+            ))
+        readable = []
+        unreadable = []
+        for index in range(len(batches)):
+            readable.extend(verdicts[index][0])
+            unreadable.extend(verdicts[index][1])
+        return Right((readable, unreadable))
+
+    def _validate(self, pending, verdicts, errors):
+        """
+        Check batches on one connection until none are left.
+
+        Args:
+            pending: Queue.Queue of (index, list of TagPath)
+            verdicts: Dict receiving index to (readable, unreadable)
+            errors: List receiving connection errors
+        """
+        try:
+            client = self._connect()
+        except Exception as e:
+            errors.append(e)
+            return
+        try:
+            while True:
+                try:
+                    index, items = pending.get_nowait()
+                except Queue.Empty:
+                    return
+                verdicts[index] = self._check(client, items)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            client.close()
+
+    def _check(self, client, tags):
+        """
+        Read a batch of tags and sort them by readability.
+
+        Args:
+            client: OpenOPC client
+            tags: List of TagPath to read together
+
+        Returns:
+            Tuple of (readable TagPath list, unreadable TagPath list)
+
+        Raises:
+            Exception: Error of the read when the connection is lost
+        """
+        try:
+            rows = client.read([tag.text() for tag in tags])
+        except Exception:
+            if not self._alive(client):
+                raise
+            if len(tags) == 1:
+                return [], list(tags)
+            readable = []
+            unreadable = []
+            for tag in tags:
+                good, bad = self._check(client, [tag])
+                readable.extend(good)
+                unreadable.extend(bad)
+            return readable, unreadable
+        answered = set(
+            row[0] for row in rows if str(row[2]).lower() != "error"
+        )
+        return (
+            [tag for tag in tags if tag.text() in answered],
+            [tag for tag in tags if tag.text() not in answered]
+        )
+
+    def _alive(self, client):
+        """
+        Check that the server still answers on a connection.
+
+        Args:
+            client: OpenOPC client
+
+        Returns:
+            True if the server answered a ping
+        """
+        try:
+            return bool(client.ping())
+        except Exception:
+            return False
+
     def _flatten(self, client, prefix):
         """
-        Recursively flatten tag hierarchy.
+        Flatten the tag hierarchy on one connection.
 
         Args:
             client: OpenOPC client
@@ -74,26 +285,7 @@ class OpenOpcSource(DaSource):
         Returns:
             List of tag path strings
         """
-        result = []
-        if prefix:
-            children = client.list(prefix)
-        else:
-            children = client.list()
-        if children == [prefix]:
-            return [prefix]
-        for child in children:
-            if prefix and (child == prefix or child.startswith(prefix + ".")):
-                full = child
-            elif prefix:
-                full = "%s.%s" % (prefix, child)
-            else:
-                full = child
-            subchildren = client.list(full)
-            if subchildren and subchildren != [full]:
-                result.extend(self._flatten(client, full))
-            else:
-                result.append(full)
-        return result
+        return Browser(lambda: client, 1, lambda c: None).browse(prefix)
 
     def __repr__(self):
         """
@@ -23,6 +23,10 @@ class DaSource:
         >>> class MySource(DaSource):
         ...     def discover(self, prefix):
         ...         return Right([TagPath("Tag1")])
+        ...     def ranges(self, tags):
+        ...         return Right({})
+        ...     def validate(self, tags, batch, connections):
+        ...         return Right((tags, []))
     """
     __metaclass__ = ABCMeta
 
@@ -38,3 +42,42 @@ class DaSource:
             Either[Problem, list of TagPath]
         """
         raise NotImplementedError()
+
+    @abstractmethod
+    def ranges(self, tags):
+        """
+        Look up engineering units ranges of tags.
+
+        Args:
+            tags: List of TagPath to look up
+
+        Returns:
+            Either[Problem, dict of TagPath to (low, high)],
+            tags without a numeric range are left out
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def validate(self, tags, batch, connections):
+        """
+        Find the tags that can be read.
+
+        Args:
+            tags: List of TagPath to check
+            batch: Number of tags checked in one request
+            connections: Number of connections checking in parallel
+
+        Returns:
+            Either[Problem, (readable TagPath list, unreadable
+            TagPath list)], both in the given order
+        """
+        raise NotImplementedError()
+
+    def stats(self):
+        """
+        Get source counters.
+
+        Returns:
+            Dict of counters, empty unless the source keeps any
+        """
+        return {}
@@ -23,6 +23,8 @@ class TagPath:
         'COM1.Device.Sensor'
         >>> tag.topic("factory")
         'factory/COM1.Device.Sensor'
+        >>> tag.device(1)
+        'COM1'
     """
 
     def __init__(self, path):
@@ -48,6 +50,19 @@ class TagPath:
         """
         return self._path
 
+    def device(self, depth):
+        """
+        Get the device part of the path.
+
+        Args:
+            depth: Number of leading path segments naming the device
+
+        Returns:
+            Leading segments joined by dots, the whole path if it
+            is shorter
+        """
+        return ".".join(self._path.split(".")[:depth])
+
     def topic(self, prefix):
         """
         Convert to MQTT topic with prefix.
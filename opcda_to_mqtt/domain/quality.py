@@ -53,6 +53,16 @@ class OpcQuality:
         """
         return self._code.lower().startswith("good")
 
+    def is_bad(self):
+        """
+        Check if quality indicates a bad or failed read.
+
+        Returns:
+            True if quality starts with "Bad" or is "Error"
+        """
+        code = self._code.lower()
+        return code.startswith("bad") or code == "error"
+
     def __eq__(self, other):
         """
         Check equality with another OpcQuality.
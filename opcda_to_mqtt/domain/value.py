@@ -9,6 +9,8 @@ Example:
 """
 from __future__ import print_function
 
+import numbers
+
 
 class TagValue:
     """
@@ -51,6 +53,18 @@ class TagValue:
         """
         return self._content
 
+    def numeric(self):
+        """
+        Check if the value is a number.
+
+        Returns:
+            True for integers and floats, False for booleans and others
+        """
+        return (
+            isinstance(self._content, numbers.Real) and
+            not isinstance(self._content, bool)
+        )
+
     def __eq__(self, other):
         """
         Check equality with another TagValue.
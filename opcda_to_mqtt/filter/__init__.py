@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Publish filters for OPC-DA to MQTT bridge.
+
+Contains Filter interface and implementations that decide
+which read results are published.
+"""
+from __future__ import print_function
+
+from opcda_to_mqtt.filter.filter import Filter, PassFilter, ChainFilter
+from opcda_to_mqtt.filter.exception import ExceptionFilter
+from opcda_to_mqtt.filter.deadband import Deadband, DeadbandFilter
+from opcda_to_mqtt.filter.compression import CompressionFilter
+
+__all__ = [
+    'Filter', 'PassFilter', 'ChainFilter', 'ExceptionFilter',
+    'Deadband', 'DeadbandFilter', 'CompressionFilter'
+]
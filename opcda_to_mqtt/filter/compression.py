@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+CompressionFilter implementing swinging-door trend compression.
+
+Example:
+    >>> screen = CompressionFilter({"Flow": 0.5}, Empty())
+    >>> screen.apply(TagPath("Flow"), (1.0, "Good", "t0"))
+    [(1.0, 'Good', 't0')]
+    >>> screen.apply(TagPath("Flow"), (2.0, "Good", "t1"))
+    []
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.filter.filter import Filter
+from opcda_to_mqtt.domain.value import TagValue
+from opcda_to_mqtt.result.optional import Empty
+from opcda_to_mqtt.sync.clock import monotonic
+
+
+class CompressionFilter(Filter):
+    """
+    Filter forwarding only the points needed to rebuild a trend.
+
+    Swinging-door compression: from the last archived point two
+    slopes, deviation above and below, narrow with every new
+    point. While the current point fits between them it is held
+    back. Once the slopes cross, the held point is published and
+    becomes the new archived point. A straight line is therefore
+    reduced to its end points, within the configured deviation.
+
+    Slopes are taken over the times points were read, so a
+    delayed publish stage does not bend them. Quality changes
+    and non-numeric values publish the held point and the new
+    one. With a heartbeat, a point is also
+    published once the archived one is that old.
+
+    Example:
+        >>> screen = CompressionFilter({"A": 0.1}, Empty())
+        >>> for v in [0.0, 1.0, 2.0, 3.0, 1.0]:
+        ...     screen.apply(TagPath("A"), (v, "Good", str(v)))
+        [(0.0, 'Good', '0.0')]
+        []
+        []
+        []
+        [(3.0, 'Good', '3.0')]
+    """
+
+    def __init__(self, deviations, heartbeat, clock=monotonic):
+        """
+        Create a CompressionFilter.
+
+        Args:
+            deviations: Dict mapping tag path strings to deviations
+            heartbeat: Optional Milliseconds of maximum silence
+            clock: Function returning monotonic time in seconds,
+                used for results without a read time
+        """
+        self._deviations = dict(deviations)
+        self._heartbeat = heartbeat
+        self._clock = clock
+        self._doors = {}
+        self._lock = threading.Lock()
+        self._received = 0
+        self._published = 0
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Publish the points that leave the swinging door.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read,
+                the filter's clock when absent
+
+        Returns:
+            List of zero, one or two results
+        """
+        key = tag.text()
+        deviation = self._deviations.get(key)
+        if deviation is None:
+            return [result]
+        now = read.fold(self._clock, lambda at: at)
+        with self._lock:
+            passed = self._step(key, deviation, now, result)
+            self._received += 1
+            self._published += len(passed)
+        return passed
+
+    def _step(self, key, deviation, now, result):
+        """
+        Advance the door of one tag.
+
+        Args:
+            key: Tag path string
+            deviation: Allowed deviation of the tag
+            now: Time the result was read in seconds
+            result: Tuple of (value, quality, timestamp)
+
+        Returns:
+            List of results to publish
+        """
+        door = self._doors.get(key)
+        value, quality = result[0], result[1]
+        if door is None or door.breaks(value, quality, now, self._heartbeat):
+            passed = [] if door is None else door.flush()
+            if TagValue(value).numeric():
+                self._doors[key] = _Door(now, value, quality)
+            else:
+                self._doors.pop(key, None)
+            return passed + [result]
+        return door.swing(now, result, deviation)
+
+    def stats(self):
+        """
+        Get compression counters.
+
+        Returns:
+            Dict with received and published counts and their ratio
+        """
+        with self._lock:
+            ratio = 0.0
+            if self._published:
+                ratio = float(self._received) / self._published
+            return {
+                "received": self._received,
+                "published": self._published,
+                "ratio": round(ratio, 2)
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing CompressionFilter tag count
+        """
+        return "CompressionFilter(tags=%d)" % len(self._deviations)
+
+
+class _Door:
+    """
+    Swinging-door state of one tag.
+
+    Holds the archived point, the narrowest upper and lower
+    slopes seen since, and the last point not yet published.
+    """
+
+    def __init__(self, now, value, quality):
+        """
+        Create a door archived at a point.
+
+        Args:
+            now: Time of archived point in seconds
+            value: Archived numeric value
+            quality: Archived quality
+        """
+        self.time = now
+        self.value = value
+        self.quality = quality
+        self.upper = float("inf")
+        self.lower = float("-inf")
+        self.held = None
+
+    def breaks(self, value, quality, now, heartbeat):
+        """
+        Check if a point cannot be compressed against this door.
+
+        Args:
+            value: New value
+            quality: New quality
+            now: Current time in seconds
+            heartbeat: Optional Milliseconds of maximum silence
+
+        Returns:
+            True on quality change, non-numeric value or heartbeat
+        """
+        if quality != self.quality or not TagValue(value).numeric():
+            return True
+        return heartbeat.fold(
+            lambda: False,
+            lambda beat: now - self.time >= beat.seconds()
+        )
+
+    def flush(self):
+        """
+        Get the held point, if any.
+
+        Returns:
+            List with the held result, or empty list
+        """
+        if self.held is None:
+            return []
+        return [self.held[1]]
+
+    def swing(self, now, result, deviation):
+        """
+        Narrow the door with a point.
+
+        Args:
+            now: Current time in seconds
+            result: Tuple of (value, quality, timestamp)
+            deviation: Allowed deviation
+
+        Returns:
+            List with the held result if the door closed,
+            or empty list
+        """
+        value = result[0]
+        elapsed = now - self.time
+        if elapsed <= 0:
+            self.held = (now, result)
+            return []
+        upper = (value + deviation - self.value) / elapsed
+        lower = (value - deviation - self.value) / elapsed
+        self.upper = min(self.upper, upper)
+        self.lower = max(self.lower, lower)
+        if self.lower <= self.upper:
+            self.held = (now, result)
+            return []
+        archived, passed = self.held
+        self.time = archived
+        self.value = passed[0]
+        self.upper = float("inf")
+        self.lower = float("-inf")
+        self.held = None
+        self.swing(now, result, deviation)
+        return [passed]
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Deadband rules and DeadbandFilter for noisy analog tags.
+
+Example:
+    >>> Deadband("*.Temperature", 0.5, 0).width(Empty())
+    Some(0.5)
+    >>> screen = DeadbandFilter({"COM1.Temperature": 0.5}, Empty())
+    >>> screen.apply(TagPath("COM1.Temperature"), (20.0, "Good", "ts"))
+    [(20.0, 'Good', 'ts')]
+    >>> screen.apply(TagPath("COM1.Temperature"), (20.3, "Good", "ts"))
+    []
+"""
+from __future__ import print_function
+
+import fnmatch
+
+from opcda_to_mqtt.domain.value import TagValue
+from opcda_to_mqtt.filter.exception import ExceptionFilter
+from opcda_to_mqtt.result.optional import Some, Empty
+from opcda_to_mqtt.sync.clock import monotonic
+
+
+class Deadband:
+    """
+    Deadband rule for tags matching a glob pattern.
+
+    The band is an absolute value, a percent of the item's
+    engineering units span, or the wider of both.
+
+    Example:
+        >>> rule = Deadband("*.Pressure", 0, 1.0)
+        >>> rule.width(Some((0.0, 200.0)))
+        Some(2.0)
+        >>> rule.width(Empty())
+        Empty()
+    """
+
+    def __init__(self, pattern, absolute, percent):
+        """
+        Create a Deadband.
+
+        Args:
+            pattern: Glob pattern for tag paths
+            absolute: Absolute band, 0 if unused
+            percent: Percent of EU span, 0 if unused
+        """
+        self._pattern = pattern
+        self._absolute = absolute
+        self._percent = percent
+
+    def matches(self, tag):
+        """
+        Check if the rule applies to a tag.
+
+        Args:
+            tag: TagPath to check
+
+        Returns:
+            True if tag path matches the pattern
+        """
+        return fnmatch.fnmatch(tag.text(), self._pattern)
+
+    def needs_span(self):
+        """
+        Check if the rule depends on the EU span.
+
+        Returns:
+            True if a percent band is set
+        """
+        return self._percent > 0
+
+    def width(self, span):
+        """
+        Compute the band width for a tag.
+
+        Args:
+            span: Optional (low, high) engineering units range
+
+        Returns:
+            Optional band width, Empty if the band cannot be computed
+        """
+        widths = []
+        if self._absolute > 0:
+            widths.append(float(self._absolute))
+        if self._percent > 0 and span.is_present():
+            low, high = span.otherwise(None)
+            widths.append(abs(high - low) * self._percent / 100.0)
+        if not widths:
+            return Empty()
+        return Some(max(widths))
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Deadband configuration
+        """
+        return "Deadband(%r, %r, %r)" % (
+            self._pattern, self._absolute, self._percent
+        )
+
+
+class DeadbandFilter(ExceptionFilter):
+    """
+    Filter suppressing analog changes that stay inside a band.
+
+    Tags with a band are published only when quality changes
+    or the value moves more than the band away from the last
+    published value. Tags without a band pass unchanged.
+
+    Example:
+        >>> screen = DeadbandFilter({"A": 1.0}, Empty())
+        >>> screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        [(10.0, 'Good', 'ts')]
+        >>> screen.apply(TagPath("A"), (10.9, "Good", "ts"))
+        []
+        >>> screen.apply(TagPath("A"), (11.5, "Good", "ts"))
+        [(11.5, 'Good', 'ts')]
+    """
+
+    def __init__(self, bands, heartbeat, clock=monotonic):
+        """
+        Create a DeadbandFilter.
+
+        Args:
+            bands: Dict mapping tag path strings to band widths
+            heartbeat: Optional Milliseconds of maximum silence
+            clock: Function returning monotonic time in seconds
+        """
+        ExceptionFilter.__init__(self, heartbeat, clock)
+        self._bands = dict(bands)
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Publish the result unless it stays inside the band.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read
+
+        Returns:
+            List containing the result, or empty list
+        """
+        if tag.text() not in self._bands:
+            return [result]
+        return ExceptionFilter.apply(self, tag, result, read)
+
+    def _same(self, key, last, value, quality):
+        """
+        Check if a result stays inside the band.
+
+        Args:
+            key: Tag path string
+            last: Cached (value, quality, sent) tuple
+            value: New value
+            quality: New quality
+
+        Returns:
+            True if quality is unchanged and value is within band
+        """
+        if last[1] != quality:
+            return False
+        numeric = TagValue(value).numeric() and TagValue(last[0]).numeric()
+        if not numeric:
+            return last[0] == value
+        return abs(value - last[0]) <= self._bands[key]
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing DeadbandFilter tag count
+        """
+        return "DeadbandFilter(tags=%d)" % len(self._bands)
+
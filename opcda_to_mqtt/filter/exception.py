@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+ExceptionFilter for report-by-exception publishing.
+
+Example:
+    >>> screen = ExceptionFilter(Some(Milliseconds(60000)))
+    >>> screen.apply(TagPath("Tag1"), (42, "Good", "ts"))
+    [(42, 'Good', 'ts')]
+    >>> screen.apply(TagPath("Tag1"), (42, "Good", "ts"))
+    []
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.filter.filter import Filter
+from opcda_to_mqtt.result.optional import Empty
+from opcda_to_mqtt.sync.clock import monotonic
+
+
+class ExceptionFilter(Filter):
+    """
+    Filter publishing a tag only when value or quality changed.
+
+    Keeps a last-value cache with one (value, quality, sent)
+    tuple per tag path string. With a heartbeat, an unchanged
+    tag is published again once it was silent for that long.
+
+    Example:
+        >>> screen = ExceptionFilter(Empty())
+        >>> screen.apply(TagPath("A"), (1, "Good", "ts"))
+        [(1, 'Good', 'ts')]
+        >>> screen.apply(TagPath("A"), (1, "Good", "ts2"))
+        []
+        >>> screen.apply(TagPath("A"), (2, "Good", "ts3"))
+        [(2, 'Good', 'ts3')]
+    """
+
+    def __init__(self, heartbeat, clock=monotonic):
+        """
+        Create an ExceptionFilter.
+
+        Args:
+            heartbeat: Optional Milliseconds of maximum silence
+            clock: Function returning monotonic time in seconds
+        """
+        self._heartbeat = heartbeat
+        self._clock = clock
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._published = 0
+        self._suppressed = 0
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Publish the result if it differs from the cached one.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read,
+                the filter's clock when absent
+
+        Returns:
+            List containing the result, or empty list
+        """
+        value, quality = result[0], result[1]
+        now = read.fold(self._clock, lambda at: at)
+        key = tag.text()
+        with self._lock:
+            last = self._cache.get(key)
+            if last is not None and self._same(key, last, value, quality):
+                if not self._silent(last[2], now):
+                    self._suppressed += 1
+                    return []
+            self._cache[key] = (value, quality, now)
+            self._published += 1
+        return [result]
+
+    def _same(self, key, last, value, quality):
+        """
+        Check if a result equals the cached one.
+
+        Args:
+            key: Tag path string
+            last: Cached (value, quality, sent) tuple
+            value: New value
+            quality: New quality
+
+        Returns:
+            True if value and quality are unchanged
+        """
+        return last[0] == value and last[1] == quality
+
+    def _silent(self, sent, now):
+        """
+        Check if a tag exceeded the heartbeat silence.
+
+        Args:
+            sent: Time of last publish in seconds
+            now: Current time in seconds
+
+        Returns:
+            True if heartbeat is set and elapsed
+        """
+        return self._heartbeat.fold(
+            lambda: False,
+            lambda beat: now - sent >= beat.seconds()
+        )
+
+    def stats(self):
+        """
+        Get publish counters.
+
+        Returns:
+            Dict with published, suppressed and cached counts
+        """
+        with self._lock:
+            return {
+                "published": self._published,
+                "suppressed": self._suppressed,
+                "cached": len(self._cache)
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ExceptionFilter heartbeat
+        """
+        return "ExceptionFilter(%r)" % self._heartbeat
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Filter interface with PassFilter and ChainFilter implementations.
+
+Example:
+    >>> chain = ChainFilter([ExceptionFilter(Empty())])
+    >>> chain.apply(TagPath("Tag1"), (42, "Good", "ts"))
+    [(42, 'Good', 'ts')]
+    >>> chain.apply(TagPath("Tag1"), (42, "Good", "ts"))
+    []
+"""
+from __future__ import print_function
+
+from abc import ABCMeta, abstractmethod
+
+from opcda_to_mqtt.result.optional import Empty
+
+
+class Filter:
+    """
+    Interface for publish filters.
+
+    A filter receives every read result of a tag and returns
+    the results that should be published, usually none or the
+    result itself. Results may be filtered well after they were
+    read, so time-based filters use the read time when given.
+
+    Example:
+        >>> class Positive(Filter):
+        ...     def apply(self, tag, result, read=Empty()):
+        ...         return [result] if result[0] > 0 else []
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def apply(self, tag, result, read=Empty()):
+        """
+        Decide which results to publish.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read,
+                the filter's clock when absent
+
+        Returns:
+            List of (value, quality, timestamp) tuples to publish
+        """
+        raise NotImplementedError()
+
+    def stats(self):
+        """
+        Get filter counters.
+
+        Returns:
+            Dict of counters, empty for filters without any
+        """
+        return {}
+
+
+class PassFilter(Filter):
+    """
+    Filter that publishes every result.
+
+    Example:
+        >>> PassFilter().apply(TagPath("Tag1"), (1, "Good", "ts"))
+        [(1, 'Good', 'ts')]
+    """
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Publish the result unchanged.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read
+
+        Returns:
+            List containing the result
+        """
+        return [result]
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing PassFilter
+        """
+        return "PassFilter()"
+
+
+class ChainFilter(Filter):
+    """
+    Filter applying several filters in order.
+
+    Each filter receives the results passed by the previous one.
+
+    Example:
+        >>> chain = ChainFilter([PassFilter(), ExceptionFilter(Empty())])
+        >>> chain.apply(TagPath("Tag1"), (1, "Good", "ts"))
+        [(1, 'Good', 'ts')]
+    """
+
+    def __init__(self, filters):
+        """
+        Create a ChainFilter.
+
+        Args:
+            filters: List of Filter applied in order
+        """
+        self._filters = list(filters)
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Pass the result through every filter.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read
+
+        Returns:
+            List of results passed by the last filter
+        """
+        results = [result]
+        for item in self._filters:
+            passed = []
+            for each in results:
+                passed.extend(item.apply(tag, each, read))
+            results = passed
+        return results
+
+    def stats(self):
+        """
+        Get counters of every filter in the chain.
+
+        Returns:
+            Dict mapping filter class names to their counters
+        """
+        counters = {}
+        for item in self._filters:
+            current = item.stats()
+            if current:
+                counters[item.__class__.__name__] = current
+        return counters
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ChainFilter and its filters
+        """
+        return "ChainFilter(%r)" % self._filters
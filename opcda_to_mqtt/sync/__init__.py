@@ -2,17 +2,35 @@
 """
 Synchronization components for OPC-DA to MQTT bridge.
 
-Contains Task, TaskQueue, TimerThread, Worker, and Bridge.
+Contains Task, TaskQueue, ShardedQueue, TimerThread, WheelTimer, Worker,
+Bridge, and the data-change SubscriptionBridge.
 """
 from __future__ import print_function
 
-from opcda_to_mqtt.sync.task import Task, ReadTask
+from opcda_to_mqtt.sync.task import Task, ReadTask, BatchReadTask
 from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.device import DeviceQueue, DeviceTask
+from opcda_to_mqtt.sync.shard import ShardedQueue, Shard
 from opcda_to_mqtt.sync.timer import TimerThread
+from opcda_to_mqtt.sync.wheel import WheelTimer
 from opcda_to_mqtt.sync.worker import Worker, FakeWorker
+from opcda_to_mqtt.sync.supervised import SupervisedWorker
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.sync.watchdog import Watchdog
+from opcda_to_mqtt.sync.breaker import NoBreaker, TagBreaker
+from opcda_to_mqtt.sync.group import GroupedClient
+from opcda_to_mqtt.sync.scan import ScanClass, Chunk
+from opcda_to_mqtt.sync.publish import InlineStage, PublishStage
+from opcda_to_mqtt.sync.limit import ConcurrencyLimit, LimitedQueue
 from opcda_to_mqtt.sync.bridge import Bridge
+from opcda_to_mqtt.sync.subscriber import Subscriber, ClientSubscriber
+from opcda_to_mqtt.sync.subscription import SubscriptionBridge
 
 __all__ = [
-    'Task', 'ReadTask', 'TaskQueue', 'TimerThread',
-    'Worker', 'FakeWorker', 'Bridge'
+    'Task', 'ReadTask', 'BatchReadTask', 'TaskQueue', 'DeviceQueue',
+    'DeviceTask', 'ShardedQueue', 'Shard', 'TimerThread', 'WheelTimer',
+    'Worker', 'FakeWorker', 'SupervisedWorker', 'Backoff', 'Watchdog',
+    'NoBreaker', 'TagBreaker', 'GroupedClient', 'ScanClass', 'Chunk',
+    'InlineStage', 'PublishStage', 'ConcurrencyLimit', 'LimitedQueue',
+    'Bridge', 'Subscriber', 'ClientSubscriber', 'SubscriptionBridge'
 ]
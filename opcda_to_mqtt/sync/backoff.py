@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Backoff computing jittered exponential retry delays.
+
+Example:
+    >>> backoff = Backoff(1.0, 60.0)
+    >>> backoff.delay(3)  # Between 4 and 8 seconds
+    6.2
+"""
+from __future__ import print_function
+
+import random
+
+
+class Backoff:
+    """
+    Exponential retry delays with random jitter.
+
+    The delay of attempt n is base * 2**n, capped at the ceiling,
+    then scaled by a random factor in [0.5, 1) so workers that
+    failed together do not retry together.
+
+    Example:
+        >>> Backoff(1.0, 60.0, lambda: 0.0).delay(10)
+        30.0
+    """
+
+    def __init__(self, base, ceiling, jitter=random.random):
+        """
+        Create a Backoff.
+
+        Args:
+            base: Seconds before the first retry, before jitter
+            ceiling: Longest delay in seconds, before jitter
+            jitter: Function returning a random float in [0, 1)
+        """
+        self._base = base
+        self._ceiling = ceiling
+        self._jitter = jitter
+
+    def delay(self, attempt):
+        """
+        Get the delay before a retry.
+
+        Args:
+            attempt: Number of failed attempts before this one
+
+        Returns:
+            Seconds to wait
+        """
+        exponent = min(attempt, 32)
+        full = min(self._ceiling, self._base * 2 ** exponent)
+        return full * (0.5 + self._jitter() / 2.0)
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Backoff base and ceiling
+        """
+        return "Backoff(%r, %r)" % (self._base, self._ceiling)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Per-tag circuit breakers holding back tags that keep failing.
+
+Example:
+    >>> breaker = TagBreaker(5, 60.0)
+    >>> batch, alone = breaker.admit(chunk.tags())
+    >>> breaker.observe(batch, results)
+    >>> breaker.stats()["tripped"]
+    ['COM1.Unplugged']
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.task import FAILED
+from opcda_to_mqtt.domain.quality import OpcQuality
+
+
+class NoBreaker:
+    """
+    Breaker that never trips.
+
+    Example:
+        >>> NoBreaker().admit(tags) == (tags, [])
+        True
+    """
+
+    def admit(self, tags):
+        """
+        Let every tag be read in its batch.
+
+        Args:
+            tags: List of TagPath due for a read
+
+        Returns:
+            Tuple of (the same list, empty list)
+        """
+        return tags, []
+
+    def batched(self, tags):
+        """
+        Get the tags read in batches.
+
+        Args:
+            tags: List of TagPath
+
+        Returns:
+            The same list
+        """
+        return tags
+
+    def observe(self, tags, results):
+        """
+        Ignore read results.
+
+        Args:
+            tags: List of TagPath that were read
+            results: List of (value, quality, timestamp) in tag order
+        """
+
+    def stats(self):
+        """
+        Get breaker counters.
+
+        Returns:
+            Empty dict
+        """
+        return {}
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String naming NoBreaker
+        """
+        return "NoBreaker()"
+
+
+class TagBreaker:
+    """
+    Circuit breaker per tag against persistently bad reads.
+
+    A tag whose last threshold reads all had Bad or Error quality
+    trips: it is left out of its chunk's batch and read alone once
+    per probe period. The first probe that is not bad closes the
+    breaker and the tag rejoins its batch.
+
+    A batch read that raises cannot be blamed on one tag, so it is
+    not counted. Its tags are isolated instead: they are read
+    alone at their normal rate, where a failure counts against
+    the tag that caused it, until a good read puts them back in
+    their batch.
+
+    Example:
+        >>> breaker = TagBreaker(3, 30.0)
+        >>> for _ in range(3):
+        ...     breaker.observe([tag], [(None, "Error", None)])
+        >>> breaker.admit([tag])
+        ([], [])
+    """
+
+    def __init__(self, threshold, probe, clock=monotonic):
+        """
+        Create a TagBreaker.
+
+        Args:
+            threshold: Consecutive bad reads that trip a tag
+            probe: Seconds between reads of a tripped tag
+            clock: Function returning monotonic time in seconds
+        """
+        self._threshold = threshold
+        self._probe = probe
+        self._clock = clock
+        self._failures = {}
+        self._isolated = set()
+        self._tripped = {}
+        self._trips = 0
+        self._recoveries = 0
+        self._lock = threading.Lock()
+
+    def admit(self, tags):
+        """
+        Pick the tags to read now and how.
+
+        Tripped tags whose probe is due are let through once and
+        wait a full probe period for the next one.
+
+        Args:
+            tags: List of TagPath due for a read
+
+        Returns:
+            Tuple of (list of TagPath to read together, list of
+            TagPath to read one by one), in the given order
+        """
+        now = self._clock()
+        batch = []
+        alone = []
+        with self._lock:
+            for tag in tags:
+                text = tag.text()
+                probe = self._tripped.get(text)
+                if probe is None:
+                    if text in self._isolated:
+                        alone.append(tag)
+                    else:
+                        batch.append(tag)
+                elif probe <= now:
+                    self._tripped[text] = now + self._probe
+                    alone.append(tag)
+        return batch, alone
+
+    def batched(self, tags):
+        """
+        Get the tags that are neither isolated nor tripped.
+
+        Unlike admit(), this does not let probes through.
+
+        Args:
+            tags: List of TagPath
+
+        Returns:
+            List of TagPath read in batches, in the given order
+        """
+        with self._lock:
+            return [
+                tag for tag in tags
+                if tag.text() not in self._tripped and
+                tag.text() not in self._isolated
+            ]
+
+    def observe(self, tags, results):
+        """
+        Count bad reads, tripping and closing breakers.
+
+        Results of a failed batch read isolate their tags without
+        counting against them.
+
+        Args:
+            tags: List of TagPath that were read
+            results: List of (value, quality, timestamp) in tag order
+        """
+        now = self._clock()
+        batch = len(tags) > 1
+        with self._lock:
+            for tag, result in zip(tags, results):
+                text = tag.text()
+                if batch and result is FAILED:
+                    self._isolated.add(text)
+                    continue
+                if not OpcQuality(result[1]).is_bad():
+                    self._failures.pop(text, None)
+                    self._isolated.discard(text)
+                    if self._tripped.pop(text, None) is not None:
+                        self._recoveries += 1
+                    continue
+                failures = self._failures.get(text, 0) + 1
+                self._failures[text] = failures
+                if failures >= self._threshold and text not in self._tripped:
+                    self._tripped[text] = now + self._probe
+                    self._isolated.discard(text)
+                    self._trips += 1
+
+    def stats(self):
+        """
+        Get breaker counters.
+
+        Returns:
+            Dict with sorted tripped and isolated tag paths, and
+            trip and recovery counts
+        """
+        with self._lock:
+            return {
+                "tripped": sorted(self._tripped),
+                "isolated": sorted(self._isolated),
+                "trips": self._trips,
+                "recoveries": self._recoveries
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing TagBreaker threshold and tripped count
+        """
+        with self._lock:
+            return "TagBreaker(threshold=%d, tripped=%d)" % (
+                self._threshold, len(self._tripped)
+            )
@@ -9,10 +9,18 @@ Example:
 from __future__ import print_function
 
 import json
+import threading
+import zlib
 
-from opcda_to_mqtt.sync.task import ReadTask
+from opcda_to_mqtt.sync.breaker import NoBreaker
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.publish import InlineStage
+from opcda_to_mqtt.sync.scan import Chunk
+from opcda_to_mqtt.sync.task import BatchReadTask
 from opcda_to_mqtt.domain.value import TagValue
 from opcda_to_mqtt.domain.quality import OpcQuality
+from opcda_to_mqtt.filter.filter import PassFilter
+from opcda_to_mqtt.result.optional import Some, Empty
 
 
 class Bridge:
@@ -28,7 +36,11 @@ class Bridge:
         >>> bridge.stop()
     """
 
-    def __init__(self, queue, workers, timer, broker):
+    def __init__(self, queue, workers, timer, broker, batch=1,
+                 filter=PassFilter(), fixed=False, classes=[],
+                 ceiling=Empty(), phase="none", partition=lambda tag: "",
+                 stage=InlineStage(), watchdog=Empty(),
+                 breaker=NoBreaker(), grouped=False, clock=monotonic):
         """
         Create a Bridge.
 
@@ -37,74 +49,426 @@ class Bridge:
             workers: List of Worker instances
             timer: TimerThread for delayed scheduling
             broker: MqttBroker for publishing
+            batch: Number of tags read in one OPC request
+            filter: Filter deciding which results are published
+            fixed: Keep chunks on an absolute period instead of
+                waiting interval after each read completes
+            classes: List of ScanClass, the first matching class
+                sets the interval of a tag
+            ceiling: Optional Milliseconds of longest adaptive
+                period of tags without a scan class
+            phase: First read offset of chunks within their
+                interval, "none", "hash" of the first tag path, or
+                "even" spacing within each scan class
+            partition: Function mapping a TagPath to a key; tags
+                with different keys never share a chunk
+            stage: Publish stage running the publishing of read
+                results
+            watchdog: Optional Watchdog abandoning hung worker
+                calls
+            breaker: Breaker holding back tags that keep reading
+                bad
+            grouped: Workers read batches through persistent OPC
+                groups, so each batch requests every batched tag
+                of its chunk and keeps the results of the due ones
+            clock: Function returning monotonic time in seconds
         """
         self._queue = queue
         self._workers = workers
         self._timer = timer
         self._broker = broker
+        self._batch = batch
+        self._filter = filter
+        self._fixed = fixed
+        self._classes = list(classes)
+        self._ceiling = ceiling
+        self._phase = phase
+        self._partition = partition
+        self._stage = stage
+        self._watchdog = watchdog
+        self._breaker = breaker
+        self._grouped = grouped
+        self._chunks = []
+        self._clock = clock
+        self._overruns = 0
+        self._failures = 0
+        self._lock = threading.Lock()
 
     def start(self, tags, interval, topic):
         """
         Start the bridge with given tags.
 
+        Tags are grouped by scan class and partition key, and
+        each group is split into chunks of batch size. Each chunk
+        is read with one OPC request and rescheduled as a unit at
+        its class interval; with a ceiling, static tags are read
+        less often and the chunk slows down once all are. Tags
+        the breaker isolates or trips are read alone, tripped
+        ones only at their probe rate.
+        In fixed mode every chunk keeps its own deadline, which
+        advances by whole periods from its first read. Phase
+        offsets spread first reads over the interval, so reads
+        stay spread instead of arriving in one burst.
+
         Args:
             tags: List of TagPath to monitor
-            interval: Milliseconds between reads
+            interval: Milliseconds between reads of tags without
+                a scan class
             topic: Base MQTT topic prefix
         """
-        self._interval = interval
         self._topic = topic
         self._broker.connect()
+        self._stage.start()
         self._timer.start()
         for worker in self._workers:
             worker.start()
+        self._watchdog.map(lambda watchdog: watchdog.start())
+        now = self._clock()
+        due = []
+        for interval, ceiling, members in self._classify(tags, interval):
+            chunks = [
+                Chunk(members[index:index + self._batch], interval, ceiling)
+                for index in range(0, len(members), self._batch)
+            ]
+            self._chunks.extend(chunks)
+            for position, chunk in enumerate(chunks):
+                offset = self._offset(chunk, position, len(chunks))
+                if offset <= 0:
+                    due.extend(self._tasks(chunk, now))
+                else:
+                    self._begin(chunk, now + offset, offset)
+        self._queue.put_many(due)
+
+    def _offset(self, chunk, position, count):
+        """
+        Compute the phase of a chunk within its interval.
+
+        Args:
+            chunk: Chunk to place
+            position: Index of the chunk within its scan class
+            count: Number of chunks in its scan class
+
+        Returns:
+            Seconds from start to the first read
+        """
+        period = chunk.period()
+        if self._phase == "even":
+            return period * position / count
+        if self._phase == "hash":
+            text = chunk.tags()[0].text().encode("utf-8")
+            share = (zlib.crc32(text) & 0xffffffff) / float(2 ** 32)
+            return period * share
+        return 0.0
+
+    def _begin(self, chunk, deadline, offset):
+        """
+        Schedule a phase-shifted first read of a chunk.
+
+        Args:
+            chunk: Chunk to read
+            deadline: Monotonic time of the first read
+            offset: Seconds until the first read
+        """
+        self._timer.schedule(offset, lambda: self._enqueue(chunk, deadline))
+
+    def _classify(self, tags, interval):
+        """
+        Group tags by their scan class and partition key.
+
+        Args:
+            tags: List of TagPath to monitor
+            interval: Milliseconds for tags without a scan class
+
+        Returns:
+            List of (Milliseconds, Optional ceiling, list of TagPath)
+            in class order, then in order of first tag of each key
+        """
+        settings = [(c.interval(), c.ceiling()) for c in self._classes]
+        settings.append((interval, self._ceiling))
+        order = []
+        groups = {}
         for tag in tags:
-            self._enqueue(tag)
+            index = len(self._classes)
+            for position, scan in enumerate(self._classes):
+                if scan.matches(tag):
+                    index = position
+                    break
+            key = (index, self._partition(tag))
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(tag)
+        order.sort(key=lambda k: k[0])
+        return [settings[k[0]] + (groups[k],) for k in order]
 
-    def _enqueue(self, tag):
+    def _enqueue(self, chunk, deadline):
         """
-        Create and enqueue a read task for tag.
+        Create and enqueue the read tasks of a chunk of tags.
+
+        Args:
+            chunk: Chunk of tags to read together
+            deadline: Monotonic time the read was due
+        """
+        self._queue.put_many(self._tasks(chunk, deadline))
+
+    def _tasks(self, chunk, deadline):
+        """
+        Create the read tasks of a chunk of tags.
+
+        The chunk picks its tags that are due, and the breaker
+        decides which of those are read in the chunk's batch,
+        which are read alone and which are skipped. A chunk
+        without a batch is rescheduled right away. With groups,
+        the batch requests every batched tag of the chunk, so the
+        chunk's OPC group stays the same from read to read.
+
+        Args:
+            chunk: Chunk of tags to read
+            deadline: Monotonic time the read was due
+
+        Returns:
+            List of BatchReadTask, the batch first
+        """
+        batch, alone = self._breaker.admit(chunk.due())
+        tasks = [self._single(tag) for tag in alone]
+        if batch:
+            tasks.insert(0, self._task(chunk, batch, deadline))
+        else:
+            self._hold(chunk, deadline)
+        return tasks
+
+    def _task(self, chunk, tags, deadline):
+        """
+        Create the batch read task of a chunk.
+
+        Args:
+            chunk: Chunk of tags to read together
+            tags: List of TagPath of the chunk to read
+            deadline: Monotonic time the read was due
+
+        Returns:
+            BatchReadTask publishing and rescheduling the chunk
+        """
+        callback = self._callback(chunk, tags, deadline)
+        reads = tags
+        if self._grouped:
+            reads = self._breaker.batched(chunk.tags())
+        return BatchReadTask(
+            tags, callback, lambda: self._skip(chunk, deadline), reads
+        )
+
+    def _single(self, tag):
+        """
+        Create a read task for a tag the breaker reads alone.
+
+        The chunk's schedule brings the tag up again, so the task
+        neither reschedules nor adapts the chunk. While it waits,
+        a coalescing queue folds the tag's later reads into it
+        instead of queueing one read per cycle; those publish and
+        observe nothing of their own.
 
         Args:
             tag: TagPath to read
+
+        Returns:
+            BatchReadTask publishing the result
         """
-        callback = self._callback(tag)
-        task = ReadTask(tag, callback)
-        self._queue.put(task)
+        def handle(results):
+            self._submit([tag], results)
+            self._breaker.observe([tag], results)
+        return BatchReadTask([tag], handle)
 
-    def _callback(self, tag):
+    def _hold(self, chunk, deadline):
         """
-        Create callback for tag read completion.
+        Reschedule a chunk without tags to read in a batch.
 
         Args:
-            tag: TagPath being read
+            chunk: Chunk that was not read
+            deadline: Monotonic time the read was due
+        """
+        due, delay = self._next(chunk.period(), deadline)
+        self._timer.schedule(delay, lambda: self._enqueue(chunk, due))
+
+    def _skip(self, chunk, deadline):
+        """
+        Reschedule a chunk whose read was shed by the queue.
+
+        The skipped read is counted as an overrun, and the chunk
+        keeps its period without adapting to the missing read.
+
+        Args:
+            chunk: Chunk that was not read
+            deadline: Monotonic time the read was due
+        """
+        with self._lock:
+            self._overruns += 1
+        due, delay = self._next(chunk.period(), deadline)
+        self._timer.schedule(delay, lambda: self._enqueue(chunk, due))
+
+    def _callback(self, chunk, tags, deadline):
+        """
+        Create callback for chunk read completion.
+
+        A failing publish is counted and does not keep the chunk
+        from being rescheduled, nor does it reach the worker as a
+        failed read.
+
+        Args:
+            chunk: Chunk of tags being read
+            tags: List of TagPath of the chunk that are read
+            deadline: Monotonic time the read was due
+
+        Returns:
+            Function to handle list of read results
+        """
+        def handle(results):
+            self._submit(tags, results)
+            self._breaker.observe(tags, results)
+            period = chunk.observe(tags, results)
+            due, delay = self._next(period, deadline)
+            self._timer.schedule(delay, lambda: self._enqueue(chunk, due))
+        return handle
+
+    def _submit(self, tags, results):
+        """
+        Hand read results to the publish stage.
+
+        A failing publish is counted instead of raised. The read
+        time is taken here, right after the read, for filters that
+        run later in the stage.
+
+        Args:
+            tags: List of TagPath that were read
+            results: List of (value, quality, timestamp) in tag order
+        """
+        read = Some(self._clock())
+        try:
+            self._stage.submit(
+                lambda: self._publish_all(tags, results, read)
+            )
+        except Exception:
+            with self._lock:
+                self._failures += 1
+
+    def _next(self, period, deadline):
+        """
+        Compute the next read of a chunk.
+
+        Relative mode waits a full period after the read. Fixed
+        mode moves to the next deadline on the grid; deadlines
+        already passed are skipped and counted as overruns.
+
+        Args:
+            period: Seconds between reads of the chunk
+            deadline: Monotonic time the last read was due
 
         Returns:
-            Function to handle read result
+            Tuple of (next deadline, delay in seconds)
+        """
+        now = self._clock()
+        if not self._fixed or period <= 0:
+            return now + period, period
+        due = deadline + period
+        if due <= now:
+            skipped = int((now - due) / period) + 1
+            due += skipped * period
+            with self._lock:
+                self._overruns += skipped
+        return due, due - now
+
+    def _publish_all(self, tags, results, read):
+        """
+        Publish the results of a chunk read.
+
+        Args:
+            tags: List of TagPath that were read
+            results: List of (value, quality, timestamp) in tag order
+            read: Optional monotonic time the results were read
+        """
+        for tag, result in zip(tags, results):
+            self._publish(tag, result, read)
+
+    def _publish(self, tag, result, read):
         """
-        def handle(result):
-            value, quality, _ = result
+        Publish a single tag read result.
+
+        Results are passed through the filter first, which may
+        suppress them.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read
+        """
+        mqtt = tag.topic(self._topic)
+        for value, quality, stamp in self._filter.apply(tag, result, read):
             message = json.dumps({
                 "value": TagValue(value).json(),
-                "quality": OpcQuality(quality).text()
+                "quality": OpcQuality(quality).text(),
+                "timestamp": stamp
             })
-            mqtt = tag.topic(self._topic)
             self._broker.publish(mqtt, message)
-            delay = self._interval.seconds()
-            self._timer.schedule(delay, lambda: self._enqueue(tag))
-        return handle
+
+    def stats(self):
+        """
+        Get bridge counters.
+
+        Returns:
+            Dict with filter, timer, queue and publish stage
+            counters, skipped cycles, live workers and their
+            reconnects, abandoned hung calls, tripped tags, and
+            reads per second at base and adapted periods
+        """
+        with self._lock:
+            overruns = self._overruns
+            failures = self._failures
+        publish = dict(self._stage.stats())
+        publish["errors"] = publish.get("errors", 0) + failures
+        health = [worker.stats() for worker in self._workers]
+        rates = [chunk.rates() for chunk in list(self._chunks)]
+        base = sum(r[0] for r in rates)
+        actual = sum(r[1] for r in rates)
+        return {
+            "filter": self._filter.stats(),
+            "timer": self._timer.stats(),
+            "queue": self._queue.stats(),
+            "publish": publish,
+            "overruns": overruns,
+            "workers": {
+                "live": sum(1 for h in health if h["live"]),
+                "restarts": sum(h["restarts"] for h in health)
+            },
+            "watchdog": self._watchdog.fold(
+                lambda: {}, lambda watchdog: watchdog.stats()
+            ),
+            "breaker": self._breaker.stats(),
+            "reads": {
+                "base": round(base, 2),
+                "actual": round(actual, 2),
+                "saved": round(base - actual, 2)
+            }
+        }
 
     def stop(self):
         """
         Stop the bridge.
 
-        Stops timer, sends sentinels, waits for workers.
+        Closes the queue, so a timer callback blocked on a full
+        queue gives up, stops timer, stops workers from
+        reconnecting, sends sentinels, waits for workers, which
+        the watchdog still frees from hung calls, then stops the
+        watchdog and lets the publish stage finish before
+        disconnecting.
         """
+        self._queue.close()
         self._timer.stop()
-        for _ in self._workers:
-            self._queue.put(None)
+        for worker in self._workers:
+            worker.stop()
+        self._queue.put_many([None] * len(self._workers))
         for worker in self._workers:
             worker.join()
+        self._watchdog.map(lambda watchdog: watchdog.stop())
+        self._stage.stop()
         self._broker.disconnect()
 
     def __repr__(self):
@@ -114,4 +478,6 @@ class Bridge:
         Returns:
             String showing Bridge configuration
         """
-        return "Bridge(workers=%d)" % len(self._workers)
+        return "Bridge(workers=%d, batch=%d)" % (
+            len(self._workers), self._batch
+        )
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Monotonic clock for scheduling.
+
+Python 2.7 has no time.monotonic, so the platform clock is
+called through ctypes: GetTickCount64 on Windows, GetTickCount
+with its wraparound counted on Windows XP, which lacks
+GetTickCount64, and clock_gettime(CLOCK_MONOTONIC) elsewhere.
+Wall-clock time is used only when none is available; SOURCE
+names the clock chosen so the application can warn about it.
+
+Example:
+    >>> start = monotonic()
+    >>> time.sleep(0.1)
+    >>> monotonic() - start >= 0.1
+    True
+    >>> SOURCE
+    'clock_gettime'
+"""
+from __future__ import print_function
+
+import ctypes
+import ctypes.util
+import os
+import threading
+import time
+
+CLOCK_MONOTONIC = 1
+TICK_SPAN = 2 ** 32
+WALL = "time.time"
+
+
+class _Timespec(ctypes.Structure):
+    """
+    POSIX timespec structure.
+    """
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Unwrapped:
+    """
+    Millisecond tick counter extended past its wraparound.
+
+    GetTickCount wraps to zero every 49.7 days. A reading below
+    the previous one means the counter wrapped, so a full span is
+    added from then on. The clock must be read at least once per
+    span, which any running scheduler does.
+
+    Example:
+        >>> clock = _Unwrapped(kernel32.GetTickCount)
+        >>> clock()
+        1234.5
+    """
+
+    def __init__(self, ticks, span=TICK_SPAN):
+        """
+        Create an _Unwrapped clock.
+
+        Args:
+            ticks: Function returning milliseconds, wrapping at span
+            span: Number of milliseconds after which ticks wraps
+        """
+        self._ticks = ticks
+        self._span = span
+        self._base = 0
+        self._last = ticks()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        """
+        Read the clock.
+
+        Returns:
+            Seconds since boot
+        """
+        with self._lock:
+            now = self._ticks()
+            if now < self._last:
+                self._base += self._span
+            self._last = now
+            return (self._base + now) / 1000.0
+
+
+def _windows():
+    """
+    Build a clock from GetTickCount64, or GetTickCount where
+    GetTickCount64 is missing.
+
+    Returns:
+        Tuple of (function returning seconds since boot, name)
+    """
+    kernel32 = ctypes.windll.kernel32
+    try:
+        ticks = kernel32.GetTickCount64
+    except AttributeError:
+        ticks = kernel32.GetTickCount
+        ticks.restype = ctypes.c_uint32
+        return _Unwrapped(ticks), "GetTickCount"
+    ticks.restype = ctypes.c_ulonglong
+    return (lambda: ticks() / 1000.0), "GetTickCount64"
+
+
+def _posix():
+    """
+    Build a clock from clock_gettime.
+
+    Returns:
+        Function returning seconds of CLOCK_MONOTONIC
+    """
+    name = ctypes.util.find_library("rt") or ctypes.util.find_library("c")
+    gettime = ctypes.CDLL(name, use_errno=True).clock_gettime
+    gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_Timespec)]
+
+    def read():
+        spec = _Timespec()
+        if gettime(CLOCK_MONOTONIC, ctypes.byref(spec)) != 0:
+            raise OSError(ctypes.get_errno(), "clock_gettime failed")
+        return spec.tv_sec + spec.tv_nsec / 1e9
+    read()
+    return read
+
+
+def _clock():
+    """
+    Select the best available monotonic clock.
+
+    Returns:
+        Tuple of (function returning current time in seconds,
+        name of the clock)
+    """
+    if hasattr(time, "monotonic"):
+        return time.monotonic, "time.monotonic"
+    try:
+        if os.name == "nt":
+            return _windows()
+        return _posix(), "clock_gettime"
+    except (AttributeError, OSError, TypeError):
+        return time.time, WALL
+
+
+monotonic, SOURCE = _clock()
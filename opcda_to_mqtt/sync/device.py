@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+DeviceQueue limiting concurrent reads per device.
+
+Example:
+    >>> queue = DeviceQueue(1, 2)
+    >>> queue.put(BatchReadTask([TagPath("COM1.Dev.T1")], callback))
+    >>> task = queue.get()
+    >>> task.execute(client)  # Frees the COM1 slot when done
+"""
+from __future__ import print_function
+
+import collections
+import threading
+
+from opcda_to_mqtt.sync.queue import POLICIES
+from opcda_to_mqtt.sync.task import Task
+
+
+class DeviceQueue:
+    """
+    Task queue serving devices in turn with a cap per device.
+
+    The device of a task is the leading segments of its first
+    tag path, e.g. "COM1" at depth 1. Each device has its own
+    FIFO. Workers take tasks from devices round-robin, skipping
+    devices that already have the maximum number of reads in
+    flight, so one slow bus cannot occupy every worker. A worker
+    taking several tasks at once gets at most one per device, as
+    it runs them one after another.
+
+    Tasks are handed out wrapped; the device slot is freed when
+    the wrapped task finishes, even if it raises.
+
+    Capacity, overload policy and keyed coalescing work as in
+    TaskQueue; a shed task is the oldest waiting on any device.
+
+    Example:
+        >>> queue = DeviceQueue(1, 1)
+        >>> queue.put(first_com1_task)
+        >>> queue.put(second_com1_task)
+        >>> queue.put(com2_task)
+        >>> queue.get()  # first_com1_task
+        >>> queue.get()  # com2_task, COM1 is busy
+    """
+
+    def __init__(self, depth, limit, capacity=0, policy="block",
+                 keyed=False):
+        """
+        Create a DeviceQueue.
+
+        Args:
+            depth: Number of tag path segments naming the device
+            limit: Maximum reads in flight per device
+            capacity: Maximum waiting tasks, 0 for unbounded
+            policy: Overload policy, one of POLICIES
+            keyed: Let waiting tasks absorb later tasks for their
+                tags at any fill level
+
+        Raises:
+            ValueError: If policy is unknown
+        """
+        if policy not in POLICIES:
+            raise ValueError("Unknown queue policy: %s" % policy)
+        self._depth = depth
+        self._limit = limit
+        self._capacity = capacity
+        self._policy = policy
+        self._keyed = keyed
+        self._indexed = keyed or policy == "coalesce"
+        self._waiting = {}
+        self._pending = {}
+        self._ring = collections.deque()
+        self._busy = collections.defaultdict(int)
+        self._sentinels = 0
+        self._size = 0
+        self._added = 0
+        self._shed = 0
+        self._coalesced = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, task):
+        """
+        Add a task to the queue of its device.
+
+        Args:
+            task: Task to add (or None for shutdown sentinel)
+        """
+        self.put_many([task])
+
+    def put_many(self, tasks):
+        """
+        Add several tasks under one lock acquisition.
+
+        Args:
+            tasks: List of tasks (or None sentinels)
+        """
+        shed = []
+        with self._condition:
+            for task in tasks:
+                if task is None:
+                    self._sentinels += 1
+                else:
+                    self._add(task, shed)
+            self._condition.notify_all()
+        for item in shed:
+            item.shed()
+
+    def _add(self, task, shed):
+        """
+        Add one task with the condition held.
+
+        Args:
+            task: Task to add
+            shed: List collecting tasks evicted to make room
+        """
+        if self._keyed and self._absorbs(task):
+            return
+        if self._full():
+            if self._policy == "block":
+                self._condition.notify_all()
+                while self._full() and not self._closed:
+                    self._condition.wait()
+                if self._full():
+                    self._shed += 1
+                    shed.append(task)
+                    return
+            elif self._absorbs(task):
+                return
+            else:
+                shed.append(self._evict())
+        key = self._device(task)
+        if key not in self._pending:
+            self._pending[key] = collections.deque()
+            self._ring.append(key)
+        self._pending[key].append((self._added, task))
+        self._added += 1
+        self._size += 1
+        if self._indexed:
+            for tag in task.tags():
+                self._waiting.setdefault(tag.text(), task)
+
+    def _full(self):
+        """
+        Check if the queue is at capacity.
+
+        Returns:
+            True if bounded and no room is left
+        """
+        return 0 < self._capacity <= self._size
+
+    def _absorbs(self, task):
+        """
+        Let a waiting task take over a new one.
+
+        Args:
+            task: Task about to be added
+
+        Returns:
+            True if a waiting task for the same tags absorbed it
+        """
+        if not self._indexed or not task.tags():
+            return False
+        host = self._waiting.get(task.tags()[0].text())
+        if host is None or not host.absorb(task):
+            return False
+        self._coalesced += 1
+        return True
+
+    def _forget(self, task):
+        """
+        Drop a task that stopped waiting from the index.
+
+        Args:
+            task: Task taken or shed
+        """
+        if self._indexed:
+            for tag in task.tags():
+                if self._waiting.get(tag.text()) is task:
+                    del self._waiting[tag.text()]
+
+    def _evict(self):
+        """
+        Remove the oldest waiting task of any device.
+
+        Returns:
+            The removed task
+        """
+        key = min(self._pending, key=lambda k: self._pending[k][0][0])
+        tasks = self._pending[key]
+        task = tasks.popleft()[1]
+        if not tasks:
+            del self._pending[key]
+            self._ring.remove(key)
+        self._size -= 1
+        self._shed += 1
+        self._forget(task)
+        return task
+
+    def get(self):
+        """
+        Remove and return the next task of a device with a free slot.
+
+        Blocks until such a task or a sentinel is available.
+
+        Returns:
+            Next task wrapped to free its slot (or None sentinel)
+        """
+        return self.get_many(1)[0]
+
+    def get_many(self, limit):
+        """
+        Remove and return up to limit tasks of devices with free slots.
+
+        Blocks until one such task or a sentinel is available,
+        then keeps taking devices in turn while slots are free,
+        one task per device. A sentinel is only ever returned
+        alone.
+
+        Args:
+            limit: Maximum number of tasks to take
+
+        Returns:
+            Non-empty list of wrapped tasks, or [None] for a
+            sentinel
+        """
+        with self._condition:
+            while True:
+                tasks = []
+                for _ in range(len(self._ring)):
+                    if len(tasks) >= limit:
+                        break
+                    key = self._ring[0]
+                    self._ring.rotate(-1)
+                    if self._busy[key] < self._limit:
+                        tasks.append(self._take(key))
+                if tasks:
+                    self._condition.notify_all()
+                    return tasks
+                if self._sentinels:
+                    self._sentinels -= 1
+                    return [None]
+                self._condition.wait()
+
+    def _take(self, key):
+        """
+        Take the oldest task of a device.
+
+        Must be called with the condition held, right after the
+        device was rotated to the end of the ring.
+
+        Args:
+            key: Device key
+
+        Returns:
+            DeviceTask wrapping the task
+        """
+        tasks = self._pending[key]
+        task = tasks.popleft()[1]
+        if not tasks:
+            del self._pending[key]
+            self._ring.pop()
+        self._busy[key] += 1
+        self._size -= 1
+        self._forget(task)
+        return DeviceTask(task, lambda: self._release(key))
+
+    def _release(self, key):
+        """
+        Free a slot of a device.
+
+        Args:
+            key: Device key
+        """
+        with self._condition:
+            self._busy[key] -= 1
+            self._condition.notify_all()
+
+    def _device(self, task):
+        """
+        Get the device of a task.
+
+        Args:
+            task: Task to classify
+
+        Returns:
+            Device key string, empty for tasks without tags
+        """
+        tags = task.tags()
+        return tags[0].device(self._depth) if tags else ""
+
+    def drain(self):
+        """
+        Remove every waiting task without blocking.
+
+        Sentinels and in-flight counts are kept.
+
+        Returns:
+            List of removed tasks, device by device
+        """
+        with self._condition:
+            tasks = [
+                task for key in self._ring for _, task in self._pending[key]
+            ]
+            self._pending = {}
+            self._ring.clear()
+            self._size = 0
+            self._waiting = {}
+            self._condition.notify_all()
+            return tasks
+
+    def close(self):
+        """
+        Stop blocking producers.
+
+        A put waiting for room in a full queue, and every later one
+        that finds it full, sheds its task instead of waiting, so
+        shutdown cannot hang on a queue no worker drains. Taking
+        tasks is not affected.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def size(self):
+        """
+        Get number of waiting tasks.
+
+        Returns:
+            Number of tasks in queue
+        """
+        with self._condition:
+            return self._size
+
+    def stats(self):
+        """
+        Get queue counters.
+
+        Returns:
+            Dict with queue size, shed and coalesced task counts
+            and, per device key, waiting and in-flight counts
+        """
+        with self._condition:
+            keys = set(self._pending) | set(
+                k for k, v in self._busy.items() if v
+            )
+            devices = dict(
+                (key, {
+                    "waiting": len(self._pending.get(key, ())),
+                    "reading": self._busy[key]
+                })
+                for key in keys
+            )
+            return {
+                "size": self._size,
+                "shed": self._shed,
+                "coalesced": self._coalesced,
+                "devices": devices
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing DeviceQueue size and device count
+        """
+        with self._condition:
+            return "DeviceQueue(size=%d, devices=%d)" % (
+                self._size, len(self._pending)
+            )
+
+
+class DeviceTask(Task):
+    """
+    Task that frees a device slot when it finishes.
+
+    The slot is freed exactly once: when execute returns or
+    raises, or when the task is failed or shed first, so a read
+    abandoned while hung does not keep its device busy.
+
+    Example:
+        >>> task = DeviceTask(inner, release)
+        >>> task.execute(client)  # inner.execute, then release()
+    """
+
+    def __init__(self, task, release):
+        """
+        Create a DeviceTask.
+
+        Args:
+            task: Task to execute
+            release: Function called once the task finished
+        """
+        self._task = task
+        self._release = release
+        self._held = True
+        self._lock = threading.Lock()
+
+    def execute(self, client):
+        """
+        Execute the wrapped task and free its slot.
+
+        Args:
+            client: OpenOPC client instance
+        """
+        try:
+            self._task.execute(client)
+        finally:
+            self._free()
+
+    def _free(self):
+        """
+        Free the device slot unless already freed.
+        """
+        with self._lock:
+            held = self._held
+            self._held = False
+        if held:
+            self._release()
+
+    def tags(self):
+        """
+        Get the tags of the wrapped task.
+
+        Returns:
+            List of TagPath
+        """
+        return self._task.tags()
+
+    def shed(self):
+        """
+        Pass shedding on to the wrapped task and free its slot.
+        """
+        self._free()
+        self._task.shed()
+
+    def fail(self, error):
+        """
+        Pass an execution error on to the wrapped task and free
+        its slot.
+
+        Args:
+            error: Exception raised by execute()
+        """
+        self._free()
+        self._task.fail(error)
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing the wrapped task
+        """
+        return "DeviceTask(%r)" % self._task
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+GroupedClient keeping persistent OPC groups per connection.
+
+Example:
+    >>> reader = GroupedClient(client)
+    >>> reader.read(["Tag1", "Tag2"], sync=True)  # Creates group
+    >>> reader.read(["Tag1", "Tag2"], sync=True)  # Refreshes group
+"""
+from __future__ import print_function
+
+
+class GroupedClient:
+    """
+    OPC client wrapper that reads tag lists through named groups.
+
+    The first read of a tag list adds its items to a new OPC group.
+    Later reads of the same list refresh that group by name, so the
+    server does not resolve item names again. Groups live as long as
+    the wrapped connection; a new connection needs a new wrapper.
+
+    A new list replaces the groups of lists it shares tags with,
+    so a chunk whose tag list changes keeps one group.
+
+    Example:
+        >>> reader = GroupedClient(client)
+        >>> reader.read(["A", "B"], sync=True)
+        [('A', 1, 'Good', ...), ('B', 2, 'Good', ...)]
+        >>> reader.groups()
+        1
+    """
+
+    def __init__(self, client, prefix="opcda_mqtt"):
+        """
+        Create a GroupedClient.
+
+        Args:
+            client: Connected OpenOPC client
+            prefix: Prefix for generated group names
+        """
+        self._client = client
+        self._prefix = prefix
+        self._groups = {}
+        self._owners = {}
+        self._made = 0
+
+    def read(self, tag, sync=True):
+        """
+        Read a tag or a list of tags.
+
+        Lists are read through a persistent group, a single tag
+        is passed to the wrapped client unchanged.
+
+        Args:
+            tag: Tag path string or list of tag path strings
+            sync: Synchronous read flag
+
+        Returns:
+            Read result of the wrapped client
+        """
+        if not isinstance(tag, list):
+            return self._client.read(tag, sync=sync)
+        key = tuple(tag)
+        name = self._groups.get(key)
+        if name is not None:
+            return self._client.read(group=name, sync=sync)
+        for stale in set(self._owners.get(item) for item in tag):
+            if stale is not None:
+                self._remove(stale)
+        name = "%s_%d" % (self._prefix, self._made)
+        self._made += 1
+        result = self._client.read(tag, group=name, sync=sync)
+        self._groups[key] = name
+        for item in tag:
+            self._owners[item] = key
+        return result
+
+    def _remove(self, key):
+        """
+        Remove the group of a tag list from the server.
+
+        A server refusing the removal only keeps an unused group.
+
+        Args:
+            key: Tuple of tag path strings of the group
+        """
+        name = self._groups.pop(key)
+        for item in key:
+            if self._owners.get(item) == key:
+                del self._owners[item]
+        try:
+            self._client.remove(name)
+        except Exception:
+            pass
+
+    def groups(self):
+        """
+        Get number of groups built on this connection.
+
+        Returns:
+            Group count integer
+        """
+        return len(self._groups)
+
+    def close(self):
+        """
+        Close the wrapped connection and forget its groups.
+        """
+        self._groups = {}
+        self._owners = {}
+        self._client.close()
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing GroupedClient group count
+        """
+        return "GroupedClient(groups=%d)" % len(self._groups)
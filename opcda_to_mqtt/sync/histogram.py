@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Histogram of callback lateness.
+
+Example:
+    >>> lateness = Histogram([1, 10, 100])
+    >>> lateness.record(0.004)
+    >>> lateness.stats()["buckets"]
+    [0, 1, 0, 0]
+"""
+from __future__ import print_function
+
+import bisect
+import threading
+
+LATENESS_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of delays in milliseconds.
+
+    Each bucket counts delays up to its bound; the last bucket
+    counts delays above every bound.
+
+    Example:
+        >>> lateness = Histogram(LATENESS_BOUNDS)
+        >>> lateness.record(0.0)
+        >>> lateness.stats()["count"]
+        1
+    """
+
+    def __init__(self, bounds):
+        """
+        Create a Histogram.
+
+        Args:
+            bounds: Ascending list of bucket bounds in milliseconds
+        """
+        self._bounds = list(bounds)
+        self._buckets = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        """
+        Count one delay.
+
+        Args:
+            seconds: Delay in seconds, negative counts as zero
+        """
+        millis = max(0.0, seconds * 1000.0)
+        index = bisect.bisect_left(self._bounds, millis)
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._total += millis
+            self._max = max(self._max, millis)
+
+    def stats(self):
+        """
+        Get histogram counters.
+
+        Returns:
+            Dict with count, mean and max in milliseconds,
+            bucket bounds and bucket counts
+        """
+        with self._lock:
+            mean = self._total / self._count if self._count else 0.0
+            return {
+                "count": self._count,
+                "mean": round(mean, 3),
+                "max": round(self._max, 3),
+                "bounds": list(self._bounds),
+                "buckets": list(self._buckets)
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Histogram count
+        """
+        return "Histogram(count=%d)" % self._count
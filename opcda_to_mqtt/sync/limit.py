@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+ConcurrencyLimit adapting how many reads run at once.
+
+Example:
+    >>> limit = ConcurrencyLimit(50, 0.2)
+    >>> queue = LimitedQueue(TaskQueue(), limit)
+    >>> worker = OpenOpcWorker(queue, progid, host)
+    >>> limit.stats()["limit"]
+    50.0
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.histogram import Histogram, LATENESS_BOUNDS
+from opcda_to_mqtt.sync.task import Task
+
+BACKOFF = 0.75
+
+
+class ConcurrencyLimit:
+    """
+    AIMD limit on reads in flight against the OPC server.
+
+    Every read that finishes within the latency target raises the
+    limit by 1/limit, so a full round of reads adds one slot. A
+    read slower than the target multiplies the limit by BACKOFF.
+    Reads that were already in flight at the last decrease do not
+    decrease it again, so one slow burst shrinks the limit once.
+
+    The limit starts at the maximum and never leaves
+    [minimum, maximum].
+
+    Example:
+        >>> limit = ConcurrencyLimit(8, 0.1)
+        >>> started = limit.acquire()
+        >>> limit.release(started)
+    """
+
+    def __init__(self, maximum, target, minimum=1, clock=monotonic):
+        """
+        Create a ConcurrencyLimit.
+
+        Args:
+            maximum: Upper bound of reads in flight
+            target: Seconds a read may take before the limit drops
+            minimum: Lower bound of reads in flight
+            clock: Function returning monotonic time in seconds
+        """
+        self._maximum = float(maximum)
+        self._minimum = float(min(minimum, maximum))
+        self._target = target
+        self._clock = clock
+        self._limit = self._maximum
+        self._inflight = 0
+        self._dropped = clock()
+        self._drops = 0
+        self._latency = Histogram(LATENESS_BOUNDS)
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            Monotonic time the read starts
+        """
+        with self._condition:
+            while self._inflight >= int(self._limit):
+                self._condition.wait()
+            self._inflight += 1
+            return self._clock()
+
+    def release(self, started):
+        """
+        Free a slot and adapt the limit to the read's latency.
+
+        Args:
+            started: Time returned by acquire()
+        """
+        now = self._clock()
+        latency = now - started
+        self._latency.record(latency)
+        with self._condition:
+            self._inflight -= 1
+            if latency <= self._target:
+                self._limit = min(
+                    self._maximum, self._limit + 1.0 / self._limit
+                )
+            elif started >= self._dropped:
+                self._limit = max(self._minimum, self._limit * BACKOFF)
+                self._dropped = now
+                self._drops += 1
+            self._condition.notify_all()
+
+    def stats(self):
+        """
+        Get limit counters.
+
+        Returns:
+            Dict with current limit, reads in flight, decrease
+            count and read latency histogram
+        """
+        with self._condition:
+            counters = {
+                "limit": round(self._limit, 2),
+                "inflight": self._inflight,
+                "drops": self._drops
+            }
+        counters["latency"] = self._latency.stats()
+        return counters
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ConcurrencyLimit limit and bounds
+        """
+        with self._condition:
+            return "ConcurrencyLimit(%.2f of %d)" % (
+                self._limit, self._maximum
+            )
+
+
+class LimitedQueue:
+    """
+    Queue view whose tasks run under a ConcurrencyLimit.
+
+    Tasks are taken from the wrapped queue as usual and wait for
+    a slot just before they execute, so a worker never holds a
+    slot while waiting for work.
+
+    Example:
+        >>> queue = LimitedQueue(TaskQueue(), limit)
+        >>> queue.put(task)
+        >>> queue.get().execute(client)  # Within the limit
+    """
+
+    def __init__(self, queue, limit):
+        """
+        Create a LimitedQueue.
+
+        Args:
+            queue: Queue to wrap
+            limit: ConcurrencyLimit shared by all workers
+        """
+        self._queue = queue
+        self._limit = limit
+
+    def put(self, task):
+        """
+        Add a task to the wrapped queue.
+
+        Args:
+            task: Task to add (or None for shutdown sentinel)
+        """
+        self._queue.put(task)
+
+    def put_many(self, tasks):
+        """
+        Add several tasks to the wrapped queue.
+
+        Args:
+            tasks: List of tasks (or None sentinels)
+        """
+        self._queue.put_many(tasks)
+
+    def get(self):
+        """
+        Remove and return the next task.
+
+        Returns:
+            Next task wrapped to run within the limit (or None
+            sentinel)
+        """
+        return self.get_many(1)[0]
+
+    def get_many(self, limit):
+        """
+        Remove and return up to limit tasks.
+
+        Args:
+            limit: Maximum number of tasks to take
+
+        Returns:
+            Non-empty list of wrapped tasks, or [None] for a
+            sentinel
+        """
+        tasks = self._queue.get_many(limit)
+        if tasks[0] is None:
+            return tasks
+        return [LimitedTask(task, self._limit) for task in tasks]
+
+    def close(self):
+        """
+        Stop blocking producers of the wrapped queue.
+        """
+        self._queue.close()
+
+    def size(self):
+        """
+        Get number of waiting tasks.
+
+        Returns:
+            Number of tasks in the wrapped queue
+        """
+        return self._queue.size()
+
+    def stats(self):
+        """
+        Get queue counters.
+
+        Returns:
+            Dict of the wrapped queue counters with the limit
+            counters under "limit"
+        """
+        counters = dict(self._queue.stats())
+        counters["limit"] = self._limit.stats()
+        return counters
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing the wrapped queue
+        """
+        return "LimitedQueue(%r)" % self._queue
+
+
+class LimitedTask(Task):
+    """
+    Task that holds a concurrency slot while it reads.
+
+    The slot is taken when the wrapped task calls client.read and
+    freed when the read returns, so the latency the limit adapts
+    to is the OPC call alone, not the callback publishing its
+    results. The slot is freed exactly once: after the read, or
+    when the task is failed first, so a read abandoned while hung
+    gives its slot back.
+
+    Example:
+        >>> task = LimitedTask(inner, limit)
+        >>> task.execute(client)  # acquire, client.read, release
+    """
+
+    def __init__(self, task, limit):
+        """
+        Create a LimitedTask.
+
+        Args:
+            task: Task to execute
+            limit: ConcurrencyLimit to hold a slot of
+        """
+        self._task = task
+        self._limit = limit
+        self._started = None
+        self._lock = threading.Lock()
+
+    def execute(self, client):
+        """
+        Execute the wrapped task, its reads within the limit.
+
+        Args:
+            client: OpenOPC client instance
+        """
+        try:
+            self._task.execute(_Limited(client, self))
+        finally:
+            self._free()
+
+    def _hold(self):
+        """
+        Wait for a concurrency slot and take it.
+        """
+        started = self._limit.acquire()
+        with self._lock:
+            self._started = started
+
+    def _free(self):
+        """
+        Free the concurrency slot if one is held.
+        """
+        with self._lock:
+            started = self._started
+            self._started = None
+        if started is not None:
+            self._limit.release(started)
+
+    def tags(self):
+        """
+        Get the tags of the wrapped task.
+
+        Returns:
+            List of TagPath
+        """
+        return self._task.tags()
+
+    def shed(self):
+        """
+        Pass shedding on to the wrapped task.
+        """
+        self._task.shed()
+
+    def fail(self, error):
+        """
+        Pass an execution error on to the wrapped task and free
+        its slot.
+
+        Args:
+            error: Exception raised by execute()
+        """
+        self._free()
+        self._task.fail(error)
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing the wrapped task
+        """
+        return "LimitedTask(%r)" % self._task
+
+
+class _Limited:
+    """
+    OPC client proxy holding a concurrency slot during each read.
+    """
+
+    def __init__(self, client, task):
+        """
+        Create a _Limited proxy.
+
+        Args:
+            client: OPC client to pass calls to
+            task: LimitedTask holding the slot
+        """
+        self._client = client
+        self._task = task
+
+    def read(self, *args, **kwargs):
+        """
+        Read through the client within the limit.
+
+        Returns:
+            Read result of the client
+        """
+        self._task._hold()
+        try:
+            return self._client.read(*args, **kwargs)
+        finally:
+            self._task._free()
+
+    def __getattr__(self, name):
+        """
+        Pass other attributes on to the client.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Attribute of the client
+        """
+        return getattr(self._client, name)
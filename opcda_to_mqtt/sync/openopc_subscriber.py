@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+OpenOpcSubscriptionClient for OPC-DA data-change notifications.
+
+Example:
+    >>> client = OpenOpcSubscriptionClient("OPC.Server.1", "localhost")
+    >>> subscriber = ClientSubscriber(client)
+    >>> subscriber.subscribe(tags, Milliseconds(500), callback)
+    >>> subscriber.start()
+"""
+from __future__ import print_function
+
+import time
+
+
+class OpenOpcSubscriptionClient:
+    """
+    Data-change client on top of an OpenOPC connection.
+
+    OpenOPC only offers polling reads, so the subscription group is
+    created through the OPC Automation server behind the OpenOPC
+    client and its DataChange events are received with pywin32.
+    All calls must happen on one thread, see ClientSubscriber.
+
+    Example:
+        >>> client = OpenOpcSubscriptionClient("OPC.Server", "localhost")
+        >>> client.connect()
+        >>> client.subscribe(["COM1.Tag"], 500, handler)
+        >>> client.pump(0.05)
+        >>> client.close()
+    """
+
+    def __init__(self, progid, host, name="opcda_mqtt_subscription"):
+        """
+        Create an OpenOpcSubscriptionClient.
+
+        Args:
+            progid: OPC-DA server ProgID
+            host: Server hostname
+            name: OPC group name
+        """
+        self._progid = progid
+        self._host = host
+        self._name = name
+        self._client = None
+        self._group = None
+        self._events = None
+
+    def connect(self):
+        """
+        Connect to the OPC-DA server on the calling thread.
+        """
+        import pythoncom
+        import OpenOPC
+        pythoncom.CoInitialize()
+        self._client = OpenOPC.client()
+        self._client.connect(self._progid, self._host)
+
+    def subscribe(self, tags, rate, handler):
+        """
+        Create an active subscribed group for tags.
+
+        Args:
+            tags: List of tag path strings
+            rate: Requested update rate in milliseconds
+            handler: Function called with (name, value, quality, stamp)
+        """
+        import win32com.client
+        import OpenOPC
+        group = self._client._opc.OPCGroups.Add(self._name)
+        group.UpdateRate = rate
+        group.IsActive = True
+        group.IsSubscribed = True
+        events = win32com.client.WithEvents(group, _GroupEvents)
+        events.tags = dict(
+            (index + 1, tag) for index, tag in enumerate(tags)
+        )
+        events.handler = handler
+        events.quality = OpenOPC.quality_str
+        handles = sorted(events.tags.keys())
+        group.OPCItems.AddItems(
+            len(tags), [0] + list(tags), [0] + handles
+        )
+        self._group = group
+        self._events = events
+
+    def pump(self, timeout):
+        """
+        Dispatch pending COM events, then wait.
+
+        Args:
+            timeout: Seconds to wait after dispatching
+        """
+        import pythoncom
+        pythoncom.PumpWaitingMessages()
+        time.sleep(timeout)
+
+    def close(self):
+        """
+        Remove the group and disconnect.
+        """
+        import pythoncom
+        try:
+            if self._group is not None:
+                self._client._opc.OPCGroups.Remove(self._name)
+                self._group = None
+                self._events = None
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        finally:
+            pythoncom.CoUninitialize()
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing OpenOpcSubscriptionClient configuration
+        """
+        return "OpenOpcSubscriptionClient(%r, %r)" % (
+            self._progid, self._host
+        )
+
+
+class _GroupEvents:
+    """
+    Event sink for OPC Automation group notifications.
+
+    Attributes tags, handler and quality are assigned after
+    win32com.client.WithEvents creates the instance.
+    """
+
+    def OnDataChange(self, transaction, count, handles, values,
+                     qualities, stamps):
+        """
+        Forward changed items to the handler.
+
+        Args:
+            transaction: Transaction ID (unused)
+            count: Number of changed items
+            handles: Client handles of changed items
+            values: New values
+            qualities: Quality codes
+            stamps: Timestamps
+        """
+        for index in range(count):
+            name = self.tags.get(handles[index])
+            if name is None:
+                continue
+            self.handler(
+                name,
+                values[index],
+                self.quality(qualities[index]),
+                str(stamps[index])
+            )
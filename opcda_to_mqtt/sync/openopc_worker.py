@@ -11,16 +11,21 @@ Example:
 """
 from __future__ import print_function
 
-import threading
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.sync.group import GroupedClient
+from opcda_to_mqtt.sync.supervised import SupervisedWorker
 
-from opcda_to_mqtt.sync.worker import Worker
 
-
-class OpenOpcWorker(Worker):
+class OpenOpcWorker(SupervisedWorker):
     """
     Real worker using OpenOPC for tag reads.
 
     Each worker has its own OPC connection for COM thread safety.
+    With groups enabled, batch reads go through persistent OPC
+    groups that are built once per connection. A worker may take
+    several waiting tasks per wakeup and run them back to back.
+    Failed reads and lost connections are handled as described
+    in SupervisedWorker.
 
     Example:
         >>> worker = OpenOpcWorker(queue, "OPC.Server", "localhost")
@@ -29,7 +34,9 @@ class OpenOpcWorker(Worker):
         >>> worker.join()
     """
 
-    def __init__(self, queue, progid, host):
+    def __init__(self, queue, progid, host, groups=False, drain=1,
+                 failed=lambda error: None, recovered=lambda: None,
+                 backoff=Backoff(1.0, 60.0)):
         """
         Create an OpenOpcWorker.
 
@@ -37,47 +44,34 @@ class OpenOpcWorker(Worker):
             queue: TaskQueue to pull tasks from
             progid: OPC-DA server ProgID
             host: Server hostname
+            groups: Read batches through persistent OPC groups
+            drain: Maximum tasks taken from the queue at once
+            failed: Function called with each error that cost
+                the worker its connection
+            recovered: Function called after each connect
+            backoff: Backoff between reconnect attempts
         """
-        self._queue = queue
+        SupervisedWorker.__init__(
+            self, queue, drain, failed, recovered, backoff
+        )
         self._progid = progid
         self._host = host
-        self._thread = threading.Thread(target=self._run)
-
-    def start(self):
-        """
-        Start the worker thread.
-        """
-        self._thread.start()
+        self._groups = groups
 
-    def stop(self):
-        """
-        Signal stop (Bridge sends sentinel to queue).
+    def _connect(self):
         """
-        pass
+        Open a new OpenOPC connection.
 
-    def join(self):
-        """
-        Wait for worker thread to finish.
-        """
-        self._thread.join()
-
-    def _run(self):
-        """
-        Main worker loop.
-
-        Connects to OPC, executes tasks until sentinel.
+        Returns:
+            Connected client, wrapped in GroupedClient if groups
+            are enabled
         """
         import OpenOPC
         client = OpenOPC.client()
         client.connect(self._progid, self._host)
-        try:
-            while True:
-                task = self._queue.get()
-                if task is None:
-                    break
-                task.execute(client)
-        finally:
-            client.close()
+        if self._groups:
+            client = GroupedClient(client)
+        return client
 
     def __repr__(self):
         """
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Publish stages running result publishing for the Bridge.
+
+Example:
+    >>> stage = PublishStage(10000, "drop-oldest")
+    >>> stage.start()
+    >>> stage.submit(lambda: broker.publish("topic", "message"))
+    >>> stage.stop()  # Publishes what is left, then returns
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.task import Task
+
+DRAIN = 64
+
+
+class InlineStage:
+    """
+    Publish stage that runs jobs on the calling thread.
+
+    Example:
+        >>> stage = InlineStage()
+        >>> stage.submit(lambda: print("now"))
+        now
+    """
+
+    def start(self):
+        """
+        Nothing to start.
+        """
+
+    def submit(self, job):
+        """
+        Run a publish job right away.
+
+        Args:
+            job: Function publishing results (no arguments)
+        """
+        job()
+
+    def stop(self):
+        """
+        Nothing to stop.
+        """
+
+    def stats(self):
+        """
+        Get stage counters.
+
+        Returns:
+            Empty dict
+        """
+        return {}
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String naming InlineStage
+        """
+        return "InlineStage()"
+
+
+class PublishStage:
+    """
+    Publish stage with its own queue and publisher thread.
+
+    Reader threads only hand over their results; filtering, JSON
+    encoding and the MQTT call run on the publisher thread, which
+    takes jobs in order so filters see every tag's results in
+    the order they were read.
+
+    The queue applies the TaskQueue overload policy when full:
+    "block" holds back the reader threads, "drop-oldest" drops
+    the oldest waiting results.
+
+    Example:
+        >>> stage = PublishStage(1000, "block")
+        >>> stage.start()
+        >>> stage.submit(job)
+        >>> stage.stats()["size"]
+        1
+    """
+
+    def __init__(self, capacity=0, policy="block"):
+        """
+        Create a PublishStage.
+
+        Args:
+            capacity: Maximum waiting jobs, 0 for unbounded
+            policy: Overload policy, "block" or "drop-oldest"
+
+        Raises:
+            ValueError: If policy is unknown
+        """
+        self._queue = TaskQueue(capacity, policy)
+        self._published = 0
+        self._errors = 0
+        self._peak = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run)
+
+    def start(self):
+        """
+        Start the publisher thread.
+        """
+        self._thread.start()
+
+    def submit(self, job):
+        """
+        Queue a publish job.
+
+        Args:
+            job: Function publishing results (no arguments)
+        """
+        self._queue.put(PublishTask(job))
+        size = self._queue.size()
+        with self._lock:
+            self._peak = max(self._peak, size)
+
+    def stop(self):
+        """
+        Stop the publisher thread once queued jobs are done.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """
+        Main loop of the publisher thread.
+
+        Runs jobs until the sentinel. A failing job is counted
+        and does not stop the thread.
+        """
+        while True:
+            tasks = self._queue.get_many(DRAIN)
+            if tasks[0] is None:
+                break
+            for task in tasks:
+                try:
+                    task.execute(None)
+                    failed = 0
+                except Exception:
+                    failed = 1
+                with self._lock:
+                    self._published += 1 - failed
+                    self._errors += failed
+
+    def stats(self):
+        """
+        Get stage counters.
+
+        Returns:
+            Dict with waiting, peak, dropped, published and failed
+            job counts
+        """
+        queued = self._queue.stats()
+        with self._lock:
+            return {
+                "size": queued["size"],
+                "peak": self._peak,
+                "dropped": queued["shed"],
+                "published": self._published,
+                "errors": self._errors
+            }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing PublishStage size
+        """
+        return "PublishStage(size=%d)" % self._queue.size()
+
+
+class PublishTask(Task):
+    """
+    Task running one publish job.
+
+    Example:
+        >>> PublishTask(lambda: print("sent")).execute(None)
+        sent
+    """
+
+    def __init__(self, job):
+        """
+        Create a PublishTask.
+
+        Args:
+            job: Function publishing results (no arguments)
+        """
+        self._job = job
+
+    def execute(self, client):
+        """
+        Run the job.
+
+        Args:
+            client: Unused, publishing needs no OPC client
+        """
+        self._job()
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String naming PublishTask
+        """
+        return "PublishTask()"
@@ -6,10 +6,15 @@ Example:
     >>> queue = TaskQueue()
     >>> queue.put(task)
     >>> task = queue.get()
+    >>> queue.put_many([task1, task2])
+    >>> queue.get_many(10)  # [task1, task2]
 """
 from __future__ import print_function
 
-import Queue as queue_module
+import collections
+import threading
+
+POLICIES = ["block", "drop-oldest", "coalesce"]
 
 
 class TaskQueue:
@@ -18,6 +23,23 @@ class TaskQueue:
 
     Workers pull tasks from this queue for execution.
 
+    With a capacity, a put into a full queue applies the overload
+    policy:
+
+    - "block" waits until a worker takes a task, which holds back
+      the timer thread, or until the queue is closed
+    - "drop-oldest" sheds the oldest waiting task
+    - "coalesce" lets a waiting task that reads the same tags
+      absorb the new task, otherwise sheds the oldest waiting task
+
+    Shed tasks are told through Task.shed(), so their owner can
+    reschedule them. Sentinels are never limited.
+
+    In keyed mode a waiting task absorbs every later task for
+    its tags, full or not, so at most one read per tag waits.
+    Absorbed tasks are coalesced into the waiting read, which
+    publishes its results once.
+
     Example:
         >>> q = TaskQueue()
         >>> q.put(task1)
@@ -26,11 +48,32 @@ class TaskQueue:
         >>> q.get()  # Returns task2
     """
 
-    def __init__(self):
+    def __init__(self, capacity=0, policy="block", keyed=False):
         """
         Create an empty TaskQueue.
+
+        Args:
+            capacity: Maximum waiting tasks, 0 for unbounded
+            policy: Overload policy, one of POLICIES
+            keyed: Let waiting tasks absorb later tasks for their
+                tags at any fill level
+
+        Raises:
+            ValueError: If policy is unknown
         """
-        self._queue = queue_module.Queue()
+        if policy not in POLICIES:
+            raise ValueError("Unknown queue policy: %s" % policy)
+        self._capacity = capacity
+        self._policy = policy
+        self._keyed = keyed
+        self._indexed = keyed or policy == "coalesce"
+        self._waiting = {}
+        self._items = collections.deque()
+        self._size = 0
+        self._shed = 0
+        self._coalesced = 0
+        self._closed = False
+        self._condition = threading.Condition()
 
     def put(self, task):
         """
@@ -39,7 +82,118 @@ class TaskQueue:
         Args:
             task: Task to add (or None for shutdown sentinel)
         """
-        self._queue.put(task)
+        self.put_many([task])
+
+    def put_many(self, tasks):
+        """
+        Add several tasks under one lock acquisition.
+
+        Each task is handled as by put(), in order, but waiting
+        workers are woken once for the whole list.
+
+        Args:
+            tasks: List of tasks (or None sentinels)
+        """
+        shed = []
+        with self._condition:
+            for task in tasks:
+                self._add(task, shed)
+            self._condition.notify_all()
+        for item in shed:
+            item.shed()
+
+    def _add(self, task, shed):
+        """
+        Add one task with the condition held.
+
+        Args:
+            task: Task to add (or None for shutdown sentinel)
+            shed: List collecting tasks evicted to make room
+        """
+        if task is not None and self._keyed and self._absorbs(task):
+            return
+        if task is not None and self._full():
+            if self._policy == "block":
+                self._condition.notify_all()
+                while self._full() and not self._closed:
+                    self._condition.wait()
+                if self._full():
+                    self._shed += 1
+                    shed.append(task)
+                    return
+            elif self._absorbs(task):
+                return
+            else:
+                shed.append(self._evict())
+        self._items.append(task)
+        if task is not None:
+            self._size += 1
+            self._index(task)
+
+    def _full(self):
+        """
+        Check if the queue is at capacity.
+
+        Returns:
+            True if bounded and no room is left
+        """
+        return 0 < self._capacity <= self._size
+
+    def _absorbs(self, task):
+        """
+        Let a waiting task take over a new one.
+
+        Args:
+            task: Task about to be added
+
+        Returns:
+            True if a waiting task for the same tags absorbed it
+        """
+        if not self._indexed or not task.tags():
+            return False
+        host = self._waiting.get(task.tags()[0].text())
+        if host is None or not host.absorb(task):
+            return False
+        self._coalesced += 1
+        return True
+
+    def _index(self, task):
+        """
+        Remember a waiting task under each of its tags.
+
+        Args:
+            task: Task just added
+        """
+        if self._indexed:
+            for tag in task.tags():
+                self._waiting.setdefault(tag.text(), task)
+
+    def _forget(self, task):
+        """
+        Drop a task that stopped waiting from the index.
+
+        Args:
+            task: Task taken or shed
+        """
+        if self._indexed:
+            for tag in task.tags():
+                if self._waiting.get(tag.text()) is task:
+                    del self._waiting[tag.text()]
+
+    def _evict(self):
+        """
+        Remove the oldest waiting task.
+
+        Returns:
+            The removed task
+        """
+        for index, item in enumerate(self._items):
+            if item is not None:
+                del self._items[index]
+                self._size -= 1
+                self._shed += 1
+                self._forget(item)
+                return item
 
     def get(self):
         """
@@ -50,7 +204,70 @@ class TaskQueue:
         Returns:
             Next task from queue (or None sentinel)
         """
-        return self._queue.get()
+        return self.get_many(1)[0]
+
+    def get_many(self, limit):
+        """
+        Remove and return up to limit tasks at once.
+
+        Blocks until a task is available, then takes what is
+        waiting without blocking again. A sentinel is only ever
+        returned alone, so each worker takes exactly one.
+
+        Args:
+            limit: Maximum number of tasks to take
+
+        Returns:
+            Non-empty list of tasks, or [None] for a sentinel
+        """
+        with self._condition:
+            while not self._items:
+                self._condition.wait()
+            if self._items[0] is None:
+                self._items.popleft()
+                return [None]
+            tasks = []
+            while self._items and len(tasks) < limit:
+                if self._items[0] is None:
+                    break
+                task = self._items.popleft()
+                self._size -= 1
+                self._forget(task)
+                tasks.append(task)
+            self._condition.notify_all()
+            return tasks
+
+    def drain(self):
+        """
+        Remove every waiting task without blocking.
+
+        Sentinels stay in the queue.
+
+        Returns:
+            List of removed tasks in queue order
+        """
+        with self._condition:
+            tasks = [task for task in self._items if task is not None]
+            self._items = collections.deque(
+                task for task in self._items if task is None
+            )
+            self._size = 0
+            self._waiting = {}
+            self._condition.notify_all()
+            return tasks
+
+    def close(self):
+        """
+        Stop blocking producers.
+
+        A put waiting for room in a full queue, and every later one
+        that finds it full, sheds its task instead of waiting, so
+        shutdown cannot hang on a queue no worker drains. Taking
+        tasks is not affected.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
 
     def size(self):
         """
@@ -59,7 +276,22 @@ class TaskQueue:
         Returns:
             Number of tasks in queue
         """
-        return self._queue.qsize()
+        with self._condition:
+            return self._size
+
+    def stats(self):
+        """
+        Get queue counters.
+
+        Returns:
+            Dict with queue size, shed and coalesced task counts
+        """
+        with self._condition:
+            return {
+                "size": self._size,
+                "shed": self._shed,
+                "coalesced": self._coalesced
+            }
 
     def __repr__(self):
         """
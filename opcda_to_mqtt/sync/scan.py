@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+ScanClass assigning polling intervals to tags by pattern,
+and Chunk adapting the polling period of a group of tags.
+
+Example:
+    >>> alarms = ScanClass("*.Alarm*", Milliseconds(100))
+    >>> alarms.matches(TagPath("COM1.Alarm 1"))
+    True
+    >>> alarms.interval().amount()
+    100
+"""
+from __future__ import print_function
+
+import fnmatch
+
+from opcda_to_mqtt.result.optional import Empty
+
+
+class ScanClass:
+    """
+    Polling interval for tags matching a glob pattern.
+
+    With a ceiling, static tags of the class are polled less
+    often, down to once per ceiling.
+
+    Example:
+        >>> slow = ScanClass("*.Ambient*", Milliseconds(10000))
+        >>> slow.matches(TagPath("COM1.Flow"))
+        False
+    """
+
+    def __init__(self, pattern, interval, ceiling=Empty()):
+        """
+        Create a ScanClass.
+
+        Args:
+            pattern: Glob pattern for tag paths
+            interval: Milliseconds between reads of matching tags
+            ceiling: Optional Milliseconds of longest adaptive
+                period
+        """
+        self._pattern = pattern
+        self._interval = interval
+        self._ceiling = ceiling
+
+    def matches(self, tag):
+        """
+        Check if the class applies to a tag.
+
+        Args:
+            tag: TagPath to check
+
+        Returns:
+            True if tag path matches the pattern
+        """
+        return fnmatch.fnmatch(tag.text(), self._pattern)
+
+    def interval(self):
+        """
+        Get the polling interval.
+
+        Returns:
+            Milliseconds between reads
+        """
+        return self._interval
+
+    def ceiling(self):
+        """
+        Get the longest adaptive polling period.
+
+        Returns:
+            Optional Milliseconds, empty when not adaptive
+        """
+        return self._ceiling
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ScanClass pattern and interval
+        """
+        return "ScanClass(%r, %d)" % (self._pattern, self._interval.amount())
+
+
+class Chunk:
+    """
+    Tags read together and their polling periods.
+
+    Each tag has its own period. It starts at the base interval;
+    each read of the tag without a change of value or quality
+    doubles it, up to the ceiling, and any change drops it back
+    to the base interval. The chunk is read as often as its
+    fastest tag needs, and each read covers only the tags that
+    are due, so static tags sharing a chunk with busy ones are
+    skipped rather than read at the busy rate.
+
+    Times are counted on the chunk's own schedule, the sum of the
+    periods it was rescheduled with, so a late read does not make
+    every tag look due.
+
+    Example:
+        >>> chunk = Chunk([TagPath("A")], Milliseconds(500),
+        ...               Some(Milliseconds(4000)))
+        >>> chunk.observe(chunk.due(), [(1, "Good", "t0")])
+        0.5
+        >>> chunk.observe(chunk.due(), [(1, "Good", "t1")])
+        1.0
+        >>> chunk.observe(chunk.due(), [(2, "Good", "t2")])
+        0.5
+    """
+
+    def __init__(self, tags, interval, ceiling):
+        """
+        Create a Chunk.
+
+        Args:
+            tags: List of TagPath read together
+            interval: Milliseconds of base period
+            ceiling: Optional Milliseconds of longest period
+        """
+        self._tags = tags
+        self._base = interval.seconds()
+        self._top = ceiling.fold(
+            lambda: self._base, lambda c: max(self._base, c.seconds())
+        )
+        self._period = self._base
+        self._elapsed = 0.0
+        self._step = 0.0
+        self._last = {}
+        self._periods = {}
+        self._due = {}
+
+    def tags(self):
+        """
+        Get the tags of the chunk.
+
+        Returns:
+            List of TagPath
+        """
+        return self._tags
+
+    def period(self):
+        """
+        Get the current polling period.
+
+        Returns:
+            Seconds between reads of the chunk
+        """
+        return self._period
+
+    def due(self):
+        """
+        Move to the next read and get the tags it covers.
+
+        Called once per scheduled read. A tag is due once its own
+        period has passed, within half a base period; tags never
+        read are always due.
+
+        Returns:
+            List of TagPath to read, in chunk order
+        """
+        self._elapsed += self._step
+        self._step = self._period
+        limit = self._elapsed + self._base / 2
+        return [
+            tag for tag in self._tags
+            if self._due.get(tag.text(), 0.0) <= limit
+        ]
+
+    def observe(self, tags, results):
+        """
+        Adapt the periods of the tags that were read.
+
+        Args:
+            tags: List of TagPath that were read, any subset of
+                the chunk
+            results: List of (value, quality, timestamp) in tag order
+
+        Returns:
+            Seconds until the next read of the chunk
+        """
+        for tag, result in zip(tags, results):
+            key = tag.text()
+            current = (result[0], result[1])
+            if self._last.get(key) == current:
+                period = min(self._top, self._periods[key] * 2)
+            else:
+                period = self._base
+            self._last[key] = current
+            self._periods[key] = period
+            self._due[key] = self._elapsed + period
+        upcoming = min(
+            self._due.get(tag.text(), 0.0) for tag in self._tags
+        )
+        self._period = max(self._base, upcoming - self._elapsed)
+        self._step = self._period
+        return self._period
+
+    def rates(self):
+        """
+        Get reads per second of the chunk's tags.
+
+        Returns:
+            Tuple of (reads per second at base period,
+            reads per second at current periods)
+        """
+        size = float(len(self._tags))
+        actual = sum(
+            1.0 / self._periods.get(tag.text(), self._base)
+            for tag in self._tags
+        )
+        return size / self._base, actual
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Chunk size and period
+        """
+        return "Chunk(tags=%d, period=%.3f)" % (len(self._tags), self._period)
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+ShardedQueue giving each worker its own queue of tags.
+
+Example:
+    >>> queue = ShardedQueue([TaskQueue(), TaskQueue()], text_key)
+    >>> queue.put(BatchReadTask([TagPath("COM1.T1")], callback))
+    >>> worker = OpenOpcWorker(queue.shard(0), progid, host)
+"""
+from __future__ import print_function
+
+import bisect
+import collections
+import threading
+import zlib
+
+VNODES = 64
+
+
+def _hash(text):
+    """
+    Hash a string onto the ring.
+
+    Args:
+        text: String to hash
+
+    Returns:
+        Unsigned 32-bit hash
+    """
+    return zlib.crc32(text.encode("utf-8")) & 0xffffffff
+
+
+class ShardedQueue:
+    """
+    Queue that routes each task to the queue of one worker.
+
+    Tasks are placed on a consistent hash ring by the key of their
+    first tag, so the same tags always go to the same worker and
+    its OPC connection. Each worker waits on its own queue only,
+    so workers never contend for one lock.
+
+    When a worker fails its shard is retired: its points leave the
+    ring and its waiting tasks move to the shards that now own
+    their keys. Keys of the other shards keep their worker. Once
+    the worker reconnects its shard is restored.
+
+    Sentinels are dealt out to the shards in turn.
+
+    Example:
+        >>> queue = ShardedQueue([TaskQueue(), TaskQueue()], key)
+        >>> queue.put(task)
+        >>> queue.shard(0).get()  # If task hashes to shard 0
+    """
+
+    def __init__(self, queues, key):
+        """
+        Create a ShardedQueue.
+
+        Args:
+            queues: List of queues, one per worker
+            key: Function mapping TagPath to a shard key string
+        """
+        self._queues = queues
+        self._key = key
+        self._live = set(range(len(queues)))
+        self._ring = []
+        self._turn = 0
+        self._moved = 0
+        self._lock = threading.Lock()
+        self._build()
+
+    def _build(self):
+        """
+        Rebuild the ring from the live shards.
+
+        Must be called with the lock held.
+        """
+        self._ring = sorted(
+            (_hash("%d-%d" % (index, point)), index)
+            for index in self._live
+            for point in range(VNODES)
+        )
+
+    def shard(self, index):
+        """
+        Get the queue view of one worker.
+
+        Args:
+            index: Worker index
+
+        Returns:
+            Shard reading from that worker's queue
+        """
+        return Shard(self, index)
+
+    def put(self, task):
+        """
+        Add a task to the queue of its shard.
+
+        Args:
+            task: Task to add (or None for shutdown sentinel)
+        """
+        self.put_many([task])
+
+    def put_many(self, tasks):
+        """
+        Add several tasks, one put_many per shard.
+
+        Args:
+            tasks: List of tasks (or None sentinels)
+        """
+        routed = collections.OrderedDict()
+        orphans = []
+        with self._lock:
+            for task in tasks:
+                index = self._route(task)
+                if index is None:
+                    orphans.append(task)
+                else:
+                    routed.setdefault(index, []).append(task)
+        for index, items in routed.items():
+            self._queues[index].put_many(items)
+            if index not in self._live:
+                self._rescue(index)
+        for task in orphans:
+            task.shed()
+
+    def _route(self, task):
+        """
+        Pick the shard of a task.
+
+        Must be called with the lock held.
+
+        Args:
+            task: Task to route (or None sentinel)
+
+        Returns:
+            Shard index, or None when no shard is left
+        """
+        if task is None:
+            self._turn += 1
+            return (self._turn - 1) % len(self._queues)
+        if not self._ring:
+            return None
+        tags = task.tags()
+        point = _hash(self._key(tags[0]) if tags else "")
+        index = bisect.bisect(self._ring, (point, len(self._queues)))
+        return self._ring[index % len(self._ring)][1]
+
+    def retire(self, index):
+        """
+        Take a failed worker's shard off the ring.
+
+        Its waiting tasks are routed again to the live shards.
+
+        Args:
+            index: Worker index
+        """
+        with self._lock:
+            if index not in self._live:
+                return
+            self._live.discard(index)
+            self._build()
+        self._rescue(index)
+
+    def restore(self, index):
+        """
+        Put a recovered worker's shard back on the ring.
+
+        Its keys route to it again from the next put on.
+
+        Args:
+            index: Worker index
+        """
+        with self._lock:
+            if index in self._live:
+                return
+            self._live.add(index)
+            self._build()
+
+    def _rescue(self, index):
+        """
+        Move waiting tasks off a retired shard.
+
+        Args:
+            index: Index of the retired shard
+        """
+        tasks = self._queues[index].drain()
+        with self._lock:
+            self._moved += len(tasks)
+        if tasks:
+            self.put_many(tasks)
+
+    def get(self, index):
+        """
+        Remove and return the next task of a shard.
+
+        Args:
+            index: Worker index
+
+        Returns:
+            Next task (or None sentinel)
+        """
+        return self._queues[index].get()
+
+    def get_many(self, index, limit):
+        """
+        Remove and return up to limit tasks of a shard.
+
+        Args:
+            index: Worker index
+            limit: Maximum number of tasks to take
+
+        Returns:
+            Non-empty list of tasks, or [None] for a sentinel
+        """
+        return self._queues[index].get_many(limit)
+
+    def close(self):
+        """
+        Stop blocking producers of every shard.
+        """
+        for queue in self._queues:
+            queue.close()
+
+    def size(self):
+        """
+        Get number of waiting tasks over all shards.
+
+        Returns:
+            Number of tasks in queue
+        """
+        return sum(queue.size() for queue in self._queues)
+
+    def stats(self):
+        """
+        Get queue counters.
+
+        Returns:
+            Dict with total size, tasks moved off retired shards
+            and the counters of each shard
+        """
+        with self._lock:
+            live = set(self._live)
+            moved = self._moved
+        shards = []
+        for index, queue in enumerate(self._queues):
+            counters = dict(queue.stats())
+            counters["live"] = index in live
+            shards.append(counters)
+        return {"size": self.size(), "moved": moved, "shards": shards}
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ShardedQueue shard counts
+        """
+        with self._lock:
+            return "ShardedQueue(shards=%d, live=%d)" % (
+                len(self._queues), len(self._live)
+            )
+
+
+class Shard:
+    """
+    Queue view of one worker of a ShardedQueue.
+
+    Example:
+        >>> shard = queue.shard(0)
+        >>> task = shard.get()
+        >>> shard.retire()  # Worker failed, move its tasks
+    """
+
+    def __init__(self, parent, index):
+        """
+        Create a Shard.
+
+        Args:
+            parent: ShardedQueue owning the shard
+            index: Worker index
+        """
+        self._parent = parent
+        self._index = index
+
+    def put(self, task):
+        """
+        Add a task through the parent, which routes it.
+
+        Args:
+            task: Task to add (or None for shutdown sentinel)
+        """
+        self._parent.put(task)
+
+    def put_many(self, tasks):
+        """
+        Add several tasks through the parent, which routes them.
+
+        Args:
+            tasks: List of tasks (or None sentinels)
+        """
+        self._parent.put_many(tasks)
+
+    def get(self):
+        """
+        Remove and return the next task of this shard.
+
+        Returns:
+            Next task (or None sentinel)
+        """
+        return self._parent.get(self._index)
+
+    def get_many(self, limit):
+        """
+        Remove and return up to limit tasks of this shard.
+
+        Args:
+            limit: Maximum number of tasks to take
+
+        Returns:
+            Non-empty list of tasks, or [None] for a sentinel
+        """
+        return self._parent.get_many(self._index, limit)
+
+    def retire(self):
+        """
+        Take this shard off the ring after its worker failed.
+        """
+        self._parent.retire(self._index)
+
+    def restore(self):
+        """
+        Put this shard back on the ring after its worker recovered.
+        """
+        self._parent.restore(self._index)
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Shard index
+        """
+        return "Shard(%d)" % self._index
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Subscriber interface and ClientSubscriber implementation.
+
+Example:
+    >>> client = FakeSubscriptionClient({"Tag1": 42})
+    >>> subscriber = ClientSubscriber(client)
+    >>> subscriber.subscribe([TagPath("Tag1")], Milliseconds(500), callback)
+    >>> subscriber.start()
+    >>> client.change("Tag1", 43)
+    >>> subscriber.stop()
+    >>> subscriber.join()
+"""
+from __future__ import print_function
+
+from abc import ABCMeta, abstractmethod
+import threading
+
+import Queue as queue_module
+
+from opcda_to_mqtt.sync.backoff import Backoff
+
+
+class Subscriber:
+    """
+    Interface for data-change subscriptions.
+
+    Subscribers hold their own OPC connection and invoke the
+    callback whenever the server reports a changed tag.
+
+    Example:
+        >>> class MySubscriber(Subscriber):
+        ...     def subscribe(self, tags, rate, callback):
+        ...         self._tags = tags
+        ...     def start(self):
+        ...         self._thread.start()
+        ...     def stop(self):
+        ...         self._running = False
+        ...     def join(self):
+        ...         self._thread.join()
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def subscribe(self, tags, rate, callback):
+        """
+        Define the subscription before start.
+
+        Args:
+            tags: List of TagPath to subscribe
+            rate: Milliseconds requested update rate
+            callback: Function called with (tag, result) on change
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def start(self):
+        """
+        Start the subscriber thread.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stop(self):
+        """
+        Signal the subscriber to stop.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def join(self):
+        """
+        Wait for subscriber thread to finish.
+        """
+        raise NotImplementedError()
+
+
+class ClientSubscriber(Subscriber):
+    """
+    Subscriber driving a data-change client on its own thread.
+
+    The client is connected, subscribed and pumped for events
+    on the subscriber thread, which keeps COM objects on the
+    thread that created them.
+
+    A failing connect, subscribe or pump is passed to the failed
+    hook; the client is then closed and connected again after a
+    jittered exponential backoff, as poll workers do, until the
+    subscriber is stopped. A failing callback is passed to the
+    failed hook too, but keeps the connection.
+
+    Example:
+        >>> subscriber = ClientSubscriber(FakeSubscriptionClient({}))
+        >>> subscriber.subscribe(tags, Milliseconds(500), callback)
+        >>> subscriber.start()
+        >>> subscriber.stop()
+        >>> subscriber.join()
+    """
+
+    def __init__(self, client, pause=0.05, failed=lambda error: None,
+                 backoff=Backoff(1.0, 60.0)):
+        """
+        Create a ClientSubscriber.
+
+        Args:
+            client: Data-change client (connect, subscribe, pump, close)
+            pause: Seconds to wait for events per pump
+            failed: Function called with each error of the
+                client or the callback
+            backoff: Backoff between reconnect attempts
+        """
+        self._client = client
+        self._pause = pause
+        self._failed = failed
+        self._backoff = backoff
+        self._attempts = 0
+        self._restarts = 0
+        self._tags = {}
+        self._rate = None
+        self._callback = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+
+    def subscribe(self, tags, rate, callback):
+        """
+        Define the subscription before start.
+
+        Args:
+            tags: List of TagPath to subscribe
+            rate: Milliseconds requested update rate
+            callback: Function called with (tag, result) on change
+        """
+        self._tags = dict((tag.text(), tag) for tag in tags)
+        self._rate = rate
+        self._callback = callback
+
+    def start(self):
+        """
+        Start the subscriber thread.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Signal the subscriber thread to stop.
+        """
+        self._stopped.set()
+
+    def join(self):
+        """
+        Wait for subscriber thread to finish.
+        """
+        self._thread.join()
+
+    def _run(self):
+        """
+        Main subscriber loop.
+
+        Connects, subscribes, and pumps change events until
+        stopped, reconnecting after failures.
+        """
+        while True:
+            try:
+                self._listen()
+                return
+            except Exception as e:
+                self._lost(e)
+            if self._stopped.is_set():
+                return
+
+    def _listen(self):
+        """
+        Connect, subscribe and pump events until stopped.
+
+        Raises:
+            Exception: Error of the client
+        """
+        try:
+            self._client.connect()
+            self._client.subscribe(
+                sorted(self._tags.keys()), self._rate.amount(), self._change
+            )
+            self._attempts = 0
+            while not self._stopped.is_set():
+                self._client.pump(self._pause)
+        finally:
+            self._close()
+
+    def _lost(self, error):
+        """
+        Record a failure and wait before reconnecting.
+
+        Args:
+            error: Exception that cost the connection
+        """
+        self._restarts += 1
+        delay = self._backoff.delay(self._attempts)
+        self._attempts += 1
+        self._failed(error)
+        self._stopped.wait(delay)
+
+    def _close(self):
+        """
+        Close the client, ignoring errors of a broken connection.
+        """
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+    def stats(self):
+        """
+        Get subscriber counters.
+
+        Returns:
+            Dict with the number of failures that cost the
+            connection
+        """
+        return {"restarts": self._restarts}
+
+    def _change(self, name, value, quality, stamp):
+        """
+        Forward a change event to the callback.
+
+        A failing callback is reported without raising, so it does
+        not tear down the subscription.
+
+        Args:
+            name: Tag path string
+            value: New value
+            quality: Quality string
+            stamp: Timestamp string
+        """
+        tag = self._tags.get(name)
+        if tag is None:
+            return
+        try:
+            self._callback(tag, (value, quality, stamp))
+        except Exception as e:
+            self._failed(e)
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing ClientSubscriber and its tag count
+        """
+        return "ClientSubscriber(tags=%d)" % len(self._tags)
+
+
+class FakeSubscriptionClient:
+    """
+    Fake data-change client for testing.
+
+    Emits an initial notification for every subscribed tag and
+    one notification per change() that alters value or quality.
+    Events are delivered from pump(), on the subscriber thread.
+
+    Example:
+        >>> client = FakeSubscriptionClient({"Tag1": 42})
+        >>> client.subscribe(["Tag1"], 500, handler)
+        >>> client.change("Tag1", 43)
+        >>> client.pump(0.01)  # handler("Tag1", 43, "Good", ...)
+    """
+
+    def __init__(self, readings):
+        """
+        Create a FakeSubscriptionClient.
+
+        Args:
+            readings: Dict mapping tag paths to initial values
+        """
+        self._current = dict(
+            (tag, (value, "Good")) for tag, value in readings.items()
+        )
+        self._events = queue_module.Queue()
+        self._handler = None
+        self._lock = threading.Lock()
+        self._rate = None
+
+    def connect(self):
+        """
+        Simulate connection.
+        """
+        pass
+
+    def subscribe(self, tags, rate, handler):
+        """
+        Subscribe tags and queue their initial values.
+
+        Args:
+            tags: List of tag path strings
+            rate: Update rate in milliseconds
+            handler: Function called with (name, value, quality, stamp)
+        """
+        with self._lock:
+            self._handler = handler
+            self._rate = rate
+            for tag in tags:
+                value, quality = self._current.setdefault(tag, (0, "Good"))
+                self._events.put((tag, value, quality))
+
+    def change(self, tag, value, quality="Good"):
+        """
+        Simulate a server-side change of a tag.
+
+        Args:
+            tag: Tag path string
+            value: New value
+            quality: New quality string
+        """
+        with self._lock:
+            if self._current.get(tag) == (value, quality):
+                return
+            self._current[tag] = (value, quality)
+            self._events.put((tag, value, quality))
+
+    def pump(self, timeout):
+        """
+        Deliver queued change events.
+
+        Args:
+            timeout: Seconds to wait for the first event
+        """
+        try:
+            event = self._events.get(timeout=timeout)
+        except queue_module.Empty:
+            return
+        while True:
+            name, value, quality = event
+            self._handler(name, value, quality, "2024-01-01 00:00:00")
+            try:
+                event = self._events.get_nowait()
+            except queue_module.Empty:
+                return
+
+    def rate(self):
+        """
+        Get the subscribed update rate.
+
+        Returns:
+            Update rate in milliseconds or None
+        """
+        return self._rate
+
+    def close(self):
+        """
+        Simulate disconnection.
+        """
+        pass
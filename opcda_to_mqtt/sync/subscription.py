@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+SubscriptionBridge publishing OPC-DA data-change notifications.
+
+Example:
+    >>> bridge = SubscriptionBridge(subscribers, broker)
+    >>> bridge.start(tags, Milliseconds(500), "factory")
+    >>> bridge.stop()
+"""
+from __future__ import print_function
+
+import json
+import threading
+
+from opcda_to_mqtt.domain.value import TagValue
+from opcda_to_mqtt.domain.quality import OpcQuality
+from opcda_to_mqtt.filter.filter import PassFilter
+
+
+class SubscriptionBridge:
+    """
+    Publishes tags pushed by data-change subscriptions.
+
+    Alternative to Bridge: no queue, timer or polling, the server
+    reports changes at the requested rate and only changed tags
+    are encoded and published. A failing filter or publish is
+    counted and leaves the OPC subscription in place.
+
+    Example:
+        >>> bridge = SubscriptionBridge([subscriber], broker)
+        >>> bridge.start([TagPath("Tag1")], Milliseconds(500), "t")
+        >>> # Changes are published as the server reports them
+        >>> bridge.stop()
+    """
+
+    def __init__(self, subscribers, broker, filter=PassFilter()):
+        """
+        Create a SubscriptionBridge.
+
+        Args:
+            subscribers: List of Subscriber, one per OPC connection
+            broker: MqttBroker for publishing
+            filter: Filter deciding which changes are published
+        """
+        self._subscribers = subscribers
+        self._broker = broker
+        self._filter = filter
+        self._active = []
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def start(self, tags, interval, topic):
+        """
+        Split tags across subscribers and start them.
+
+        Args:
+            tags: List of TagPath to monitor
+            interval: Milliseconds requested update rate
+            topic: Base MQTT topic prefix
+        """
+        self._topic = topic
+        self._broker.connect()
+        count = len(self._subscribers)
+        share = (len(tags) + count - 1) // count
+        for index, subscriber in enumerate(self._subscribers):
+            part = tags[index * share:(index + 1) * share]
+            if not part:
+                continue
+            subscriber.subscribe(part, interval, self._publish)
+            subscriber.start()
+            self._active.append(subscriber)
+
+    def _publish(self, tag, result):
+        """
+        Publish a single tag change.
+
+        A failing filter or publish is counted instead of raised,
+        so an MQTT problem does not cost the OPC connection.
+
+        Args:
+            tag: TagPath that changed
+            result: Tuple of (value, quality, timestamp)
+        """
+        mqtt = tag.topic(self._topic)
+        try:
+            for value, quality, stamp in self._filter.apply(tag, result):
+                message = json.dumps({
+                    "value": TagValue(value).json(),
+                    "quality": OpcQuality(quality).text(),
+                    "timestamp": stamp
+                })
+                self._broker.publish(mqtt, message)
+        except Exception:
+            with self._lock:
+                self._failures += 1
+
+    def stats(self):
+        """
+        Get bridge counters.
+
+        Returns:
+            Dict with filter counters and publish errors
+        """
+        with self._lock:
+            failures = self._failures
+        return {
+            "filter": self._filter.stats(),
+            "publish": {"errors": failures}
+        }
+
+    def stop(self):
+        """
+        Stop the bridge.
+
+        Stops subscribers, waits for them, disconnects broker.
+        """
+        for subscriber in self._active:
+            subscriber.stop()
+        for subscriber in self._active:
+            subscriber.join()
+        self._broker.disconnect()
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing SubscriptionBridge configuration
+        """
+        return "SubscriptionBridge(subscribers=%d)" % len(self._subscribers)
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+SupervisedWorker keeping an OPC connection alive.
+
+Example:
+    >>> class MyWorker(SupervisedWorker):
+    ...     def _connect(self):
+    ...         return make_client()
+    >>> worker = MyWorker(queue)
+    >>> worker.start()
+"""
+from __future__ import print_function
+
+from abc import abstractmethod
+import threading
+
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.worker import Worker
+from opcda_to_mqtt.result.optional import Some, Empty
+
+
+class SupervisedWorker(Worker):
+    """
+    Worker that survives failing reads and lost connections.
+
+    A task that raises is failed, so its tags are reported with
+    "Error" quality and rescheduled by their owner. The worker
+    then drops its connection and reconnects, waiting a jittered
+    exponential backoff between failed attempts. Tasks taken but
+    not yet run wait for the new connection.
+
+    The failed hook is called with each error and the recovered
+    hook on each successful connect. stop() ends reconnecting;
+    a connected worker still runs until its sentinel.
+
+    A call that hangs can be abandoned from another thread: the
+    worker carries on in a fresh thread with a new connection.
+    Calls are timed from the moment they reach the OPC server, so
+    a task waiting for a read slot never counts as hung.
+
+    Example:
+        >>> worker = MyWorker(queue, failed=log_error)
+        >>> worker.start()
+        >>> worker.stats()
+        {'live': True, 'restarts': 0}
+    """
+
+    def __init__(self, queue, drain=1, failed=lambda error: None,
+                 recovered=lambda: None, backoff=Backoff(1.0, 60.0)):
+        """
+        Create a SupervisedWorker.
+
+        Args:
+            queue: TaskQueue to pull tasks from
+            drain: Maximum tasks taken from the queue at once
+            failed: Function called with each error that cost
+                the worker its connection
+            recovered: Function called after each connect
+            backoff: Backoff between reconnect attempts
+        """
+        self._queue = queue
+        self._drain = drain
+        self._failed = failed
+        self._recovered = recovered
+        self._backoff = backoff
+        self._attempts = 0
+        self._restarts = 0
+        self._live = False
+        self._pending = []
+        self._generation = 0
+        self._busy = Empty()
+        self._task = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = self._spawn(0)
+
+    @abstractmethod
+    def _connect(self):
+        """
+        Open a new OPC connection.
+
+        Returns:
+            Connected OPC client
+        """
+        raise NotImplementedError()
+
+    def _spawn(self, generation):
+        """
+        Create the thread of one generation of the worker.
+
+        Threads are daemons, so a call that never returns cannot
+        keep the process alive after the bridge stopped.
+
+        Args:
+            generation: Generation the thread serves
+
+        Returns:
+            Unstarted Thread
+        """
+        thread = threading.Thread(target=self._run, args=(generation,))
+        thread.daemon = True
+        return thread
+
+    def start(self):
+        """
+        Start the worker thread.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop reconnecting (Bridge sends sentinel to queue).
+        """
+        self._stopped.set()
+
+    def join(self):
+        """
+        Wait for the current worker thread to finish.
+        """
+        with self._lock:
+            thread = self._thread
+        thread.join()
+
+    def busy_since(self):
+        """
+        Get when the current OPC call started, connect or read.
+
+        Returns:
+            Optional monotonic start time, empty while idle
+        """
+        with self._lock:
+            return self._busy
+
+    def abandon(self, error):
+        """
+        Give up on a hung OPC call and carry on in a new thread.
+
+        The hung thread is left to finish on its own and exits
+        without touching the worker once its call returns. The
+        task it was running is failed, tasks it held wait for the
+        new thread.
+
+        Args:
+            error: Exception describing why the call was abandoned
+
+        Returns:
+            True if a call was in progress and was abandoned
+        """
+        with self._lock:
+            if not self._busy.is_present():
+                return False
+            self._generation += 1
+            self._busy = Empty()
+            self._live = False
+            self._restarts += 1
+            task = self._task
+            self._task = None
+            self._thread = self._spawn(self._generation)
+            thread = self._thread
+        if task is not None:
+            task.fail(error)
+        self._failed(error)
+        thread.start()
+        return True
+
+    def _claim(self, generation, task):
+        """
+        Mark a task as being executed.
+
+        Args:
+            generation: Generation of the calling thread
+            task: Task about to be executed
+
+        Returns:
+            False if the thread was abandoned meanwhile
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._task = task
+            return True
+
+    def _begin(self, generation):
+        """
+        Mark an OPC call as started.
+
+        Args:
+            generation: Generation of the calling thread
+
+        Returns:
+            False if the thread was abandoned meanwhile
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._busy = Some(monotonic())
+            return True
+
+    def _idle(self, generation):
+        """
+        Mark an OPC call of a task as finished.
+
+        Args:
+            generation: Generation of the calling thread
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._busy = Empty()
+
+    def _end(self, generation):
+        """
+        Mark a connect or the task being executed as finished.
+
+        Args:
+            generation: Generation of the calling thread
+
+        Returns:
+            False if the call was abandoned while it ran
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._busy = Empty()
+            self._task = None
+            return True
+
+    def _run(self, generation):
+        """
+        Main worker loop.
+
+        Connects, serves tasks until the sentinel, and reconnects
+        after failures until stopped. Tasks still held when the
+        worker stops are shed.
+
+        Args:
+            generation: Generation this thread serves
+        """
+        while not self._stopped.is_set():
+            if not self._begin(generation):
+                return
+            try:
+                client = self._connect()
+            except Exception as e:
+                if self._end(generation):
+                    self._lost(e)
+                    continue
+                return
+            if not self._end(generation):
+                self._close(client)
+                return
+            with self._lock:
+                self._live = True
+                self._attempts = 0
+            self._recovered()
+            try:
+                if self._serve(client, generation):
+                    return
+            finally:
+                self._close(client)
+        with self._lock:
+            held = self._pending if generation == self._generation else []
+            self._pending = []
+        for task in held:
+            if task is not None:
+                task.shed()
+
+    def _serve(self, client, generation):
+        """
+        Execute tasks on a connection.
+
+        Args:
+            client: Connected OPC client
+            generation: Generation of the calling thread
+
+        Returns:
+            True at the sentinel or once abandoned, False after a
+            failed task
+        """
+        while True:
+            with self._lock:
+                empty = not self._pending
+            if empty:
+                tasks = self._queue.get_many(self._drain)
+                with self._lock:
+                    self._pending.extend(tasks)
+            with self._lock:
+                task = self._pending.pop(0)
+            if task is None:
+                return True
+            if not self._claim(generation, task):
+                with self._lock:
+                    self._pending.insert(0, task)
+                return True
+            try:
+                task.execute(_Timed(client, self, generation))
+            except Exception as e:
+                if not self._end(generation):
+                    return True
+                task.fail(e)
+                self._lost(e)
+                return False
+            if not self._end(generation):
+                return True
+
+    def _lost(self, error):
+        """
+        Record a failure and wait before reconnecting.
+
+        Args:
+            error: Exception that cost the connection
+        """
+        with self._lock:
+            self._live = False
+            self._restarts += 1
+            delay = self._backoff.delay(self._attempts)
+            self._attempts += 1
+        self._failed(error)
+        self._stopped.wait(delay)
+
+    def _close(self, client):
+        """
+        Close a connection, ignoring errors of a broken one.
+
+        Args:
+            client: OPC client to close
+        """
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def stats(self):
+        """
+        Get worker health.
+
+        Returns:
+            Dict with connection state and reconnect count
+        """
+        with self._lock:
+            return {"live": self._live, "restarts": self._restarts}
+
+
+class _Timed:
+    """
+    OPC client proxy marking its worker busy during each read.
+    """
+
+    def __init__(self, client, worker, generation):
+        """
+        Create a _Timed proxy.
+
+        Args:
+            client: OPC client to pass calls to
+            worker: SupervisedWorker timing the reads
+            generation: Generation of the calling thread
+        """
+        self._client = client
+        self._worker = worker
+        self._generation = generation
+
+    def read(self, *args, **kwargs):
+        """
+        Read through the client while the worker counts as busy.
+
+        Returns:
+            Read result of the client
+        """
+        self._worker._begin(self._generation)
+        try:
+            return self._client.read(*args, **kwargs)
+        finally:
+            self._worker._idle(self._generation)
+
+    def __getattr__(self, name):
+        """
+        Pass other attributes on to the client.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Attribute of the client
+        """
+        return getattr(self._client, name)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """
-Task interface and ReadTask implementation.
+Task interface with ReadTask and BatchReadTask implementations.
 
 Example:
     >>> def callback(result):
@@ -11,6 +11,21 @@ Example:
 from __future__ import print_function
 
 from abc import ABCMeta, abstractmethod
+import threading
+
+MISSING = (None, "Error", None)
+
+
+class _Failure(tuple):
+    """
+    Result of a tag whose read raised.
+
+    Equal to MISSING, but a distinct object, so owners can tell a
+    failed read from an item the server answered with an error.
+    """
+
+
+FAILED = _Failure(MISSING)
 
 
 class Task:
@@ -36,6 +51,64 @@ class Task:
         """
         raise NotImplementedError()
 
+    def tags(self):
+        """
+        Get the tags the task reads.
+
+        Returns:
+            List of TagPath, empty for tasks without tags
+        """
+        return []
+
+    def shed(self):
+        """
+        Handle being dropped from the queue without execution.
+
+        Does nothing by default.
+        """
+
+    def fail(self, error):
+        """
+        Handle an error raised while executing.
+
+        Does nothing by default.
+
+        Args:
+            error: Exception raised by execute()
+        """
+
+    def absorb(self, other):
+        """
+        Take over a waiting task that reads the same tags.
+
+        Args:
+            other: Task that would read a subset of this task's tags
+
+        Returns:
+            True if other will be answered by this task, False
+            by default
+        """
+        return False
+
+    def coalesce(self):
+        """
+        Handle being answered by the read of a task that absorbed it.
+
+        The absorbing task publishes the results, so this task must
+        not publish them again. Does nothing by default.
+        """
+
+    def answer(self, found):
+        """
+        Deliver results read by another task.
+
+        Does nothing by default.
+
+        Args:
+            found: Dict mapping tag path strings to
+                (value, quality, timestamp)
+        """
+
 
 class ReadTask(Task):
     """
@@ -79,6 +152,34 @@ class ReadTask(Task):
         """
         return self._tag
 
+    def tags(self):
+        """
+        Get the tags the task reads.
+
+        Returns:
+            List with the TagPath to read
+        """
+        return [self._tag]
+
+    def answer(self, found):
+        """
+        Invoke callback with the result of this task's tag.
+
+        Args:
+            found: Dict mapping tag path strings to
+                (value, quality, timestamp)
+        """
+        self._callback(found.get(self._tag.text(), MISSING))
+
+    def fail(self, error):
+        """
+        Report the tag with "Error" quality.
+
+        Args:
+            error: Exception raised by execute()
+        """
+        self.answer({self._tag.text(): FAILED})
+
     def __repr__(self):
         """
         Return string representation.
@@ -87,3 +188,155 @@ class ReadTask(Task):
             String showing ReadTask and its tag
         """
         return "ReadTask(%r)" % self._tag
+
+
+class BatchReadTask(Task):
+    """
+    Task that reads several tags in one request and invokes callback.
+
+    Issues a single client.read with the list of tag paths and passes
+    the results, aligned with the tag order, to callback. A task may
+    read a wider list than it answers, so that a persistent OPC group
+    keeps the same items while the tags wanted change.
+
+    Example:
+        >>> results = []
+        >>> tags = [TagPath("Tag1"), TagPath("Tag2")]
+        >>> task = BatchReadTask(tags, lambda r: results.append(r))
+        >>> task.execute(client)  # One read for both tags
+    """
+
+    def __init__(self, tags, callback, skipped=lambda: None, reads=None):
+        """
+        Create a BatchReadTask.
+
+        Args:
+            tags: List of TagPath to read
+            callback: Function to call with list of read results
+            skipped: Function to call if the task is shed unread
+            reads: List of TagPath requested from the server, a
+                superset of tags; tags when None
+        """
+        self._tags = list(tags)
+        self._reads = self._tags if reads is None else list(reads)
+        self._callback = callback
+        self._skipped = skipped
+        self._riders = []
+        self._answered = False
+        self._lock = threading.Lock()
+
+    def execute(self, client):
+        """
+        Read all tags at once and invoke callback.
+
+        Results are matched to tags by name, so a server that
+        reorders or omits items does not shift values between tags.
+        Omitted items are reported with "Error" quality. Absorbed
+        tasks are coalesced into the same read.
+
+        Args:
+            client: OpenOPC client instance
+        """
+        names = [tag.text() for tag in self._reads]
+        found = {}
+        for item in client.read(names, sync=True):
+            found[item[0]] = tuple(item[1:])
+        self.answer(found)
+
+    def answer(self, found):
+        """
+        Invoke callback and release absorbed tasks.
+
+        Only the first answer counts, so a hung read that returns
+        after the task was failed is dropped. Absorbed tasks are
+        coalesced, not answered, so the results are published and
+        counted once; they are released even if the callback raises.
+
+        Args:
+            found: Dict mapping tag path strings to
+                (value, quality, timestamp)
+        """
+        with self._lock:
+            if self._answered:
+                return
+            self._answered = True
+        names = [tag.text() for tag in self._tags]
+        try:
+            self._callback([found.get(name, MISSING) for name in names])
+        finally:
+            for rider in self._riders:
+                rider.coalesce()
+
+    def coalesce(self):
+        """
+        Report that another task read the tags of this one.
+
+        The task counts as skipped instead of invoking the callback,
+        and its own absorbed tasks are coalesced with it.
+        """
+        with self._lock:
+            if self._answered:
+                return
+            self._answered = True
+        try:
+            self._skipped()
+        finally:
+            for rider in self._riders:
+                rider.coalesce()
+
+    def fail(self, error):
+        """
+        Report every tag with "Error" quality unless already answered.
+
+        The owner thus reschedules the tags as after any read.
+        Each result is FAILED.
+
+        Args:
+            error: Exception raised by execute()
+        """
+        self.answer(dict((tag.text(), FAILED) for tag in self._tags))
+
+    def absorb(self, other):
+        """
+        Take over another task if it reads no other tags.
+
+        Args:
+            other: Task waiting to read
+
+        Returns:
+            True if every tag of other is read by this task
+        """
+        names = set(tag.text() for tag in self._tags)
+        wanted = [tag.text() for tag in other.tags()]
+        if not wanted or not all(name in names for name in wanted):
+            return False
+        self._riders.append(other)
+        return True
+
+    def tags(self):
+        """
+        Get the tag paths.
+
+        Returns:
+            List of TagPath to read
+        """
+        return list(self._tags)
+
+    def shed(self):
+        """
+        Report that the read was dropped unexecuted.
+
+        Absorbed tasks are shed with it.
+        """
+        self._skipped()
+        for rider in self._riders:
+            rider.shed()
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing BatchReadTask and its tag count
+        """
+        return "BatchReadTask(tags=%d)" % len(self._tags)
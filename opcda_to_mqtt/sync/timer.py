@@ -12,8 +12,11 @@ Example:
 from __future__ import print_function
 
 import heapq
+import itertools
 import threading
-import time
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.histogram import Histogram, LATENESS_BOUNDS
 
 
 class TimerThread:
@@ -21,7 +24,9 @@ class TimerThread:
     Single thread for all delayed callbacks.
 
     Schedules callbacks to fire after a delay.
-    Uses a heap for efficient ordering.
+    Uses a heap for efficient ordering and a monotonic clock,
+    so wall-clock steps do not move deadlines. How late each
+    callback fires is recorded in a histogram.
 
     Example:
         >>> timer = TimerThread()
@@ -34,12 +39,18 @@ class TimerThread:
         1
     """
 
-    def __init__(self):
+    def __init__(self, clock=monotonic):
         """
         Create a TimerThread.
 
         Initializes heap, condition, and running flag.
+
+        Args:
+            clock: Function returning monotonic time in seconds
         """
+        self._clock = clock
+        self._lateness = Histogram(LATENESS_BOUNDS)
+        self._order = itertools.count()
         self._heap = []
         self._condition = threading.Condition()
         self._running = False
@@ -71,9 +82,10 @@ class TimerThread:
             delay: Seconds to wait before firing
             callback: Function to call (no arguments)
         """
-        fire = time.time() + delay
+        fire = self._clock() + delay
         with self._condition:
-            heapq.heappush(self._heap, (fire, callback))
+            entry = (fire, next(self._order), callback)
+            heapq.heappush(self._heap, entry)
             self._condition.notify()
 
     def _run(self):
@@ -88,9 +100,10 @@ class TimerThread:
                     self._condition.wait()
                     continue
                 fire = self._heap[0][0]
-                now = time.time()
+                now = self._clock()
                 if now >= fire:
-                    _, callback = heapq.heappop(self._heap)
+                    _, _, callback = heapq.heappop(self._heap)
+                    self._lateness.record(now - fire)
                     self._condition.release()
                     try:
                         callback()
@@ -109,6 +122,18 @@ class TimerThread:
         with self._condition:
             return len(self._heap)
 
+    def stats(self):
+        """
+        Get timer counters.
+
+        Returns:
+            Dict with pending count and lateness histogram
+        """
+        return {
+            "pending": self.pending(),
+            "lateness": self._lateness.stats()
+        }
+
     def __repr__(self):
         """
         Return string representation.
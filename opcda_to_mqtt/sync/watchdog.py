@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Watchdog abandoning OPC calls that hang.
+
+Example:
+    >>> watchdog = Watchdog(workers, 30.0)
+    >>> watchdog.start()
+    >>> watchdog.stats()["stuck"]
+    0
+    >>> watchdog.stop()
+"""
+from __future__ import print_function
+
+import threading
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.histogram import Histogram
+
+STUCK_BOUNDS = [1000, 2000, 5000, 10000, 30000, 60000, 300000]
+
+
+class StuckRead(Exception):
+    """
+    Error given to tasks whose OPC call passed the deadline.
+    """
+
+
+class Watchdog:
+    """
+    Thread checking that no worker call runs past a deadline.
+
+    A few times per deadline it asks each worker when its current
+    OPC call started. A worker whose call is older than the
+    deadline is told to abandon it, which fails the task so its
+    tags are rescheduled, and to carry on in a new thread with a
+    new connection.
+
+    Example:
+        >>> watchdog = Watchdog(workers, 10.0)
+        >>> watchdog.check()  # Abandons calls older than 10 s
+    """
+
+    def __init__(self, workers, deadline, clock=monotonic):
+        """
+        Create a Watchdog.
+
+        Args:
+            workers: List of SupervisedWorker to watch
+            deadline: Seconds an OPC call may take
+            clock: Function returning monotonic time in seconds
+        """
+        self._workers = workers
+        self._deadline = deadline
+        self._clock = clock
+        self._stuck = 0
+        self._durations = Histogram(STUCK_BOUNDS)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        """
+        Start the watchdog thread.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the watchdog thread and wait for it.
+        """
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        """
+        Main loop checking the workers four times per deadline.
+        """
+        period = max(0.05, self._deadline / 4.0)
+        while not self._stopped.wait(period):
+            self.check()
+
+    def check(self):
+        """
+        Abandon every call older than the deadline.
+
+        Returns:
+            Number of calls abandoned
+        """
+        now = self._clock()
+        abandoned = 0
+        for worker in self._workers:
+            age = worker.busy_since().fold(
+                lambda: 0.0, lambda started: now - started
+            )
+            if age <= self._deadline:
+                continue
+            error = StuckRead("OPC call hung for %.1f s" % age)
+            if worker.abandon(error):
+                self._durations.record(age)
+                abandoned += 1
+        with self._lock:
+            self._stuck += abandoned
+        return abandoned
+
+    def stats(self):
+        """
+        Get watchdog counters.
+
+        Returns:
+            Dict with abandoned call count and histogram of their
+            age when abandoned
+        """
+        with self._lock:
+            stuck = self._stuck
+        return {"stuck": stuck, "duration": self._durations.stats()}
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing Watchdog deadline and worker count
+        """
+        return "Watchdog(deadline=%r, workers=%d)" % (
+            self._deadline, len(self._workers)
+        )
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+WheelTimer for scheduling very many periodic callbacks.
+
+Example:
+    >>> timer = WheelTimer(0.01, 512)
+    >>> timer.start()
+    >>> timer.schedule(0.1, lambda: print("fired"))
+    >>> time.sleep(0.2)
+    >>> timer.stop()
+"""
+from __future__ import print_function
+
+import math
+import threading
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.histogram import Histogram, LATENESS_BOUNDS
+
+
+class WheelTimer:
+    """
+    Hashed timing wheel with the TimerThread interface.
+
+    Time is divided into ticks and callbacks are hashed into one
+    of a fixed number of slots by their tick. Scheduling is O(1)
+    and never wakes the thread; the thread wakes once per tick and
+    fires the whole slot in one batch. Delays longer than a full
+    turn of the wheel wait the number of turns kept with them.
+
+    Callbacks fire at tick granularity, never early and up to one
+    tick late.
+
+    Example:
+        >>> timer = WheelTimer(0.01, 512)
+        >>> timer.start()
+        >>> fired = []
+        >>> timer.schedule(0.05, lambda: fired.append(1))
+        >>> time.sleep(0.1)
+        >>> timer.stop()
+        >>> len(fired)
+        1
+    """
+
+    def __init__(self, tick, slots, clock=monotonic):
+        """
+        Create a WheelTimer.
+
+        Args:
+            tick: Seconds per slot
+            slots: Number of slots in the wheel
+            clock: Function returning monotonic time in seconds
+        """
+        self._tick = tick
+        self._wheel = [[] for _ in range(slots)]
+        self._clock = clock
+        self._origin = clock()
+        self._lateness = Histogram(LATENESS_BOUNDS)
+        self._cursor = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+
+    def start(self):
+        """
+        Start the timer thread.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the timer thread.
+
+        Signals thread to stop and waits for it.
+        """
+        self._stopped.set()
+        self._thread.join()
+
+    def schedule(self, delay, callback):
+        """
+        Schedule a callback after delay seconds.
+
+        Args:
+            delay: Seconds to wait before firing
+            callback: Function to call (no arguments)
+        """
+        fire = self._clock() + delay
+        target = int(math.ceil((fire - self._origin) / self._tick))
+        with self._lock:
+            ticks = max(1, target - self._cursor)
+            turns = (ticks - 1) // len(self._wheel)
+            slot = (self._cursor + ticks) % len(self._wheel)
+            self._wheel[slot].append((turns, fire, callback))
+            self._count += 1
+
+    def _run(self):
+        """
+        Main loop of the timer thread.
+
+        Advances the cursor one slot per elapsed tick and fires
+        the due callbacks of each slot outside the lock.
+        """
+        while not self._stopped.is_set():
+            due = self._origin + (self._cursor + 1) * self._tick
+            wait = due - self._clock()
+            if wait > 0:
+                self._stopped.wait(wait)
+                continue
+            now = self._clock()
+            for fire, callback in self._advance():
+                self._lateness.record(now - fire)
+                callback()
+
+    def _advance(self):
+        """
+        Move the cursor to the next slot.
+
+        Returns:
+            List of (deadline, callback) due in that slot
+        """
+        with self._lock:
+            self._cursor += 1
+            slot = self._cursor % len(self._wheel)
+            fired = []
+            kept = []
+            for turns, fire, callback in self._wheel[slot]:
+                if turns:
+                    kept.append((turns - 1, fire, callback))
+                else:
+                    fired.append((fire, callback))
+            self._wheel[slot] = kept
+            self._count -= len(fired)
+        return fired
+
+    def pending(self):
+        """
+        Get number of pending callbacks.
+
+        Returns:
+            Number of scheduled callbacks
+        """
+        with self._lock:
+            return self._count
+
+    def stats(self):
+        """
+        Get timer counters.
+
+        Returns:
+            Dict with pending count and lateness histogram
+        """
+        return {
+            "pending": self.pending(),
+            "lateness": self._lateness.stats()
+        }
+
+    def __repr__(self):
+        """
+        Return string representation.
+
+        Returns:
+            String showing WheelTimer state
+        """
+        return "WheelTimer(slots=%d, pending=%d)" % (
+            len(self._wheel), self.pending()
+        )
@@ -55,6 +55,16 @@ class Worker:
         """
         raise NotImplementedError()
 
+    def stats(self):
+        """
+        Get worker health.
+
+        Returns:
+            Dict with connection state and reconnect count,
+            live with no reconnects by default
+        """
+        return {"live": True, "restarts": 0}
+
 
 class FakeWorker(Worker):
     """
@@ -72,15 +82,21 @@ class FakeWorker(Worker):
         >>> worker.join()
     """
 
-    def __init__(self, queue, readings):
+    def __init__(self, queue, readings, drain=1, failed=lambda error: None):
         """
         Create a FakeWorker.
 
         Args:
             queue: TaskQueue to pull tasks from
             readings: Dict mapping tag paths to values
+            drain: Maximum tasks taken from the queue at once
+            failed: Function called with the error that stopped
+                the worker
         """
         self._queue = queue
+        self._drain = drain
+        self._failed = failed
+        self._wakeups = 0
         self._client = FakeOpcClient(readings)
         self._thread = threading.Thread(target=self._run)
         self._executed = []
@@ -105,18 +121,30 @@ class FakeWorker(Worker):
         self._thread.join()
 
     def _run(self):
+        """
+        Thread body reporting the error that stopped the loop.
+        """
+        try:
+            self._serve()
+        except Exception as e:
+            self._failed(e)
+
+    def _serve(self):
         """
         Main worker loop.
 
         Pulls and executes tasks until sentinel.
         """
         while True:
-            task = self._queue.get()
-            if task is None:
+            tasks = self._queue.get_many(self._drain)
+            if tasks[0] is None:
                 break
             with self._lock:
-                self._executed.append(task)
-            task.execute(self._client)
+                self._wakeups += 1
+            for task in tasks:
+                with self._lock:
+                    self._executed.append(task)
+                task.execute(self._client)
 
     def executed(self):
         """
@@ -128,6 +156,25 @@ class FakeWorker(Worker):
         with self._lock:
             return list(self._executed)
 
+    def stats(self):
+        """
+        Get worker health.
+
+        Returns:
+            Dict with thread state and reconnect count
+        """
+        return {"live": self._thread.is_alive(), "restarts": 0}
+
+    def wakeups(self):
+        """
+        Get number of times the worker took tasks from the queue.
+
+        Returns:
+            Count of get_many calls that returned tasks
+        """
+        with self._lock:
+            return self._wakeups
+
 
 class FakeOpcClient:
     """
@@ -139,6 +186,8 @@ class FakeOpcClient:
         >>> client = FakeOpcClient({"Tag1": 42})
         >>> client.read("Tag1", sync=True)
         (42, 'Good', ...)
+        >>> client.read(["Tag1"], sync=True)
+        [('Tag1', 42, 'Good', ...)]
     """
 
     def __init__(self, readings):
@@ -149,21 +198,54 @@ class FakeOpcClient:
             readings: Dict mapping tag paths to values
         """
         self._readings = dict(readings)
+        self._groups = {}
 
-    def read(self, tag, sync=True):
+    def read(self, tag=None, group=None, sync=True):
         """
-        Read a tag value.
+        Read a tag value or a list of tag values.
+
+        A list read with a group name defines that group,
+        a read with only a group name reads its items.
 
         Args:
-            tag: Tag path string
+            tag: Tag path string or list of tag path strings
+            group: Group name (optional)
             sync: Synchronous read flag (ignored)
 
+        Returns:
+            Tuple of (value, quality, timestamp) for a single tag,
+            list of (name, value, quality, timestamp) for a list
+        """
+        if group is not None:
+            if tag is None:
+                tag = self._groups[group]
+            self._groups[group] = list(tag)
+        if isinstance(tag, list):
+            return [(name,) + self._sample(name) for name in tag]
+        return self._sample(tag)
+
+    def _sample(self, tag):
+        """
+        Build the read result for one tag.
+
+        Args:
+            tag: Tag path string
+
         Returns:
             Tuple of (value, quality, timestamp)
         """
         value = self._readings.get(tag, 0)
         return (value, "Good", "2024-01-01 00:00:00")
 
+    def remove(self, group):
+        """
+        Remove a group.
+
+        Args:
+            group: Group name
+        """
+        self._groups.pop(group, None)
+
     def connect(self, progid):
         """
         Simulate connection.
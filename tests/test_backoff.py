@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Backoff.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.sync.backoff import Backoff
+
+logging.disable(logging.CRITICAL)
+
+
+class TestBackoff(unittest.TestCase):
+    """Tests for Backoff."""
+
+    def test_backoff_doubles_per_attempt(self):
+        backoff = Backoff(1.0, 1000.0, lambda: 1.0)
+        self.assertEqual(
+            [backoff.delay(n) for n in range(4)],
+            [1.0, 2.0, 4.0, 8.0],
+            "Backoff should double the delay per attempt"
+        )
+
+    def test_backoff_stops_at_ceiling(self):
+        ceiling = random.uniform(5.0, 60.0)
+        backoff = Backoff(1.0, ceiling, lambda: 1.0)
+        self.assertEqual(
+            backoff.delay(random.randint(10, 1000)),
+            ceiling,
+            "Backoff should never exceed its ceiling"
+        )
+
+    def test_backoff_jitters_down_to_half(self):
+        backoff = Backoff(2.0, 60.0)
+        delays = [backoff.delay(2) for _ in range(100)]
+        self.assertTrue(
+            all(4.0 <= d <= 8.0 for d in delays) and len(set(delays)) > 1,
+            "Backoff should jitter between half and full delay"
+        )
+
+    def test_backoff_repr_shows_bounds(self):
+        self.assertEqual(
+            repr(Backoff(1.0, 60.0)),
+            "Backoff(1.0, 60.0)",
+            "Backoff repr should show base and ceiling"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TagBreaker and NoBreaker.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.sync.breaker import NoBreaker, TagBreaker
+from opcda_to_mqtt.sync.task import FAILED
+from opcda_to_mqtt.domain.path import TagPath
+
+logging.disable(logging.CRITICAL)
+
+BAD = (None, "Bad", None)
+ERROR = (None, "Error", None)
+GOOD = (1, "Good", "2024-01-01 00:00:00")
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _texts(admitted):
+    """
+    Get the path strings of admitted tags.
+
+    Args:
+        admitted: Tuple of (batch, alone) lists of TagPath
+
+    Returns:
+        Tuple of (batch, alone) lists of tag path strings
+    """
+    return tuple([tag.text() for tag in tags] for tags in admitted)
+
+
+class TestTagBreaker(unittest.TestCase):
+    """Tests for TagBreaker."""
+
+    def test_breaker_trips_after_threshold(self):
+        threshold = random.randint(2, 10)
+        breaker = TagBreaker(threshold, 60.0, Clock())
+        tags = [TagPath("A"), TagPath("B")]
+        admitted = []
+        for _ in range(threshold):
+            admitted.append(_texts(breaker.admit(tags)))
+            breaker.observe(tags, [GOOD, random.choice([BAD, ERROR])])
+        self.assertEqual(
+            (admitted[-1], _texts(breaker.admit(tags))),
+            ((["A", "B"], []), (["A"], [])),
+            "TagBreaker should hold a tag back after threshold bad reads"
+        )
+
+    def test_breaker_resets_count_on_good_read(self):
+        breaker = TagBreaker(3, 60.0, Clock())
+        tags = [TagPath("A")]
+        for result in [BAD, BAD, GOOD, BAD, BAD]:
+            breaker.observe(tags, [result])
+        self.assertEqual(
+            _texts(breaker.admit(tags)),
+            (["A"], []),
+            "TagBreaker should only count consecutive bad reads"
+        )
+
+    def test_breaker_probes_once_per_period(self):
+        clock = Clock()
+        probe = random.uniform(10.0, 100.0)
+        breaker = TagBreaker(1, probe, clock)
+        tags = [TagPath("A")]
+        breaker.observe(tags, [BAD])
+        seen = []
+        for now in [probe / 2, probe, probe + 1, 2 * probe]:
+            clock.now = now
+            seen.append(len(breaker.admit(tags)[1]))
+        self.assertEqual(
+            seen,
+            [0, 1, 0, 1],
+            "TagBreaker should let one probe through per probe period"
+        )
+
+    def test_breaker_closes_on_good_probe(self):
+        clock = Clock()
+        breaker = TagBreaker(1, 5.0, clock)
+        tags = [TagPath("A")]
+        breaker.observe(tags, [ERROR])
+        clock.now = 5.0
+        breaker.observe(breaker.admit(tags)[1], [GOOD])
+        self.assertEqual(
+            (_texts(breaker.admit(tags)), breaker.stats()),
+            ((["A"], []), {
+                "tripped": [], "isolated": [], "trips": 1, "recoveries": 1
+            }),
+            "TagBreaker should read a tag again after a good probe"
+        )
+
+    def test_breaker_bad_probe_keeps_tag_tripped(self):
+        clock = Clock()
+        breaker = TagBreaker(2, 5.0, clock)
+        tags = [TagPath("A")]
+        breaker.observe(tags, [BAD])
+        breaker.observe(tags, [BAD])
+        clock.now = 5.0
+        breaker.observe(breaker.admit(tags)[1], [BAD])
+        self.assertEqual(
+            breaker.stats(),
+            {"tripped": ["A"], "isolated": [], "trips": 1, "recoveries": 0},
+            "TagBreaker should trip a tag only once while it stays bad"
+        )
+
+    def test_breaker_ignores_uncertain_quality(self):
+        breaker = TagBreaker(1, 60.0, Clock())
+        tags = [TagPath("A")]
+        breaker.observe(tags, [(1, "Uncertain", None)])
+        self.assertEqual(
+            _texts(breaker.admit(tags)),
+            (["A"], []),
+            "TagBreaker should only count Bad and Error reads"
+        )
+
+    def test_breaker_isolates_tags_of_failed_batch(self):
+        threshold = random.randint(1, 5)
+        breaker = TagBreaker(threshold, 60.0, Clock())
+        tags = [TagPath("A"), TagPath("B")]
+        for _ in range(threshold + 1):
+            breaker.observe(tags, [FAILED, FAILED])
+        self.assertEqual(
+            (_texts(breaker.admit(tags)), breaker.stats()["trips"]),
+            (([], ["A", "B"]), 0),
+            "TagBreaker should read tags of a failed batch alone"
+        )
+
+    def test_breaker_blames_failing_tag_read_alone(self):
+        breaker = TagBreaker(2, 60.0, Clock())
+        tags = [TagPath("A"), TagPath("Bad")]
+        breaker.observe(tags, [FAILED, FAILED])
+        for _ in range(2):
+            breaker.observe([tags[0]], [GOOD])
+            breaker.observe([tags[1]], [FAILED])
+        self.assertEqual(
+            (_texts(breaker.admit(tags)), breaker.stats()["tripped"]),
+            ((["A"], []), ["Bad"]),
+            "TagBreaker should put good tags back and trip the bad one"
+        )
+
+    def test_breaker_repr_shows_tripped(self):
+        breaker = TagBreaker(1, 60.0, Clock())
+        breaker.observe([TagPath("A"), TagPath("B")], [BAD, GOOD])
+        self.assertEqual(
+            repr(breaker),
+            "TagBreaker(threshold=1, tripped=1)",
+            "TagBreaker repr should show threshold and tripped count"
+        )
+
+
+class TestNoBreaker(unittest.TestCase):
+    """Tests for NoBreaker."""
+
+    def test_no_breaker_admits_every_tag(self):
+        tags = [TagPath("T%d" % i) for i in range(random.randint(1, 10))]
+        breaker = NoBreaker()
+        breaker.observe(tags, [ERROR] * len(tags))
+        self.assertEqual(
+            (breaker.admit(tags), breaker.stats()),
+            ((tags, []), {}),
+            "NoBreaker should never hold tags back"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,20 +8,195 @@ import json
 import logging
 import random
 import string
+import threading
 import time
 import unittest
 
 from opcda_to_mqtt.sync.bridge import Bridge
 from opcda_to_mqtt.sync.queue import TaskQueue
 from opcda_to_mqtt.sync.timer import TimerThread
-from opcda_to_mqtt.sync.worker import FakeWorker
+from opcda_to_mqtt.sync.worker import FakeWorker, FakeOpcClient
+from opcda_to_mqtt.sync.scan import ScanClass
+from opcda_to_mqtt.sync.publish import PublishStage
+from opcda_to_mqtt.sync.watchdog import Watchdog
+from opcda_to_mqtt.sync.breaker import TagBreaker
+from opcda_to_mqtt.sync.group import GroupedClient
+from opcda_to_mqtt.sync.shard import ShardedQueue
 from opcda_to_mqtt.mqtt.fake import FakeMqttBroker
 from opcda_to_mqtt.domain.path import TagPath
 from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.filter.exception import ExceptionFilter
+from opcda_to_mqtt.filter.filter import PassFilter
+from opcda_to_mqtt.result.optional import Some, Empty
 
 logging.disable(logging.CRITICAL)
 
 
+class ManualTimer:
+    """Timer recording scheduled delays without firing them."""
+
+    def __init__(self):
+        """
+        Create a ManualTimer.
+        """
+        self.delays = []
+        self.callbacks = []
+
+    def start(self):
+        """
+        Do nothing.
+        """
+
+    def stop(self):
+        """
+        Do nothing.
+        """
+
+    def schedule(self, delay, callback):
+        """
+        Record the delay and callback.
+
+        Args:
+            delay: Seconds to wait before firing
+            callback: Function to call
+        """
+        self.delays.append(delay)
+        self.callbacks.append(callback)
+
+    def stats(self):
+        """
+        Get timer counters.
+
+        Returns:
+            Dict with pending count
+        """
+        return {"pending": len(self.delays)}
+
+
+class BrokenFilter(PassFilter):
+    """Filter that raises on its first result."""
+
+    def __init__(self):
+        """
+        Create a BrokenFilter.
+        """
+        self.calls = 0
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Raise once, then pass results through.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional monotonic time the result was read
+
+        Returns:
+            List with the result
+        """
+        self.calls += 1
+        if self.calls == 1:
+            raise ValueError("filter failed")
+        return PassFilter.apply(self, tag, result, read)
+
+
+class ChangingClient(FakeOpcClient):
+    """Fake OPC client counting groups, with tags that keep changing."""
+
+    def __init__(self, busy):
+        """
+        Create a ChangingClient.
+
+        Args:
+            busy: List of tag path strings whose value changes on
+                every read
+        """
+        FakeOpcClient.__init__(self, {})
+        self._busy = busy
+        self._reads = 0
+        self.added = 0
+        self.removed = 0
+
+    def read(self, tag=None, group=None, sync=True):
+        """
+        Read tags, counting groups defined by the read.
+
+        Args:
+            tag: Tag path string or list of tag path strings
+            group: Group name (optional)
+            sync: Synchronous read flag (ignored)
+
+        Returns:
+            Read result of FakeOpcClient
+        """
+        self._reads += 1
+        if group is not None and tag is not None:
+            self.added += 1
+        return FakeOpcClient.read(self, tag, group, sync)
+
+    def _sample(self, tag):
+        """
+        Build the read result for one tag.
+
+        Args:
+            tag: Tag path string
+
+        Returns:
+            Tuple of (value, quality, timestamp)
+        """
+        value = self._reads if tag in self._busy else 0
+        return (value, "Good", "2024-01-01 00:00:00")
+
+    def remove(self, group):
+        """
+        Count and remove a group.
+
+        Args:
+            group: Group name
+        """
+        self.removed += 1
+        FakeOpcClient.remove(self, group)
+
+
+class ThrowingClient(FakeOpcClient):
+    """Fake OPC client whose reads raise when they include Bad."""
+
+    def read(self, tag=None, group=None, sync=True):
+        """
+        Read tags, raising for any read of Bad.
+
+        Args:
+            tag: Tag path string or list of tag path strings
+            group: Group name (optional)
+            sync: Synchronous read flag (ignored)
+
+        Returns:
+            Read result of FakeOpcClient
+        """
+        if "Bad" in (tag if isinstance(tag, list) else [tag]):
+            raise IOError("device unplugged")
+        return FakeOpcClient.read(self, tag, group, sync)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        """
+        Create a Clock at zero.
+        """
+        self.now = 0.0
+
+    def __call__(self):
+        """
+        Get current time.
+
+        Returns:
+            Current time in seconds
+        """
+        return self.now
+
+
 class TestBridge(unittest.TestCase):
     """Tests for Bridge."""
 
@@ -35,6 +210,22 @@ class TestBridge(unittest.TestCase):
         time.sleep(0.05)
         bridge.stop()
 
+    def test_bridge_stops_with_full_blocking_queue(self):
+        queue = TaskQueue(1, "block")
+        bridge = Bridge(
+            queue, [], TimerThread(), FakeMqttBroker(), 1, phase="even"
+        )
+        tags = [TagPath("T%d" % i) for i in range(random.randint(3, 6))]
+        bridge.start(tags, Milliseconds(20), "t")
+        time.sleep(0.1)
+        stopper = threading.Thread(target=bridge.stop)
+        stopper.start()
+        stopper.join(2.0)
+        self.assertFalse(
+            stopper.is_alive(),
+            "Bridge should stop while a full blocking queue holds the timer"
+        )
+
     def test_bridge_enqueues_task_for_each_tag(self):
         queue = TaskQueue()
         timer = TimerThread()
@@ -70,6 +261,55 @@ class TestBridge(unittest.TestCase):
             "Bridge should publish to MQTT"
         )
 
+    def test_bridge_publishes_through_stage(self):
+        queue = TaskQueue()
+        broker = FakeMqttBroker()
+        value = random.randint(1, 100)
+        worker = FakeWorker(queue, {"Tag": value})
+        stage = PublishStage()
+        bridge = Bridge(
+            queue, [worker], TimerThread(), broker, stage=stage
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "factory")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            (json.loads(broker.messages()[0][1])["value"],
+             bridge.stats()["publish"]["published"]),
+            (value, 1),
+            "Bridge should publish results through its publish stage"
+        )
+
+    def test_bridge_stats_report_workers(self):
+        queue = TaskQueue()
+        workers = [FakeWorker(queue, {}) for _ in range(random.randint(1, 5))]
+        bridge = Bridge(queue, workers, ManualTimer(), FakeMqttBroker())
+        bridge.start([TagPath("Tag")], Milliseconds(500), "factory")
+        live = bridge.stats()["workers"]
+        bridge.stop()
+        self.assertEqual(
+            live,
+            {"live": len(workers), "restarts": 0},
+            "Bridge stats should count live workers and restarts"
+        )
+
+    def test_bridge_runs_watchdog(self):
+        queue = TaskQueue()
+        watchdog = Watchdog([], random.uniform(1.0, 10.0))
+        bridge = Bridge(
+            queue, [FakeWorker(queue, {})], ManualTimer(),
+            FakeMqttBroker(), watchdog=Some(watchdog)
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "factory")
+        bridge.stop()
+        unwatched = Bridge(queue, [], ManualTimer(), FakeMqttBroker())
+        self.assertEqual(
+            (bridge.stats()["watchdog"]["stuck"],
+             unwatched.stats()["watchdog"]),
+            (0, {}),
+            "Bridge stats should report the watchdog when it has one"
+        )
+
     def test_bridge_publishes_correct_topic(self):
         queue = TaskQueue()
         timer = TimerThread()
@@ -123,6 +363,33 @@ class TestBridge(unittest.TestCase):
             "Bridge should publish quality in message"
         )
 
+    def test_bridge_publishes_timestamp_in_message(self):
+        queue = TaskQueue()
+        timer = TimerThread()
+        broker = FakeMqttBroker()
+        worker = FakeWorker(queue, {"Tag": 1})
+        bridge = Bridge(queue, [worker], timer, broker)
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        data = json.loads(broker.messages()[0][1])
+        self.assertEqual(
+            data["timestamp"],
+            "2024-01-01 00:00:00",
+            "Bridge should publish read timestamp in message"
+        )
+
+    def test_bridge_stats_include_filter_counters(self):
+        bridge = Bridge(
+            TaskQueue(), [], TimerThread(), FakeMqttBroker(), 1,
+            ExceptionFilter(Empty())
+        )
+        self.assertIn(
+            "suppressed",
+            bridge.stats()["filter"],
+            "Bridge stats should include filter counters"
+        )
+
     def test_bridge_reschedules_after_read(self):
         queue = TaskQueue()
         timer = TimerThread()
@@ -184,6 +451,404 @@ class TestBridge(unittest.TestCase):
             "Bridge should handle Cyrillic tag"
         )
 
+    def test_bridge_reads_tags_in_batches(self):
+        queue = TaskQueue()
+        timer = TimerThread()
+        broker = FakeMqttBroker()
+        worker = FakeWorker(queue, {})
+        bridge = Bridge(queue, [worker], timer, broker, 3)
+        tags = [TagPath("Tag%d" % i) for i in range(7)]
+        bridge.start(tags, Milliseconds(1000), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            [len(t.tags()) for t in worker.executed()],
+            [3, 3, 1],
+            "Bridge should read tags in chunks of batch size"
+        )
+
+    def test_bridge_publishes_every_tag_of_batch(self):
+        queue = TaskQueue()
+        timer = TimerThread()
+        broker = FakeMqttBroker()
+        count = random.randint(2, 10)
+        readings = dict(("Tag%d" % i, i) for i in range(count))
+        worker = FakeWorker(queue, readings)
+        bridge = Bridge(queue, [worker], timer, broker, count)
+        tags = [TagPath(p) for p in sorted(readings)]
+        bridge.start(tags, Milliseconds(1000), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            sorted(m[0] for m in broker.messages()),
+            sorted("t/%s" % p for p in readings),
+            "Bridge should publish every tag of a batch"
+        )
+
+    def test_bridge_skips_results_suppressed_by_filter(self):
+        queue = TaskQueue()
+        timer = TimerThread()
+        broker = FakeMqttBroker()
+        worker = FakeWorker(queue, {"Tag": 1})
+        screen = ExceptionFilter(Empty())
+        bridge = Bridge(queue, [worker], timer, broker, 1, screen)
+        bridge.start([TagPath("Tag")], Milliseconds(10), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            len(broker.messages()),
+            1,
+            "Bridge should not publish results suppressed by filter"
+        )
+
+    def test_bridge_relative_mode_waits_full_interval(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        clock = Clock()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 1, ExceptionFilter(Empty()),
+            False, clock=clock
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        clock.now = 0.2
+        queue.get().execute(FakeOpcClient({}))
+        self.assertEqual(
+            timer.delays,
+            [0.5],
+            "Relative mode should wait interval after read"
+        )
+
+    def test_bridge_fixed_mode_keeps_absolute_period(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        clock = Clock()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 1, ExceptionFilter(Empty()),
+            True, clock=clock
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        clock.now = 0.2
+        queue.get().execute(FakeOpcClient({}))
+        self.assertAlmostEqual(
+            timer.delays[0],
+            0.3,
+            msg="Fixed mode should subtract read latency from delay"
+        )
+
+    def test_bridge_fixed_mode_counts_skipped_cycles(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        clock = Clock()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 1, ExceptionFilter(Empty()),
+            True, clock=clock
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        clock.now = 1.2
+        queue.get().execute(FakeOpcClient({}))
+        self.assertEqual(
+            (bridge.stats()["overruns"], round(timer.delays[0], 6)),
+            (2, 0.3),
+            "Fixed mode should skip missed deadlines as overruns"
+        )
+
+    def test_bridge_fixed_mode_stays_on_grid(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        clock = Clock()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 1, ExceptionFilter(Empty()),
+            True, clock=clock
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        client = FakeOpcClient({})
+        dues = []
+        for cycle in range(random.randint(3, 10)):
+            clock.now = cycle * 0.5 + random.uniform(0, 0.4)
+            queue.get().execute(client)
+            dues.append(round(clock.now + timer.delays[-1], 6))
+            timer.callbacks[-1]()
+        self.assertEqual(
+            dues,
+            [0.5 * (n + 1) for n in range(len(dues))],
+            "Fixed mode should keep deadlines on the period grid"
+        )
+
+    def test_bridge_leaves_tripped_tags_out_of_reads(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        threshold = random.randint(1, 5)
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 10,
+            breaker=TagBreaker(threshold, 60.0)
+        )
+        bridge.start([TagPath("A"), TagPath("B")], Milliseconds(500), "t")
+        for _ in range(threshold):
+            queue.get().answer({"A": (1, "Good", "t0")})
+            timer.callbacks[-1]()
+        self.assertEqual(
+            ([t.text() for t in queue.get().tags()],
+             bridge.stats()["breaker"]["tripped"]),
+            (["A"], ["B"]),
+            "Bridge should stop reading tags whose breaker tripped"
+        )
+
+    def test_bridge_trips_only_the_throwing_tag(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 2,
+            breaker=TagBreaker(2, 60.0)
+        )
+        bridge.start([TagPath("A"), TagPath("Bad")], Milliseconds(500), "t")
+        client = ThrowingClient({"A": random.randint(0, 100)})
+        for _ in range(4):
+            while queue.size():
+                task = queue.get()
+                try:
+                    task.execute(client)
+                except IOError as e:
+                    task.fail(e)
+            timer.callbacks[-1]()
+        breaker = bridge.stats()["breaker"]
+        self.assertEqual(
+            ([t.text() for t in queue.get().tags()], queue.size(),
+             breaker["tripped"], breaker["isolated"]),
+            (["A"], 0, ["Bad"], []),
+            "Bridge should isolate a failing batch and trip the culprit"
+        )
+
+    def test_bridge_coalesces_repeated_single_reads(self):
+        queue = TaskQueue(keyed=True)
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 2,
+            breaker=TagBreaker(3, 60.0)
+        )
+        bridge.start([TagPath("A"), TagPath("Bad")], Milliseconds(500), "t")
+        queue.get().fail(IOError("device unplugged"))
+        cycles = random.randint(2, 5)
+        for _ in range(cycles):
+            timer.callbacks[-1]()
+        self.assertEqual(
+            (queue.size(), bridge.stats()["queue"]["coalesced"]),
+            (2, 2 * (cycles - 1)),
+            "Bridge reads of isolated tags should coalesce while waiting"
+        )
+
+    def test_bridge_publishes_coalesced_single_reads_once(self):
+        queue = TaskQueue(keyed=True)
+        timer = ManualTimer()
+        broker = FakeMqttBroker()
+        breaker = TagBreaker(3, 60.0)
+        bridge = Bridge(queue, [], timer, broker, 2, breaker=breaker)
+        bridge.start([TagPath("A"), TagPath("Bad")], Milliseconds(500), "t")
+        queue.get().fail(IOError("device unplugged"))
+        for _ in range(random.randint(2, 5)):
+            timer.callbacks[-1]()
+        broker.clear()
+        while queue.size():
+            queue.get().execute(FakeOpcClient({"A": 1}))
+        self.assertEqual(
+            sorted(m[0] for m in broker.messages()),
+            ["t/A", "t/Bad"],
+            "Bridge should publish coalesced reads of a tag once"
+        )
+
+    def test_bridge_holds_chunk_of_tripped_tags(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(),
+            breaker=TagBreaker(1, 60.0)
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        queue.get().fail(IOError("unplugged"))
+        timer.callbacks[-1]()
+        self.assertEqual(
+            (queue.size(), timer.delays),
+            (0, [0.5, 0.5]),
+            "Bridge should keep a fully tripped chunk on schedule unread"
+        )
+
+    def test_bridge_reschedules_after_failed_publish(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(queue, [], timer, FakeMqttBroker(), 1, BrokenFilter())
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        client = FakeOpcClient({"Tag": random.randint(0, 100)})
+        queue.get().execute(client)
+        timer.callbacks[-1]()
+        queue.get().execute(client)
+        self.assertEqual(
+            (timer.delays, bridge.stats()["publish"]["errors"]),
+            ([0.5, 0.5], 1),
+            "Bridge should count a failed publish and keep polling"
+        )
+
+    def test_bridge_chunks_tags_per_scan_class(self):
+        queue = TaskQueue()
+        bridge = Bridge(
+            queue, [], ManualTimer(), FakeMqttBroker(), 10,
+            classes=[ScanClass("*.Alarm*", Milliseconds(100))]
+        )
+        tags = [TagPath("A.Alarm 1"), TagPath("A.Temp"), TagPath("A.Alarm 2")]
+        bridge.start(tags, Milliseconds(500), "t")
+        self.assertEqual(
+            [[t.text() for t in queue.get().tags()] for _ in range(2)],
+            [["A.Alarm 1", "A.Alarm 2"], ["A.Temp"]],
+            "Bridge should chunk tags of each scan class separately"
+        )
+
+    def test_bridge_reschedules_at_class_interval(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 10,
+            classes=[ScanClass("*.Alarm*", Milliseconds(100))]
+        )
+        tags = [TagPath("A.Alarm"), TagPath("A.Temp")]
+        bridge.start(tags, Milliseconds(500), "t")
+        client = FakeOpcClient({})
+        queue.get().execute(client)
+        queue.get().execute(client)
+        self.assertEqual(
+            timer.delays,
+            [0.1, 0.5],
+            "Bridge should reschedule chunks at their class interval"
+        )
+
+    def test_bridge_backs_off_static_chunks(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(),
+            ceiling=Some(Milliseconds(2000))
+        )
+        bridge.start([TagPath("Tag")], Milliseconds(500), "t")
+        client = FakeOpcClient({"Tag": 7})
+        for _ in range(4):
+            queue.get().execute(client)
+            timer.callbacks[-1]()
+        self.assertEqual(
+            (timer.delays, bridge.stats()["reads"]["saved"]),
+            ([0.5, 1.0, 2.0, 2.0], 1.5),
+            "Bridge should slow down static chunks up to the ceiling"
+        )
+
+    def test_bridge_keeps_one_group_per_adaptive_chunk(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(
+            queue, [], timer, FakeMqttBroker(), 10,
+            ceiling=Some(Milliseconds(4000)), grouped=True
+        )
+        tags = [TagPath("T%d" % i) for i in range(10)]
+        busy = random.sample([t.text() for t in tags], 2)
+        client = ChangingClient(busy)
+        reader = GroupedClient(client)
+        bridge.start(tags, Milliseconds(500), "t")
+        sizes = set()
+        for _ in range(60):
+            task = queue.get()
+            sizes.add(len(task.tags()))
+            task.execute(reader)
+            timer.callbacks[-1]()
+        self.assertEqual(
+            (client.added, client.removed, len(sizes) > 1),
+            (1, 0, True),
+            "Bridge should read adaptive chunks through one stable group"
+        )
+
+    def test_bridge_keeps_each_group_on_one_sharded_worker(self):
+        workers = random.randint(2, 4)
+        queues = [TaskQueue() for _ in range(workers)]
+        queue = ShardedQueue(queues, lambda tag: tag.text())
+        timer = ManualTimer()
+        bridge = Bridge(queue, [], timer, FakeMqttBroker(), 3, grouped=True)
+        tags = [TagPath("T%d" % i) for i in range(12)]
+        clients = [ChangingClient([]) for _ in range(workers)]
+        readers = [GroupedClient(client) for client in clients]
+        bridge.start(tags, Milliseconds(500), "t")
+        for _ in range(5):
+            for index, local in enumerate(queues):
+                while local.size():
+                    local.get().execute(readers[index])
+            callbacks, timer.callbacks = timer.callbacks, []
+            for callback in callbacks:
+                callback()
+        self.assertEqual(
+            sum(client.added for client in clients),
+            4,
+            "Sharded workers should build one group per chunk in total"
+        )
+
+    def test_bridge_reads_all_chunks_at_once_without_phase(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(queue, [], timer, FakeMqttBroker())
+        count = random.randint(2, 10)
+        tags = [TagPath("T%d" % i) for i in range(count)]
+        bridge.start(tags, Milliseconds(500), "t")
+        self.assertEqual(
+            (queue.size(), timer.delays),
+            (count, []),
+            "Bridge should enqueue every chunk at start without phase"
+        )
+
+    def test_bridge_spreads_chunks_evenly(self):
+        queue = TaskQueue()
+        timer = ManualTimer()
+        bridge = Bridge(queue, [], timer, FakeMqttBroker(), phase="even")
+        tags = [TagPath("T%d" % i) for i in range(4)]
+        bridge.start(tags, Milliseconds(1000), "t")
+        self.assertEqual(
+            (queue.size(), timer.delays),
+            (1, [0.25, 0.5, 0.75]),
+            "Bridge should spread first reads evenly over the interval"
+        )
+
+    def test_bridge_hash_phase_is_stable(self):
+        offsets = []
+        for _ in range(2):
+            timer = ManualTimer()
+            bridge = Bridge(
+                TaskQueue(), [], timer, FakeMqttBroker(), phase="hash"
+            )
+            tags = [TagPath("T%d" % i) for i in range(20)]
+            bridge.start(tags, Milliseconds(1000), "t")
+            offsets.append(sorted(timer.delays))
+        self.assertTrue(
+            offsets[0] == offsets[1] and
+            all(0 < d < 1.0 for d in offsets[0]),
+            "Bridge hash phase should be stable within the interval"
+        )
+
+    def test_bridge_keeps_partitions_in_separate_chunks(self):
+        queue = TaskQueue()
+        bridge = Bridge(
+            queue, [], ManualTimer(), FakeMqttBroker(), 10,
+            partition=lambda tag: tag.device(1)
+        )
+        tags = [TagPath("COM1.A"), TagPath("COM2.B"), TagPath("COM1.C")]
+        bridge.start(tags, Milliseconds(500), "t")
+        self.assertEqual(
+            [[t.text() for t in queue.get().tags()] for _ in range(2)],
+            [["COM1.A", "COM1.C"], ["COM2.B"]],
+            "Bridge should chunk each partition separately"
+        )
+
+    def test_bridge_reschedules_shed_reads(self):
+        queue = TaskQueue(1, "drop-oldest")
+        timer = ManualTimer()
+        bridge = Bridge(queue, [], timer, FakeMqttBroker())
+        bridge.start([TagPath("A"), TagPath("B")], Milliseconds(500), "t")
+        self.assertEqual(
+            (timer.delays, bridge.stats()["overruns"], queue.size()),
+            ([0.5], 1, 1),
+            "Bridge should reschedule a shed read as an overrun"
+        )
+
     def test_bridge_repr_shows_worker_count(self):
         queue = TaskQueue()
         timer = TimerThread()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Browser.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import unittest
+
+from opcda_to_mqtt.da.browse import Browser
+
+logging.disable(logging.CRITICAL)
+
+
+class CountingClient:
+    """Stub OPC client counting list calls per node."""
+
+    def __init__(self, hierarchy, broken=None):
+        """
+        Create stub with hierarchy dict.
+
+        Args:
+            hierarchy: Dict mapping prefix to list of children
+            broken: Node whose listing raises, or None
+        """
+        self._hierarchy = hierarchy
+        self._broken = broken
+        self._lock = threading.Lock()
+        self.calls = {}
+        self.closed = 0
+
+    def list(self, prefix=None):
+        key = prefix or ""
+        with self._lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+        if key == self._broken:
+            raise IOError("browse failed")
+        return list(self._hierarchy.get(key, []))
+
+    def close(self):
+        with self._lock:
+            self.closed += 1
+
+
+def _tree(width, depth):
+    """
+    Build a browse tree of relative names.
+
+    Args:
+        width: Children per branch
+        depth: Branch levels below the root
+
+    Returns:
+        Tuple of (hierarchy dict, leaves in depth-first order)
+    """
+    hierarchy = {}
+    leaves = []
+
+    def grow(path, level):
+        names = ["N%d" % index for index in range(width)]
+        hierarchy[path] = names
+        for name in names:
+            full = "%s.%s" % (path, name)
+            if level < depth:
+                grow(full, level + 1)
+            else:
+                leaves.append(full)
+    grow("Root", 1)
+    return hierarchy, leaves
+
+
+class TestBrowser(unittest.TestCase):
+    """Tests for Browser."""
+
+    def test_browser_lists_each_node_once(self):
+        hierarchy, leaves = _tree(random.randint(2, 4), random.randint(1, 3))
+        client = CountingClient(hierarchy)
+        browser = Browser(lambda: client, 1, lambda c: None)
+        browser.browse("Root")
+        self.assertEqual(
+            (set(client.calls.values()), browser.stats()["lists"]),
+            (set([1]), len(hierarchy) + len(leaves)),
+            "Browser should list every node exactly once"
+        )
+
+    def test_browser_parallel_keeps_depth_first_order(self):
+        hierarchy, leaves = _tree(random.randint(2, 5), random.randint(2, 3))
+        client = CountingClient(hierarchy)
+        browser = Browser(lambda: client, random.randint(2, 8))
+        self.assertEqual(
+            browser.browse("Root"),
+            leaves,
+            "Browser should return leaves depth-first with any pool"
+        )
+
+    def test_browser_releases_every_connection(self):
+        hierarchy, _ = _tree(3, 2)
+        client = CountingClient(hierarchy)
+        connections = random.randint(1, 6)
+        Browser(lambda: client, connections).browse("Root")
+        self.assertEqual(
+            client.closed,
+            connections,
+            "Browser should release each connection it opened"
+        )
+
+    def test_browser_raises_failed_list(self):
+        hierarchy, _ = _tree(3, 2)
+        client = CountingClient(hierarchy, broken="Root.N1")
+        browser = Browser(lambda: client, 3)
+        self.assertRaises(IOError, browser.browse, "Root")
+
+    def test_browser_carries_on_after_failed_connect(self):
+        hierarchy, leaves = _tree(3, 2)
+        client = CountingClient(hierarchy)
+        outcomes = [client, IOError("refused"), client]
+        lock = threading.Lock()
+
+        def connect():
+            with lock:
+                outcome = outcomes.pop()
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        self.assertEqual(
+            Browser(connect, 3).browse("Root"),
+            leaves,
+            "Browser should browse on the connections that opened"
+        )
+
+    def test_browser_raises_without_connection(self):
+        def connect():
+            raise IOError("refused")
+        self.assertRaises(IOError, Browser(connect, 2).browse, "Root")
+
+    def test_browser_stats_count_branches_and_leaves(self):
+        hierarchy, leaves = _tree(2, 2)
+        client = CountingClient(hierarchy)
+        browser = Browser(lambda: client, 2, clock=lambda: 0.0)
+        browser.browse("Root")
+        self.assertEqual(
+            browser.stats(),
+            {
+                "lists": len(hierarchy) + len(leaves),
+                "branches": len(hierarchy), "leaves": len(leaves),
+                "connections": 2, "seconds": 0.0
+            },
+            "Browser stats should count lists, branches and leaves"
+        )
+
+    def test_browser_repr_shows_connections(self):
+        self.assertEqual(
+            repr(Browser(lambda: None, 3)),
+            "Browser(connections=3)",
+            "Browser repr should show connection count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
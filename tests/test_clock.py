@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for monotonic clock.
+"""
+from __future__ import print_function
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from opcda_to_mqtt.sync.clock import monotonic, _posix, _Unwrapped
+
+logging.disable(logging.CRITICAL)
+
+
+class TestMonotonic(unittest.TestCase):
+    """Tests for monotonic."""
+
+    def test_monotonic_never_goes_back(self):
+        readings = [monotonic() for _ in range(1000)]
+        self.assertEqual(
+            readings,
+            sorted(readings),
+            "monotonic should never go back"
+        )
+
+    def test_monotonic_advances_with_sleep(self):
+        start = monotonic()
+        time.sleep(0.05)
+        self.assertGreaterEqual(
+            monotonic() - start,
+            0.04,
+            "monotonic should advance while sleeping"
+        )
+
+    @unittest.skipIf(os.name == "nt", "POSIX clock only")
+    def test_posix_clock_reads_seconds(self):
+        clock = _posix()
+        start = clock()
+        time.sleep(0.05)
+        self.assertAlmostEqual(
+            clock() - start,
+            0.05,
+            delta=0.04,
+            msg="POSIX clock should count seconds"
+        )
+
+
+class Ticks:
+    """Scripted tick counter."""
+
+    def __init__(self, readings):
+        """
+        Create Ticks returning readings in order.
+
+        Args:
+            readings: List of millisecond counts
+        """
+        self._readings = list(readings)
+
+    def __call__(self):
+        """
+        Get the next reading.
+
+        Returns:
+            Millisecond count
+        """
+        return self._readings.pop(0)
+
+
+class TestUnwrapped(unittest.TestCase):
+    """Tests for _Unwrapped."""
+
+    def test_unwrapped_converts_ticks_to_seconds(self):
+        ms = random.randint(0, 100000)
+        self.assertEqual(
+            _Unwrapped(Ticks([0, ms]))(),
+            ms / 1000.0,
+            "_Unwrapped should count milliseconds as seconds"
+        )
+
+    def test_unwrapped_keeps_counting_past_wraparound(self):
+        span = random.randint(1000, 100000)
+        clock = _Unwrapped(Ticks([span - 10, span - 5, 3, 8]), span)
+        readings = [clock(), clock(), clock()]
+        self.assertEqual(
+            readings,
+            [(span - 5) / 1000.0, (span + 3) / 1000.0,
+             (span + 8) / 1000.0],
+            "_Unwrapped should add a span after the counter wraps"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for CompressionFilter.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.filter.compression import CompressionFilter
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        """
+        Create a Clock at zero.
+        """
+        self.now = 0.0
+
+    def __call__(self):
+        """
+        Get current time.
+
+        Returns:
+            Current time in seconds
+        """
+        return self.now
+
+
+def _feed(screen, clock, tag, values, quality="Good"):
+    """
+    Apply values one second apart.
+
+    Args:
+        screen: CompressionFilter under test
+        clock: Clock advanced before each value
+        tag: TagPath of the values
+        values: List of values
+        quality: Quality of every value
+
+    Returns:
+        List of published results
+    """
+    published = []
+    for value in values:
+        clock.now += 1.0
+        published.extend(
+            screen.apply(tag, (value, quality, "t%d" % clock.now))
+        )
+    return published
+
+
+class TestCompressionFilter(unittest.TestCase):
+    """Tests for CompressionFilter."""
+
+    def test_compression_publishes_first_point(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        value = random.randint(1, 100) / 10.0
+        self.assertEqual(
+            screen.apply(TagPath("A"), (value, "Good", "t0")),
+            [(value, "Good", "t0")],
+            "CompressionFilter should publish the first point"
+        )
+
+    def test_compression_reduces_line_to_end_points(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        slope = random.randint(1, 10)
+        line = [slope * i for i in range(20)]
+        published = _feed(screen, clock, TagPath("A"), line + [0])
+        self.assertEqual(
+            [p[0] for p in published],
+            [0, slope * 19],
+            "CompressionFilter should keep only end points of a line"
+        )
+
+    def test_compression_uses_read_time_over_clock(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        slope = random.randint(1, 10)
+        line = [slope * i for i in range(20)]
+        published = []
+        for index, value in enumerate(line + [0]):
+            published.extend(screen.apply(
+                TagPath("A"), (value, "Good", "t%d" % index),
+                Some(float(index))
+            ))
+        self.assertEqual(
+            [p[0] for p in published],
+            [0, slope * 19],
+            "CompressionFilter should take slopes over read times"
+        )
+
+    def test_compression_publishes_held_point_with_its_timestamp(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        published = _feed(screen, clock, TagPath("A"), [0.0, 1.0, 2.0, 0.0])
+        self.assertEqual(
+            published[-1],
+            (2.0, "Good", "t3"),
+            "CompressionFilter should publish held point as read"
+        )
+
+    def test_compression_keeps_trend_within_door_width(self):
+        clock = Clock()
+        deviation = 0.5
+        screen = CompressionFilter({"A": deviation}, Empty(), clock)
+        values = [random.uniform(0, 10) for _ in range(200)]
+        published = _feed(screen, clock, TagPath("A"), values)
+        points = [(int(p[2][1:]), p[0]) for p in published]
+        points.append((len(values), values[-1]))
+        for stamp, value in enumerate(values, 1):
+            before = [p for p in points if p[0] <= stamp][-1]
+            after = [p for p in points if p[0] >= stamp][0]
+            if before[0] == after[0]:
+                line = before[1]
+            else:
+                share = float(stamp - before[0]) / (after[0] - before[0])
+                line = before[1] + share * (after[1] - before[1])
+            self.assertLessEqual(
+                abs(line - value),
+                2 * deviation + 1e-9,
+                "CompressionFilter trend should stay within door width"
+            )
+
+    def test_compression_publishes_quality_change(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        _feed(screen, clock, TagPath("A"), [0.0, 1.0])
+        published = _feed(screen, clock, TagPath("A"), [2.0], "Bad")
+        self.assertEqual(
+            published,
+            [(1.0, "Good", "t2"), (2.0, "Bad", "t3")],
+            "CompressionFilter should flush held point on quality change"
+        )
+
+    def test_compression_publishes_non_numeric_values(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        published = _feed(screen, clock, TagPath("A"), ["on", "on"])
+        self.assertEqual(
+            len(published),
+            2,
+            "CompressionFilter should pass non-numeric values"
+        )
+
+    def test_compression_passes_unconfigured_tags(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        published = _feed(screen, clock, TagPath("B"), [1.0, 1.0, 1.0])
+        self.assertEqual(
+            len(published),
+            3,
+            "CompressionFilter should pass tags without deviation"
+        )
+
+    def test_compression_publishes_on_heartbeat(self):
+        clock = Clock()
+        screen = CompressionFilter(
+            {"A": 0.1}, Some(Milliseconds(5000)), clock
+        )
+        published = _feed(screen, clock, TagPath("A"), [1.0] * 6)
+        self.assertEqual(
+            [p[2] for p in published],
+            ["t1", "t5", "t6"],
+            "CompressionFilter should publish after heartbeat"
+        )
+
+    def test_compression_stats_report_ratio(self):
+        clock = Clock()
+        screen = CompressionFilter({"A": 0.1}, Empty(), clock)
+        _feed(screen, clock, TagPath("A"), [1.0] * 10)
+        self.assertEqual(
+            screen.stats(),
+            {"received": 10, "published": 1, "ratio": 10.0},
+            "CompressionFilter should report compression ratio"
+        )
+
+    def test_compression_repr_shows_tag_count(self):
+        count = random.randint(1, 10)
+        deviations = dict(("T%d" % i, 1.0) for i in range(count))
+        self.assertEqual(
+            repr(CompressionFilter(deviations, Empty())),
+            "CompressionFilter(tags=%d)" % count,
+            "CompressionFilter repr should show tag count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -177,6 +177,342 @@ class TestMergedConfig(unittest.TestCase):
             "workers default should be 50"
         )
 
+    def test_merged_config_mode_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(mode=None))
+        self.assertEqual(
+            cfg.mode(),
+            "poll",
+            "mode default should be poll"
+        )
+
+    def test_merged_config_mode_from_cli(self):
+        file = {"mode": "poll"}
+        cfg = MergedConfig(file, argparse.Namespace(mode="subscribe"))
+        self.assertEqual(
+            cfg.mode(),
+            "subscribe",
+            "mode should prefer CLI over file"
+        )
+
+    def test_merged_config_scan_classes_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.scan_classes(),
+            [],
+            "scan_classes default should be empty list"
+        )
+
+    def test_merged_config_scan_classes_from_file(self):
+        rules = [{"pattern": "*.Alarm*", "interval": random.randint(1, 99)}]
+        cfg = MergedConfig({"scan-classes": rules}, argparse.Namespace())
+        self.assertEqual(
+            cfg.scan_classes(),
+            rules,
+            "scan_classes should come from file"
+        )
+
+    def test_merged_config_adaptive_max_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.adaptive_max(),
+            0,
+            "adaptive_max default should be 0"
+        )
+
+    def test_merged_config_phase_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.phase(),
+            "none",
+            "phase default should be none"
+        )
+
+    def test_merged_config_scheduler_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.scheduler(),
+            "relative",
+            "scheduler default should be relative"
+        )
+
+    def test_merged_config_scheduler_from_cli(self):
+        cfg = MergedConfig(
+            {"scheduler": "relative"}, argparse.Namespace(scheduler="fixed")
+        )
+        self.assertEqual(
+            cfg.scheduler(),
+            "fixed",
+            "scheduler should come from CLI"
+        )
+
+    def test_merged_config_timer_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            (cfg.timer(), cfg.timer_tick()),
+            ("heap", 10),
+            "timer default should be heap with 10 ms tick"
+        )
+
+    def test_merged_config_timer_tick_from_file(self):
+        tick = random.randint(1, 100)
+        cfg = MergedConfig({"timer-tick": tick}, argparse.Namespace())
+        self.assertEqual(
+            cfg.timer_tick(),
+            tick,
+            "timer_tick should come from file"
+        )
+
+    def test_merged_config_queue_defaults(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            (cfg.queue_capacity(), cfg.queue_policy()),
+            (0, "drop-oldest"),
+            "queue should be unbounded with drop-oldest by default"
+        )
+
+    def test_merged_config_queue_policy_from_cli(self):
+        cfg = MergedConfig({}, argparse.Namespace(queue_policy="block"))
+        self.assertEqual(
+            cfg.queue_policy(),
+            "block",
+            "queue_policy should come from CLI"
+        )
+
+    def test_merged_config_queue_coalesce_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(queue_coalesce=None))
+        self.assertFalse(
+            cfg.queue_coalesce(),
+            "queue_coalesce default should be False"
+        )
+
+    def test_merged_config_queue_coalesce_from_file(self):
+        cfg = MergedConfig({"queue-coalesce": True}, argparse.Namespace())
+        self.assertTrue(
+            cfg.queue_coalesce(),
+            "queue_coalesce should come from file"
+        )
+
+    def test_merged_config_worker_drain_from_cli(self):
+        drain = random.randint(1, 50)
+        cfg = MergedConfig({}, argparse.Namespace(worker_drain=drain))
+        self.assertEqual(
+            cfg.worker_drain(),
+            drain,
+            "worker_drain should come from CLI"
+        )
+
+    def test_merged_config_processes_from_file(self):
+        count = random.randint(2, 8)
+        cfg = MergedConfig({"processes": count}, argparse.Namespace())
+        self.assertEqual(
+            cfg.processes(),
+            count,
+            "processes should come from file"
+        )
+
+    def test_merged_config_publish_defaults(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            (cfg.publish_stage(), cfg.publish_capacity(),
+             cfg.publish_policy()),
+            (False, 0, "block"),
+            "publish stage should be off, unbounded and blocking"
+        )
+
+    def test_merged_config_latency_target_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(latency_target=None))
+        self.assertEqual(
+            cfg.latency_target(),
+            0,
+            "latency_target default should disable the limit"
+        )
+
+    def test_merged_config_reconnect_defaults(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            (cfg.reconnect_min(), cfg.reconnect_max()),
+            (1000, 60000),
+            "reconnect backoff should run from 1 s to 1 min"
+        )
+
+    def test_merged_config_read_deadline_from_file(self):
+        deadline = random.randint(1000, 60000)
+        cfg = MergedConfig(
+            {"read-deadline": deadline},
+            argparse.Namespace(read_deadline=None)
+        )
+        self.assertEqual(
+            (cfg.read_deadline(), MergedConfig({}, None).read_deadline()),
+            (deadline, 0),
+            "read_deadline should come from file and default to off"
+        )
+
+    def test_merged_config_breaker_settings(self):
+        threshold = random.randint(1, 20)
+        cfg = MergedConfig(
+            {"breaker-threshold": 99},
+            argparse.Namespace(breaker_threshold=threshold)
+        )
+        self.assertEqual(
+            (cfg.breaker_threshold(), cfg.breaker_probe(),
+             MergedConfig({}, None).breaker_threshold()),
+            (threshold, 60000, 0),
+            "breaker settings should prefer CLI and default to off"
+        )
+
+    def test_merged_config_discover_connections(self):
+        connections = random.randint(1, 16)
+        cfg = MergedConfig(
+            {}, argparse.Namespace(discover_connections=connections)
+        )
+        self.assertEqual(
+            (cfg.discover_connections(),
+             MergedConfig({}, None).discover_connections()),
+            (connections, 4),
+            "discover_connections should come from CLI, default 4"
+        )
+
+    def test_merged_config_validate_settings(self):
+        batch = random.randint(1, 1000)
+        cfg = MergedConfig(
+            {"validate": True, "validate-batch": batch},
+            argparse.Namespace(validate=None, validate_batch=None)
+        )
+        self.assertEqual(
+            (cfg.validate(), cfg.validate_batch(),
+             MergedConfig({}, None).validate()),
+            (True, batch, False),
+            "validate settings should come from file and default to off"
+        )
+
+    def test_merged_config_shards_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(shards=None))
+        self.assertEqual(
+            cfg.shards(),
+            "none",
+            "shards default should be none"
+        )
+
+    def test_merged_config_device_defaults(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            (cfg.device_depth(), cfg.device_limit()),
+            (0, 1),
+            "device scheduling should be off with limit 1 by default"
+        )
+
+    def test_merged_config_device_depth_from_file(self):
+        depth = random.randint(1, 4)
+        cfg = MergedConfig({"device-depth": depth}, argparse.Namespace())
+        self.assertEqual(
+            cfg.device_depth(),
+            depth,
+            "device_depth should come from file"
+        )
+
+    def test_merged_config_batch_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(batch=None))
+        self.assertEqual(
+            cfg.batch(),
+            1,
+            "batch default should be 1"
+        )
+
+    def test_merged_config_batch_from_file(self):
+        size = random.randint(2, 500)
+        cfg = MergedConfig({"batch": size}, argparse.Namespace(batch=None))
+        self.assertEqual(
+            cfg.batch(),
+            size,
+            "batch should come from file"
+        )
+
+    def test_merged_config_groups_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(groups=None))
+        self.assertFalse(
+            cfg.groups(),
+            "groups default should be False"
+        )
+
+    def test_merged_config_groups_from_file(self):
+        cfg = MergedConfig({"groups": True}, argparse.Namespace(groups=None))
+        self.assertTrue(
+            cfg.groups(),
+            "groups should come from file"
+        )
+
+    def test_merged_config_exception_default(self):
+        cfg = MergedConfig({}, argparse.Namespace(exception=None))
+        self.assertFalse(
+            cfg.exception(),
+            "exception default should be False"
+        )
+
+    def test_merged_config_heartbeat_from_file(self):
+        beat = random.randint(1000, 100000)
+        cfg = MergedConfig(
+            {"heartbeat": beat}, argparse.Namespace(heartbeat=None)
+        )
+        self.assertEqual(
+            cfg.heartbeat(),
+            beat,
+            "heartbeat should come from file"
+        )
+
+    def test_merged_config_deadband_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.deadband(),
+            [],
+            "deadband default should be empty list"
+        )
+
+    def test_merged_config_deadband_from_file(self):
+        rules = [{"pattern": "*.Temp", "absolute": 0.5}]
+        cfg = MergedConfig({"deadband": rules}, argparse.Namespace())
+        self.assertEqual(
+            cfg.deadband(),
+            rules,
+            "deadband should come from file"
+        )
+
+    def test_merged_config_compression_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.compression(),
+            [],
+            "compression default should be empty list"
+        )
+
+    def test_merged_config_stats_interval_default(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        self.assertEqual(
+            cfg.stats_interval(),
+            60000,
+            "stats_interval default should be 60000"
+        )
+
+    def test_merged_config_stats_interval_from_file(self):
+        period = random.randint(0, 100000)
+        cfg = MergedConfig({"stats-interval": period}, argparse.Namespace())
+        self.assertEqual(
+            cfg.stats_interval(),
+            period,
+            "stats_interval should come from file"
+        )
+
+    def test_merged_config_stats_interval_from_cli(self):
+        period = random.randint(0, 100000)
+        cfg = MergedConfig(
+            {"stats-interval": period + 1},
+            argparse.Namespace(stats_interval=period)
+        )
+        self.assertEqual(
+            cfg.stats_interval(),
+            period,
+            "stats_interval should come from CLI before file"
+        )
+
     def test_merged_config_mqtt_host_from_file(self):
         host = "".join(random.choice(string.ascii_letters) for _ in range(8))
         file = {"mqtt-host": host}
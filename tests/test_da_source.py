@@ -98,6 +98,27 @@ class TestFakeDaSource(unittest.TestCase):
             "FakeDaSource should preserve Cyrillic tags"
         )
 
+    def test_fake_source_ranges_returns_known_tags(self):
+        tag = TagPath("Level")
+        source = FakeDaSource([tag], {tag: (0.0, 10.0)})
+        result = source.ranges([tag, TagPath("Other")])
+        self.assertEqual(
+            result.fold(lambda e: None, lambda r: r),
+            {tag: (0.0, 10.0)},
+            "FakeDaSource.ranges should return known ranges only"
+        )
+
+    def test_fake_source_validate_splits_unreadable(self):
+        tags = [TagPath("T%d" % i) for i in range(random.randint(2, 10))]
+        broken = random.sample(tags, 1)
+        source = FakeDaSource(tags, unreadable=broken)
+        result = source.validate(tags, 10, 2)
+        self.assertEqual(
+            result.fold(lambda e: None, lambda r: r),
+            ([t for t in tags if t not in broken], broken),
+            "FakeDaSource.validate should split off unreadable tags"
+        )
+
 
 class StubOpcClient:
     """Stub OPC client for testing flatten logic."""
@@ -294,5 +315,192 @@ class TestOpenOpcSourceFlatten(unittest.TestCase):
         )
 
 
+class StubPropertyClient:
+    """Stub OPC client serving item properties."""
+
+    def __init__(self, properties):
+        """
+        Create stub with properties dict.
+
+        Args:
+            properties: Dict mapping (tag, id) to property value
+        """
+        self._properties = properties
+
+    def properties(self, tag, id=None):
+        """
+        Return a property value.
+
+        Args:
+            tag: Tag path string
+            id: Property ID
+
+        Returns:
+            Property value
+
+        Raises:
+            KeyError: If property is unknown
+        """
+        return self._properties[(tag, id)]
+
+
+class TestOpenOpcSourceRanges(unittest.TestCase):
+    """Tests for OpenOpcSource._ranges method."""
+
+    def test_ranges_reads_high_and_low_eu(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        high = random.randint(100, 1000)
+        client = StubPropertyClient({("T", 102): high, ("T", 103): -5})
+        self.assertEqual(
+            source._ranges(client, [TagPath("T")]),
+            {TagPath("T"): (-5.0, float(high))},
+            "Should read High EU and Low EU properties"
+        )
+
+    def test_ranges_skips_tags_without_properties(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        client = StubPropertyClient({("A", 102): 10, ("A", 103): 0})
+        self.assertEqual(
+            sorted(source._ranges(client, [TagPath("A"), TagPath("B")])),
+            [TagPath("A")],
+            "Should skip tags without EU properties"
+        )
+
+    def test_ranges_skips_non_numeric_properties(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        client = StubPropertyClient({("A", 102): "n/a", ("A", 103): 0})
+        self.assertEqual(
+            source._ranges(client, [TagPath("A")]),
+            {},
+            "Should skip non-numeric EU properties"
+        )
+
+
+
+class ReadingClient:
+    """Stub OPC client answering reads of known items."""
+
+    def __init__(self, known, failing=False):
+        """
+        Create stub with known item names.
+
+        Args:
+            known: List of item names that read Good
+            failing: Raise on reads of more than one item
+        """
+        self._known = known
+        self._failing = failing
+        self.dropped = False
+        self.reads = 0
+
+    def read(self, tags, sync=True):
+        """
+        Read items, unknown ones with Error quality.
+
+        Args:
+            tags: List of item names
+            sync: Synchronous read flag (ignored)
+
+        Returns:
+            List of (name, value, quality, timestamp)
+        """
+        self.reads += 1
+        if self.dropped:
+            raise IOError("connection lost")
+        if self._failing and len(tags) > 1:
+            raise IOError("batch rejected")
+        if self._failing and tags[0] not in self._known:
+            raise IOError("unknown item")
+        return [
+            (name, 1, "Good", None) if name in self._known
+            else (name, None, "Error", None)
+            for name in tags
+        ]
+
+    def ping(self):
+        """
+        Check the connection.
+
+        Returns:
+            False once the connection is dropped
+        """
+        return not self.dropped
+
+    def close(self):
+        """Close the connection."""
+
+
+class TestOpenOpcSourceValidate(unittest.TestCase):
+    """Tests for OpenOpcSource validation."""
+
+    def test_check_drops_error_quality_items(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        tags = [TagPath("A"), TagPath("Gone"), TagPath("B")]
+        client = ReadingClient(["A", "B"])
+        self.assertEqual(
+            (source._check(client, tags), client.reads),
+            (([tags[0], tags[2]], [tags[1]]), 1),
+            "Should read a batch at once and drop Error items"
+        )
+
+    def test_check_reads_one_by_one_after_failed_batch(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        tags = [TagPath("A"), TagPath("Gone"), TagPath("B")]
+        client = ReadingClient(["A", "B"], failing=True)
+        self.assertEqual(
+            (source._check(client, tags), client.reads),
+            (([tags[0], tags[2]], [tags[1]]), 4),
+            "Should find unreadable items of a failed batch one by one"
+        )
+
+    def test_check_raises_when_connection_is_lost(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        client = ReadingClient(["A", "B"], failing=True)
+        client.dropped = True
+        self.assertRaises(
+            IOError, source._check, client, [TagPath("A"), TagPath("B")]
+        )
+
+    def test_validate_fails_when_connection_is_lost(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        client = ReadingClient(["A"])
+        client.dropped = True
+        source._connect = lambda: client
+        tags = [TagPath("T%d" % i) for i in range(random.randint(1, 20))]
+        result = source.validate(tags, 5, 1)
+        self.assertFalse(
+            result.is_right(),
+            "Should report a lost connection instead of dropping tags"
+        )
+
+    def test_discover_reports_stats_after_failure(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        connections = random.randint(1, 4)
+        source = OpenOpcSource("progid", "host", connections)
+        result = source.discover("COM1")
+        self.assertEqual(
+            (result.is_right(),
+             source.stats()["discovery"]["connections"]),
+            (False, connections),
+            "Should report discovery stats even when discovery failed"
+        )
+
+    def test_validate_fails_without_connection(self):
+        from opcda_to_mqtt.da.openopc import OpenOpcSource
+        source = OpenOpcSource("progid", "host")
+        result = source.validate([TagPath("A")], 10, 2)
+        self.assertFalse(
+            result.is_right(),
+            "Should report a problem when no connection can be made"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
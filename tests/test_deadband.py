@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Deadband and DeadbandFilter.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.filter.deadband import Deadband, DeadbandFilter
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class TestDeadband(unittest.TestCase):
+    """Tests for Deadband."""
+
+    def test_deadband_matches_glob_pattern(self):
+        self.assertTrue(
+            Deadband("*.Temp*", 1, 0).matches(TagPath("COM1.Temp 1")),
+            "Deadband should match glob pattern"
+        )
+
+    def test_deadband_absolute_width(self):
+        width = random.randint(1, 100) / 10.0
+        self.assertEqual(
+            Deadband("*", width, 0).width(Empty()),
+            Some(width),
+            "Deadband should use absolute width"
+        )
+
+    def test_deadband_percent_width(self):
+        self.assertEqual(
+            Deadband("*", 0, 5).width(Some((-100.0, 100.0))),
+            Some(10.0),
+            "Deadband should use percent of span"
+        )
+
+    def test_deadband_percent_without_span_is_empty(self):
+        self.assertEqual(
+            Deadband("*", 0, 5).width(Empty()),
+            Empty(),
+            "Deadband percent width needs a span"
+        )
+
+    def test_deadband_uses_wider_of_both(self):
+        self.assertEqual(
+            Deadband("*", 0.5, 1).width(Some((0.0, 100.0))),
+            Some(1.0),
+            "Deadband should use wider of absolute and percent"
+        )
+
+    def test_deadband_needs_span_only_for_percent(self):
+        absolute = Deadband("*", 1, 0)
+        percent = Deadband("*", 0, 1)
+        self.assertEqual(
+            (absolute.needs_span(), percent.needs_span()),
+            (False, True),
+            "Deadband should need span only for percent band"
+        )
+
+
+class TestDeadbandFilter(unittest.TestCase):
+    """Tests for DeadbandFilter."""
+
+    def test_deadband_filter_publishes_first_value(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), (10.0, "Good", "ts"))),
+            1,
+            "DeadbandFilter should publish first value"
+        )
+
+    def test_deadband_filter_suppresses_value_inside_band(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        self.assertEqual(
+            screen.apply(TagPath("A"), (9.2, "Good", "ts")),
+            [],
+            "DeadbandFilter should suppress value inside band"
+        )
+
+    def test_deadband_filter_publishes_value_beyond_band(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), (11.5, "Good", "ts"))),
+            1,
+            "DeadbandFilter should publish value beyond band"
+        )
+
+    def test_deadband_filter_compares_to_last_published(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        screen.apply(TagPath("A"), (10.6, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), (11.2, "Good", "ts"))),
+            1,
+            "DeadbandFilter should compare to last published value"
+        )
+
+    def test_deadband_filter_publishes_quality_change(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), (10.0, "Bad", "ts"))),
+            1,
+            "DeadbandFilter should publish quality change"
+        )
+
+    def test_deadband_filter_passes_tags_without_band(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("B"), (10.0, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("B"), (10.0, "Good", "ts"))),
+            1,
+            "DeadbandFilter should pass tags without band"
+        )
+
+    def test_deadband_filter_compares_non_numeric_exactly(self):
+        screen = DeadbandFilter({"A": 1.0}, Empty())
+        screen.apply(TagPath("A"), ("on", "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), ("off", "Good", "ts"))),
+            1,
+            "DeadbandFilter should compare non-numeric values exactly"
+        )
+
+    def test_deadband_filter_republishes_after_heartbeat(self):
+        now = [0.0]
+        screen = DeadbandFilter(
+            {"A": 1.0}, Some(Milliseconds(1000)), lambda: now[0]
+        )
+        screen.apply(TagPath("A"), (10.0, "Good", "ts"))
+        now[0] = 2.0
+        self.assertEqual(
+            len(screen.apply(TagPath("A"), (10.1, "Good", "ts"))),
+            1,
+            "DeadbandFilter should republish after heartbeat"
+        )
+
+    def test_deadband_filter_repr_shows_tag_count(self):
+        self.assertIn(
+            "tags=2",
+            repr(DeadbandFilter({"A": 1.0, "B": 2.0}, Empty())),
+            "DeadbandFilter repr should show tag count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for DeviceQueue and DeviceTask.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import time
+import unittest
+
+from opcda_to_mqtt.sync.device import DeviceQueue, DeviceTask
+from opcda_to_mqtt.sync.task import BatchReadTask
+from opcda_to_mqtt.sync.worker import FakeOpcClient
+from opcda_to_mqtt.domain.path import TagPath
+
+logging.disable(logging.CRITICAL)
+
+
+def _task(path):
+    """
+    Build a read task for one tag.
+
+    Args:
+        path: Tag path string
+
+    Returns:
+        BatchReadTask ignoring its results
+    """
+    return BatchReadTask([TagPath(path)], lambda results: None)
+
+
+class TestDeviceQueue(unittest.TestCase):
+    """Tests for DeviceQueue."""
+
+    def test_device_queue_starts_empty(self):
+        self.assertEqual(
+            DeviceQueue(1, 1).size(),
+            0,
+            "DeviceQueue should start empty"
+        )
+
+    def test_device_queue_put_increases_size(self):
+        queue = DeviceQueue(1, 1)
+        count = random.randint(1, 20)
+        for index in range(count):
+            queue.put(_task("COM%d.T" % (index % 3)))
+        self.assertEqual(
+            queue.size(),
+            count,
+            "DeviceQueue.put should increase size"
+        )
+
+    def test_device_queue_skips_busy_device(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(_task("COM1.A"))
+        queue.put(_task("COM1.B"))
+        queue.put(_task("COM2.C"))
+        first = queue.get()
+        second = queue.get()
+        self.assertEqual(
+            [first.tags()[0].text(), second.tags()[0].text()],
+            ["COM1.A", "COM2.C"],
+            "DeviceQueue should skip devices at their limit"
+        )
+
+    def test_device_queue_serves_devices_in_turn(self):
+        queue = DeviceQueue(1, 10)
+        for path in ["COM1.A", "COM1.B", "COM1.C", "COM2.D", "COM3.E"]:
+            queue.put(_task(path))
+        order = [queue.get().tags()[0].text() for _ in range(5)]
+        self.assertEqual(
+            order,
+            ["COM1.A", "COM2.D", "COM3.E", "COM1.B", "COM1.C"],
+            "DeviceQueue should serve devices round-robin"
+        )
+
+    def test_device_queue_frees_slot_after_execute(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(_task("COM1.A"))
+        queue.put(_task("COM1.B"))
+        queue.get().execute(FakeOpcClient({}))
+        self.assertEqual(
+            queue.get().tags()[0].text(),
+            "COM1.B",
+            "DeviceQueue should free device slot after execute"
+        )
+
+    def test_device_queue_frees_slot_when_task_fails(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(BatchReadTask([TagPath("COM1.A")], lambda r: 1 / 0))
+        queue.put(_task("COM1.B"))
+        try:
+            queue.get().execute(FakeOpcClient({}))
+        except ZeroDivisionError:
+            pass
+        self.assertEqual(
+            queue.get().tags()[0].text(),
+            "COM1.B",
+            "DeviceQueue should free device slot after a failure"
+        )
+
+    def test_device_queue_caps_concurrent_reads(self):
+        queue = DeviceQueue(1, 2)
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def slow(results):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        def run():
+            while True:
+                task = queue.get()
+                if task is None:
+                    break
+                task.execute(FakeOpcClient({}))
+
+        workers = [threading.Thread(target=run) for _ in range(6)]
+        for worker in workers:
+            worker.start()
+        for index in range(12):
+            queue.put(BatchReadTask([TagPath("COM1.T%d" % index)], slow))
+        time.sleep(0.1)
+        for _ in workers:
+            queue.put(None)
+        for worker in workers:
+            worker.join()
+        self.assertEqual(
+            active[1],
+            2,
+            "DeviceQueue should cap concurrent reads per device"
+        )
+
+    def test_device_queue_returns_sentinel_when_idle(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(None)
+        self.assertIsNone(
+            queue.get(),
+            "DeviceQueue should return sentinel"
+        )
+
+    def test_device_queue_get_many_takes_free_devices(self):
+        queue = DeviceQueue(1, 1)
+        queue.put_many([_task(p) for p in ["COM1.A", "COM1.B", "COM2.C"]])
+        self.assertEqual(
+            [t.tags()[0].text() for t in queue.get_many(10)],
+            ["COM1.A", "COM2.C"],
+            "DeviceQueue.get_many should take one task per free device"
+        )
+
+    def test_device_queue_get_many_takes_one_task_per_device(self):
+        queue = DeviceQueue(1, random.randint(2, 5))
+        queue.put_many([_task(p) for p in ["COM1.A", "COM1.B", "COM2.C"]])
+        self.assertEqual(
+            [t.tags()[0].text() for t in queue.get_many(10)],
+            ["COM1.A", "COM2.C"],
+            "DeviceQueue.get_many should not give one worker two reads "
+            "of a device"
+        )
+
+    def test_device_queue_sheds_oldest_task_when_full(self):
+        queue = DeviceQueue(1, 1, 2, "drop-oldest")
+        shed = []
+        queue.put(BatchReadTask(
+            [TagPath("COM2.A")], lambda r: None, lambda: shed.append("A")
+        ))
+        queue.put_many([_task("COM1.B"), _task("COM1.C")])
+        self.assertEqual(
+            (shed, [t.tags()[0].text() for t in queue.drain()],
+             queue.stats()["shed"]),
+            (["A"], ["COM1.B", "COM1.C"], 1),
+            "DeviceQueue should shed the oldest task of any device"
+        )
+
+    def test_device_queue_coalesces_waiting_tags(self):
+        queue = DeviceQueue(1, 1, keyed=True)
+        count = random.randint(2, 10)
+        queue.put_many([_task("COM1.A") for _ in range(count)])
+        self.assertEqual(
+            (queue.size(), queue.stats()["coalesced"]),
+            (1, count - 1),
+            "DeviceQueue should let a waiting read absorb new ones"
+        )
+
+    def test_device_queue_close_releases_blocked_producer(self):
+        queue = DeviceQueue(1, 1, 1, "block")
+        queue.put(_task("COM1.A"))
+        producer = threading.Thread(
+            target=lambda: queue.put(_task("COM2.B"))
+        )
+        producer.start()
+        time.sleep(0.02)
+        queue.close()
+        producer.join(1.0)
+        self.assertEqual(
+            (producer.is_alive(), queue.size(), queue.stats()["shed"]),
+            (False, 1, 1),
+            "DeviceQueue.close should shed the task of a blocked producer"
+        )
+
+    def test_device_queue_rejects_unknown_policy(self):
+        self.assertRaises(ValueError, DeviceQueue, 1, 1, 1, "newest")
+
+    def test_device_queue_get_many_returns_sentinel_alone(self):
+        queue = DeviceQueue(1, 1)
+        queue.put_many([None, None])
+        self.assertEqual(
+            queue.get_many(10),
+            [None],
+            "DeviceQueue.get_many should hand out one sentinel"
+        )
+
+    def test_device_queue_drain_empties_devices(self):
+        queue = DeviceQueue(1, 1)
+        queue.put_many([_task(p) for p in ["COM1.A", "COM2.B", "COM1.C"]])
+        self.assertEqual(
+            ([t.tags()[0].text() for t in queue.drain()], queue.size()),
+            (["COM1.A", "COM1.C", "COM2.B"], 0),
+            "DeviceQueue.drain should take every waiting task"
+        )
+
+    def test_device_queue_stats_show_devices(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(_task("COM1.A"))
+        queue.put(_task("COM1.B"))
+        queue.get()
+        self.assertEqual(
+            queue.stats(),
+            {"size": 1, "shed": 0, "coalesced": 0,
+             "devices": {"COM1": {"waiting": 1, "reading": 1}}},
+            "DeviceQueue stats should show waiting and reading per device"
+        )
+
+    def test_device_queue_repr_shows_size(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(_task("COM1.A"))
+        self.assertEqual(
+            repr(queue),
+            "DeviceQueue(size=1, devices=1)",
+            "DeviceQueue repr should show size and devices"
+        )
+
+
+class TestDeviceTask(unittest.TestCase):
+    """Tests for DeviceTask."""
+
+    def test_device_task_releases_once(self):
+        released = []
+        task = DeviceTask(_task("COM1.A"), lambda: released.append(1))
+        task.execute(FakeOpcClient({}))
+        self.assertEqual(
+            released,
+            [1],
+            "DeviceTask should release after execute"
+        )
+
+    def test_device_task_fail_frees_slot_once(self):
+        queue = DeviceQueue(1, 1)
+        queue.put(_task("COM1.A"))
+        queue.put(_task("COM1.B"))
+        task = queue.get()
+        task.fail(IOError("abandoned"))
+        task.execute(FakeOpcClient({}))
+        self.assertEqual(
+            (queue.get().tags()[0].text(),
+             queue.stats()["devices"]["COM1"]),
+            ("COM1.B", {"waiting": 0, "reading": 1}),
+            "DeviceTask.fail should free its device slot only once"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ExceptionFilter.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.filter.exception import ExceptionFilter
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        """
+        Create a Clock at zero.
+        """
+        self.now = 0.0
+
+    def __call__(self):
+        """
+        Get current time.
+
+        Returns:
+            Current time in seconds
+        """
+        return self.now
+
+
+class TestExceptionFilter(unittest.TestCase):
+    """Tests for ExceptionFilter."""
+
+    def test_exception_filter_publishes_first_result(self):
+        result = (random.randint(1, 100), "Good", "ts")
+        screen = ExceptionFilter(Empty())
+        self.assertEqual(
+            screen.apply(TagPath("Tag"), result),
+            [result],
+            "ExceptionFilter should publish first result"
+        )
+
+    def test_exception_filter_suppresses_unchanged_result(self):
+        screen = ExceptionFilter(Empty())
+        screen.apply(TagPath("Tag"), (1, "Good", "ts1"))
+        self.assertEqual(
+            screen.apply(TagPath("Tag"), (1, "Good", "ts2")),
+            [],
+            "ExceptionFilter should suppress unchanged result"
+        )
+
+    def test_exception_filter_publishes_changed_value(self):
+        screen = ExceptionFilter(Empty())
+        screen.apply(TagPath("Tag"), (1, "Good", "ts1"))
+        value = random.randint(2, 100)
+        self.assertEqual(
+            len(screen.apply(TagPath("Tag"), (value, "Good", "ts2"))),
+            1,
+            "ExceptionFilter should publish changed value"
+        )
+
+    def test_exception_filter_publishes_changed_quality(self):
+        screen = ExceptionFilter(Empty())
+        screen.apply(TagPath("Tag"), (1, "Good", "ts1"))
+        self.assertEqual(
+            len(screen.apply(TagPath("Tag"), (1, "Bad", "ts2"))),
+            1,
+            "ExceptionFilter should publish changed quality"
+        )
+
+    def test_exception_filter_tracks_tags_separately(self):
+        screen = ExceptionFilter(Empty())
+        screen.apply(TagPath("A"), (1, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("B"), (1, "Good", "ts"))),
+            1,
+            "ExceptionFilter should track tags separately"
+        )
+
+    def test_exception_filter_republishes_after_heartbeat(self):
+        clock = Clock()
+        screen = ExceptionFilter(Some(Milliseconds(1000)), clock)
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        clock.now = 1.0
+        self.assertEqual(
+            len(screen.apply(TagPath("Tag"), (1, "Good", "ts"))),
+            1,
+            "ExceptionFilter should republish after heartbeat"
+        )
+
+    def test_exception_filter_suppresses_before_heartbeat(self):
+        clock = Clock()
+        screen = ExceptionFilter(Some(Milliseconds(1000)), clock)
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        clock.now = 0.5
+        self.assertEqual(
+            screen.apply(TagPath("Tag"), (1, "Good", "ts")),
+            [],
+            "ExceptionFilter should suppress before heartbeat"
+        )
+
+    def test_exception_filter_heartbeat_counts_from_last_publish(self):
+        clock = Clock()
+        screen = ExceptionFilter(Some(Milliseconds(1000)), clock)
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        clock.now = 1.0
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        clock.now = 1.5
+        self.assertEqual(
+            screen.apply(TagPath("Tag"), (1, "Good", "ts")),
+            [],
+            "ExceptionFilter heartbeat should count from last publish"
+        )
+
+    def test_exception_filter_stats_count_results(self):
+        screen = ExceptionFilter(Empty())
+        repeats = random.randint(1, 10)
+        for _ in range(repeats + 1):
+            screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        self.assertEqual(
+            screen.stats(),
+            {"published": 1, "suppressed": repeats, "cached": 1},
+            "ExceptionFilter stats should count results"
+        )
+
+    def test_exception_filter_repr_shows_heartbeat(self):
+        self.assertIn(
+            "Milliseconds(500)",
+            repr(ExceptionFilter(Some(Milliseconds(500)))),
+            "ExceptionFilter repr should show heartbeat"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for PassFilter and ChainFilter.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.filter.filter import Filter, PassFilter, ChainFilter
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class Doubling(Filter):
+    """Filter emitting every result twice."""
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Emit result twice.
+
+        Args:
+            tag: TagPath
+            result: Read result
+            read: Optional read time
+
+        Returns:
+            List with result twice
+        """
+        return [result, result]
+
+
+class Dropping(Filter):
+    """Filter dropping every result."""
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Drop result.
+
+        Args:
+            tag: TagPath
+            result: Read result
+            read: Optional read time
+
+        Returns:
+            Empty list
+        """
+        return []
+
+
+class Recording(Filter):
+    """Filter passing results and recording their read times."""
+
+    def __init__(self):
+        """
+        Create a Recording filter.
+        """
+        self.reads = []
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Pass the result and record its read time.
+
+        Args:
+            tag: TagPath
+            result: Read result
+            read: Optional read time
+
+        Returns:
+            List containing the result
+        """
+        self.reads.append(read)
+        return [result]
+
+
+class Counting(Filter):
+    """Filter passing results and reporting a counter."""
+
+    def apply(self, tag, result, read=Empty()):
+        """
+        Pass the result.
+
+        Args:
+            tag: TagPath that was read
+            result: Tuple of (value, quality, timestamp)
+            read: Optional read time
+
+        Returns:
+            List containing the result
+        """
+        return [result]
+
+    def stats(self):
+        """
+        Get counters.
+
+        Returns:
+            Dict with seen count
+        """
+        return {"seen": 0}
+
+
+class TestPassFilter(unittest.TestCase):
+    """Tests for PassFilter."""
+
+    def test_pass_filter_returns_result(self):
+        result = (random.randint(1, 100), "Good", "ts")
+        self.assertEqual(
+            PassFilter().apply(TagPath("Tag"), result),
+            [result],
+            "PassFilter should return the result"
+        )
+
+    def test_pass_filter_repr(self):
+        self.assertEqual(
+            repr(PassFilter()),
+            "PassFilter()",
+            "PassFilter repr should name the filter"
+        )
+
+
+class TestChainFilter(unittest.TestCase):
+    """Tests for ChainFilter."""
+
+    def test_empty_chain_passes_result(self):
+        result = (random.randint(1, 100), "Good", "ts")
+        self.assertEqual(
+            ChainFilter([]).apply(TagPath("Tag"), result),
+            [result],
+            "Empty ChainFilter should pass the result"
+        )
+
+    def test_chain_applies_filters_in_order(self):
+        result = (1, "Good", "ts")
+        chain = ChainFilter([Doubling(), Doubling()])
+        self.assertEqual(
+            len(chain.apply(TagPath("Tag"), result)),
+            4,
+            "ChainFilter should feed each filter the previous output"
+        )
+
+    def test_chain_stops_at_dropping_filter(self):
+        chain = ChainFilter([Dropping(), Doubling()])
+        self.assertEqual(
+            chain.apply(TagPath("Tag"), (1, "Good", "ts")),
+            [],
+            "ChainFilter should publish nothing after a drop"
+        )
+
+    def test_chain_passes_read_time_to_every_filter(self):
+        read = Some(random.random())
+        first = Recording()
+        second = Recording()
+        ChainFilter([first, Doubling(), second]).apply(
+            TagPath("Tag"), (1, "Good", "ts"), read
+        )
+        self.assertEqual(
+            (first.reads, second.reads),
+            ([read], [read, read]),
+            "ChainFilter should pass the read time to every filter"
+        )
+
+    def test_chain_stats_collects_filter_counters(self):
+        chain = ChainFilter([PassFilter(), Counting()])
+        self.assertEqual(
+            chain.stats(),
+            {"Counting": {"seen": 0}},
+            "ChainFilter stats should name filters with counters"
+        )
+
+    def test_chain_repr_shows_filters(self):
+        self.assertIn(
+            "PassFilter",
+            repr(ChainFilter([PassFilter()])),
+            "ChainFilter repr should show filters"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for GroupedClient.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.sync.group import GroupedClient
+from opcda_to_mqtt.sync.worker import FakeOpcClient
+
+logging.disable(logging.CRITICAL)
+
+
+class RecordingClient(FakeOpcClient):
+    """Fake OPC client that records read arguments."""
+
+    def __init__(self, readings):
+        """
+        Create a RecordingClient.
+
+        Args:
+            readings: Dict mapping tag paths to values
+        """
+        FakeOpcClient.__init__(self, readings)
+        self.calls = []
+        self.closed = False
+
+    def read(self, tag=None, group=None, sync=True):
+        """
+        Record and perform a read.
+
+        Args:
+            tag: Tag path string or list
+            group: Group name
+            sync: Synchronous read flag
+
+        Returns:
+            Read result
+        """
+        self.calls.append((tag, group))
+        return FakeOpcClient.read(self, tag, group, sync)
+
+    def close(self):
+        """
+        Record close.
+        """
+        self.closed = True
+
+
+class TestGroupedClient(unittest.TestCase):
+    """Tests for GroupedClient."""
+
+    def test_grouped_client_creates_group_on_first_read(self):
+        client = RecordingClient({})
+        reader = GroupedClient(client)
+        reader.read(["A", "B"], sync=True)
+        self.assertIsNotNone(
+            client.calls[0][1],
+            "GroupedClient should create group on first read"
+        )
+
+    def test_grouped_client_refreshes_group_by_name(self):
+        client = RecordingClient({})
+        reader = GroupedClient(client)
+        reader.read(["A", "B"], sync=True)
+        reader.read(["A", "B"], sync=True)
+        self.assertEqual(
+            client.calls[1],
+            (None, client.calls[0][1]),
+            "GroupedClient should refresh group without item names"
+        )
+
+    def test_grouped_client_returns_group_values(self):
+        value = random.randint(1, 1000)
+        reader = GroupedClient(RecordingClient({"A": value}))
+        reader.read(["A"], sync=True)
+        result = reader.read(["A"], sync=True)
+        self.assertEqual(
+            result[0][1],
+            value,
+            "GroupedClient should return values of group read"
+        )
+
+    def test_grouped_client_builds_group_per_tag_list(self):
+        reader = GroupedClient(RecordingClient({}))
+        count = random.randint(2, 6)
+        for _ in range(3):
+            for i in range(count):
+                reader.read(["Tag%d" % i, "Other%d" % i], sync=True)
+        self.assertEqual(
+            reader.groups(),
+            count,
+            "GroupedClient should build one group per tag list"
+        )
+
+    def test_grouped_client_replaces_overlapping_group(self):
+        client = RecordingClient({})
+        reader = GroupedClient(client)
+        reader.read(["A", "B", "C"], sync=True)
+        reader.read(["A", "C"], sync=True)
+        reader.read(["A", "C"], sync=True)
+        self.assertEqual(
+            (reader.groups(), client.calls[-1][1], len(client._groups)),
+            (1, "opcda_mqtt_1", 1),
+            "GroupedClient should drop groups of a changed tag list"
+        )
+
+    def test_grouped_client_uses_unique_group_names(self):
+        client = RecordingClient({})
+        reader = GroupedClient(client)
+        reader.read(["A"], sync=True)
+        reader.read(["B"], sync=True)
+        self.assertNotEqual(
+            client.calls[0][1],
+            client.calls[1][1],
+            "GroupedClient should use unique group names"
+        )
+
+    def test_grouped_client_passes_single_tag_through(self):
+        client = RecordingClient({"A": 5})
+        reader = GroupedClient(client)
+        result = reader.read("A", sync=True)
+        self.assertEqual(
+            (result[0], reader.groups()),
+            (5, 0),
+            "GroupedClient should pass single tag reads through"
+        )
+
+    def test_grouped_client_close_forgets_groups(self):
+        client = RecordingClient({})
+        reader = GroupedClient(client)
+        reader.read(["A"], sync=True)
+        reader.close()
+        self.assertEqual(
+            (reader.groups(), client.closed),
+            (0, True),
+            "GroupedClient.close should close client and forget groups"
+        )
+
+    def test_grouped_client_repr_shows_groups(self):
+        reader = GroupedClient(RecordingClient({}))
+        reader.read(["A"], sync=True)
+        self.assertIn(
+            "groups=1",
+            repr(reader),
+            "GroupedClient repr should show group count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ConcurrencyLimit, LimitedQueue and LimitedTask.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import time
+import unittest
+
+from opcda_to_mqtt.sync.limit import (
+    ConcurrencyLimit, LimitedQueue, LimitedTask, BACKOFF
+)
+from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.task import BatchReadTask
+from opcda_to_mqtt.sync.worker import FakeOpcClient
+from opcda_to_mqtt.domain.path import TagPath
+
+logging.disable(logging.CRITICAL)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class HangingClient(FakeOpcClient):
+    """Fake client whose reads block until released."""
+
+    def __init__(self, readings):
+        FakeOpcClient.__init__(self, readings)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def read(self, tags, sync=True):
+        self.entered.set()
+        self.release.wait()
+        return FakeOpcClient.read(self, tags, sync=sync)
+
+
+def _read(limit, clock, seconds):
+    """
+    Run one read of a given latency through a limit.
+
+    Args:
+        limit: ConcurrencyLimit to read under
+        clock: Clock driving the limit
+        seconds: Latency of the read
+    """
+    started = limit.acquire()
+    clock.now += seconds
+    limit.release(started)
+
+
+class TestConcurrencyLimit(unittest.TestCase):
+    """Tests for ConcurrencyLimit."""
+
+    def test_limit_starts_at_maximum(self):
+        maximum = random.randint(1, 100)
+        self.assertEqual(
+            ConcurrencyLimit(maximum, 0.1).stats()["limit"],
+            maximum,
+            "ConcurrencyLimit should start at its maximum"
+        )
+
+    def test_limit_backs_off_on_slow_read(self):
+        clock = Clock()
+        limit = ConcurrencyLimit(40, 0.1, clock=clock)
+        _read(limit, clock, 0.5)
+        self.assertEqual(
+            (limit.stats()["limit"], limit.stats()["drops"]),
+            (40 * BACKOFF, 1),
+            "ConcurrencyLimit should shrink multiplicatively when slow"
+        )
+
+    def test_limit_grows_one_slot_per_round(self):
+        clock = Clock()
+        limit = ConcurrencyLimit(40, 0.1, clock=clock)
+        _read(limit, clock, 0.5)
+        for _ in range(30):
+            _read(limit, clock, 0.01)
+        self.assertAlmostEqual(
+            limit.stats()["limit"],
+            31.0,
+            delta=0.1,
+            msg="ConcurrencyLimit should grow by about one per round"
+        )
+
+    def test_limit_drops_once_per_burst(self):
+        clock = Clock()
+        limit = ConcurrencyLimit(40, 0.1, clock=clock)
+        starts = [limit.acquire() for _ in range(5)]
+        clock.now = 1.0
+        for started in starts:
+            limit.release(started)
+        self.assertEqual(
+            limit.stats()["drops"],
+            1,
+            "ConcurrencyLimit should drop once for reads in flight together"
+        )
+
+    def test_limit_stays_within_bounds(self):
+        clock = Clock()
+        limit = ConcurrencyLimit(8, 0.1, 2, clock)
+        for _ in range(20):
+            _read(limit, clock, 1.0)
+        low = limit.stats()["limit"]
+        for _ in range(200):
+            _read(limit, clock, 0.0)
+        self.assertEqual(
+            (low, limit.stats()["limit"]),
+            (2, 8),
+            "ConcurrencyLimit should stay between minimum and maximum"
+        )
+
+    def test_limit_blocks_above_limit(self):
+        limit = ConcurrencyLimit(1, 10.0)
+        first = limit.acquire()
+        taken = []
+        waiter = threading.Thread(
+            target=lambda: taken.append(limit.acquire())
+        )
+        waiter.start()
+        time.sleep(0.02)
+        blocked = not taken
+        limit.release(first)
+        waiter.join()
+        self.assertEqual(
+            (blocked, len(taken)),
+            (True, 1),
+            "ConcurrencyLimit should block until a slot frees"
+        )
+
+
+class TestLimitedQueue(unittest.TestCase):
+    """Tests for LimitedQueue and LimitedTask."""
+
+    def test_limited_queue_wraps_tasks(self):
+        queue = LimitedQueue(TaskQueue(), ConcurrencyLimit(4, 0.1))
+        queue.put(BatchReadTask([TagPath("A")], lambda r: r))
+        self.assertIsInstance(
+            queue.get(),
+            LimitedTask,
+            "LimitedQueue should hand out LimitedTask"
+        )
+
+    def test_limited_queue_passes_sentinel(self):
+        queue = LimitedQueue(TaskQueue(), ConcurrencyLimit(4, 0.1))
+        queue.put(None)
+        self.assertIsNone(
+            queue.get(),
+            "LimitedQueue should hand out sentinels unwrapped"
+        )
+
+    def test_limited_task_records_latency(self):
+        limit = ConcurrencyLimit(4, 0.1)
+        value = random.randint(0, 100)
+        seen = []
+        LimitedTask(
+            BatchReadTask([TagPath("A")], seen.extend), limit
+        ).execute(FakeOpcClient({"A": value}))
+        stats = limit.stats()
+        self.assertEqual(
+            (seen[0][0], stats["inflight"], stats["latency"]["count"]),
+            (value, 0, 1),
+            "LimitedTask should run the task and free its slot"
+        )
+
+    def test_limited_task_fail_frees_slot(self):
+        limit = ConcurrencyLimit(1, 10.0)
+        client = HangingClient({"A": 1})
+        task = LimitedTask(BatchReadTask([TagPath("A")], len), limit)
+        runner = threading.Thread(target=lambda: task.execute(client))
+        runner.start()
+        client.entered.wait()
+        task.fail(IOError("abandoned"))
+        inflight = limit.stats()["inflight"]
+        client.release.set()
+        runner.join()
+        self.assertEqual(
+            (inflight, limit.stats()["inflight"]),
+            (0, 0),
+            "LimitedTask.fail should free its slot only once"
+        )
+
+    def test_limited_task_times_only_the_read(self):
+        clock = Clock()
+        limit = ConcurrencyLimit(4, 0.1, clock=clock)
+        seen = []
+
+        def publish(results):
+            seen.append(limit.stats()["inflight"])
+            clock.now += random.uniform(1.0, 10.0)
+
+        LimitedTask(
+            BatchReadTask([TagPath("A")], publish), limit
+        ).execute(FakeOpcClient({"A": 1}))
+        self.assertEqual(
+            (seen, limit.stats()["drops"]),
+            ([0], 0),
+            "LimitedTask should free its slot before the callback runs"
+        )
+
+    def test_limited_queue_stats_include_limit(self):
+        queue = LimitedQueue(TaskQueue(), ConcurrencyLimit(4, 0.1))
+        self.assertEqual(
+            queue.stats()["limit"]["limit"],
+            4,
+            "LimitedQueue stats should show the current limit"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,26 @@ Tests for main module helpers.
 """
 from __future__ import print_function
 
+import argparse
 import logging
+import Queue
 import random
 import string
 import unittest
 
-from opcda_to_mqtt.app.main import _matches
+from opcda_to_mqtt.app.config import MergedConfig
+from opcda_to_mqtt.app.main import (
+    _matches, _filter, _bands, _deviations, _timer, _classes, _queue,
+    _depth, _split, _aggregate, _serve, _stage, _limited,
+    _watchdog, _breaker, _validate, _grouped, _collect
+)
+from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.task import BatchReadTask
+from opcda_to_mqtt.da.fake import FakeDaSource
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.filter.deadband import Deadband
+from opcda_to_mqtt.result.optional import Some
 
 logging.disable(logging.CRITICAL)
 
@@ -90,5 +104,439 @@ class TestMatches(unittest.TestCase):
         )
 
 
+class TestFilter(unittest.TestCase):
+    """Tests for _filter helper function."""
+
+    def test_filter_passes_repeats_by_default(self):
+        screen = _filter(MergedConfig({}, argparse.Namespace()), {})
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        self.assertEqual(
+            len(screen.apply(TagPath("Tag"), (1, "Good", "ts"))),
+            1,
+            "_filter should publish repeats by default"
+        )
+
+    def test_filter_suppresses_repeats_with_exception(self):
+        cfg = MergedConfig({"exception": True}, argparse.Namespace())
+        screen = _filter(cfg, {})
+        screen.apply(TagPath("Tag"), (1, "Good", "ts"))
+        self.assertEqual(
+            screen.apply(TagPath("Tag"), (1, "Good", "ts")),
+            [],
+            "_filter should suppress repeats with exception enabled"
+        )
+
+    def test_filter_suppresses_changes_inside_band(self):
+        screen = _filter(MergedConfig({}, argparse.Namespace()), {"T": 1.0})
+        screen.apply(TagPath("T"), (10.0, "Good", "ts"))
+        self.assertEqual(
+            screen.apply(TagPath("T"), (10.5, "Good", "ts")),
+            [],
+            "_filter should suppress changes inside a deadband"
+        )
+
+
+    def test_filter_compresses_configured_tags(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        screen = _filter(cfg, {}, {"T": 0.1})
+        published = [
+            screen.apply(TagPath("T"), (float(i), "Good", "ts"))
+            for i in range(3)
+        ]
+        self.assertEqual(
+            published[1],
+            [],
+            "_filter should hold points on a compressed trend"
+        )
+
+
+class TestDeviations(unittest.TestCase):
+    """Tests for _deviations helper function."""
+
+    def test_deviations_uses_first_matching_rule(self):
+        rules = [
+            {"pattern": "*.Flow", "deviation": 0.2},
+            {"pattern": "*", "deviation": 1}
+        ]
+        self.assertEqual(
+            _deviations(rules, [TagPath("A.Flow"), TagPath("A.Temp")]),
+            {"A.Flow": 0.2, "A.Temp": 1.0},
+            "_deviations should use first matching rule"
+        )
+
+    def test_deviations_skips_unmatched_tags(self):
+        rules = [{"pattern": "*.Flow", "deviation": 0.2}]
+        self.assertEqual(
+            _deviations(rules, [TagPath("A.Temp")]),
+            {},
+            "_deviations should skip tags without matching rule"
+        )
+
+
+class TestTimer(unittest.TestCase):
+    """Tests for _timer helper function."""
+
+    def test_timer_defaults_to_heap(self):
+        cfg = MergedConfig({}, argparse.Namespace())
+        timer = _timer(cfg, Milliseconds(500))
+        self.assertIn(
+            "TimerThread",
+            repr(timer),
+            "_timer should build TimerThread by default"
+        )
+
+    def test_timer_sizes_wheel_for_one_interval(self):
+        cfg = MergedConfig(
+            {"timer": "wheel", "timer-tick": 10}, argparse.Namespace()
+        )
+        self.assertEqual(
+            repr(_timer(cfg, Milliseconds(500))),
+            "WheelTimer(slots=51, pending=0)",
+            "_timer should fit one interval in the wheel"
+        )
+
+
+class TestClasses(unittest.TestCase):
+    """Tests for _classes helper function."""
+
+    def test_classes_use_own_ceiling(self):
+        rules = [{"pattern": "*", "interval": 100, "max": 2000}]
+        cfg = MergedConfig({"scan-classes": rules}, argparse.Namespace())
+        self.assertEqual(
+            _classes(cfg)[0].ceiling().otherwise(None).amount(),
+            2000,
+            "_classes should use the ceiling of the rule"
+        )
+
+    def test_classes_fall_back_to_adaptive_max(self):
+        rules = [{"pattern": "*", "interval": 100}]
+        cfg = MergedConfig(
+            {"scan-classes": rules, "adaptive-max": 5000},
+            argparse.Namespace()
+        )
+        self.assertEqual(
+            _classes(cfg)[0].ceiling().otherwise(None).amount(),
+            5000,
+            "_classes should fall back to adaptive-max"
+        )
+
+    def test_classes_without_ceiling_are_not_adaptive(self):
+        rules = [{"pattern": "*", "interval": 100}]
+        cfg = MergedConfig({"scan-classes": rules}, argparse.Namespace())
+        self.assertFalse(
+            _classes(cfg)[0].ceiling().is_present(),
+            "_classes should leave ceiling empty by default"
+        )
+
+
+class TestQueue(unittest.TestCase):
+    """Tests for _queue helper function."""
+
+    def test_queue_defaults_to_task_queue(self):
+        self.assertIn(
+            "TaskQueue",
+            repr(_queue(MergedConfig({}, argparse.Namespace()))),
+            "_queue should build TaskQueue by default"
+        )
+
+    def test_queue_is_per_device_with_depth(self):
+        cfg = MergedConfig({"device-depth": 1}, argparse.Namespace())
+        self.assertIn(
+            "DeviceQueue",
+            repr(_queue(cfg)),
+            "_queue should build DeviceQueue with a device depth"
+        )
+
+    def test_queue_per_device_keeps_coalescing(self):
+        cfg = MergedConfig(
+            {"device-depth": 1, "queue-coalesce": True},
+            argparse.Namespace()
+        )
+        queue = _queue(cfg)
+        queue.put_many([
+            BatchReadTask([TagPath("COM1.A")], lambda r: None)
+            for _ in range(2)
+        ])
+        self.assertEqual(
+            queue.stats()["coalesced"],
+            1,
+            "_queue should coalesce reads with a device depth"
+        )
+
+
+    def test_queue_is_sharded_per_worker(self):
+        workers = random.randint(2, 8)
+        cfg = MergedConfig(
+            {"shards": "hash", "workers": workers}, argparse.Namespace()
+        )
+        self.assertEqual(
+            repr(_queue(cfg)),
+            "ShardedQueue(shards=%d, live=%d)" % (workers, workers),
+            "_queue should build one shard per worker"
+        )
+
+    def test_depth_defaults_to_one_when_sharding_by_device(self):
+        cfg = MergedConfig({"shards": "device"}, argparse.Namespace())
+        self.assertEqual(
+            _depth(cfg),
+            1,
+            "_depth should split chunks by device when sharding by device"
+        )
+
+
+class TestStage(unittest.TestCase):
+    """Tests for _stage helper function."""
+
+    def test_stage_defaults_to_inline(self):
+        self.assertEqual(
+            repr(_stage(MergedConfig({}, argparse.Namespace()))),
+            "InlineStage()",
+            "_stage should publish inline by default"
+        )
+
+    def test_stage_is_threaded_when_enabled(self):
+        cfg = MergedConfig({"publish-stage": True}, argparse.Namespace())
+        self.assertEqual(
+            repr(_stage(cfg)),
+            "PublishStage(size=0)",
+            "_stage should build PublishStage when enabled"
+        )
+
+
+class TestLimited(unittest.TestCase):
+    """Tests for _limited helper function."""
+
+    def test_limited_leaves_queue_without_target(self):
+        queue = object()
+        wrap = _limited(MergedConfig({}, argparse.Namespace()))
+        self.assertIs(
+            wrap(queue),
+            queue,
+            "_limited should not wrap queues without a latency target"
+        )
+
+    def test_limited_shares_one_limit(self):
+        workers = random.randint(2, 50)
+        cfg = MergedConfig(
+            {"latency-target": 100, "workers": workers},
+            argparse.Namespace()
+        )
+        wrap = _limited(cfg)
+        first = wrap(TaskQueue())
+        second = wrap(TaskQueue())
+        self.assertEqual(
+            (first.stats()["limit"]["limit"], second._limit),
+            (workers, first._limit),
+            "_limited should share one limit bounded by workers"
+        )
+
+
+class TestValidate(unittest.TestCase):
+    """Tests for _validate helper function."""
+
+    def test_validate_drops_unreadable_tags(self):
+        tags = [TagPath("T%d" % i) for i in range(random.randint(2, 20))]
+        broken = random.sample(tags, random.randint(1, len(tags) - 1))
+        cfg = MergedConfig({"validate": True}, argparse.Namespace())
+        kept = _validate(
+            cfg, FakeDaSource(tags, unreadable=broken), tags,
+            logging.getLogger("test")
+        )
+        self.assertEqual(
+            kept,
+            [t for t in tags if t not in broken],
+            "_validate should keep only readable tags in order"
+        )
+
+
+class TestBreaker(unittest.TestCase):
+    """Tests for _breaker helper function."""
+
+    def test_breaker_off_by_default(self):
+        self.assertEqual(
+            repr(_breaker(MergedConfig({}, argparse.Namespace()))),
+            "NoBreaker()",
+            "_breaker should not hold tags back by default"
+        )
+
+    def test_breaker_uses_threshold(self):
+        threshold = random.randint(1, 20)
+        cfg = MergedConfig(
+            {"breaker-threshold": threshold}, argparse.Namespace()
+        )
+        self.assertEqual(
+            repr(_breaker(cfg)),
+            "TagBreaker(threshold=%d, tripped=0)" % threshold,
+            "_breaker should trip tags after breaker_threshold reads"
+        )
+
+
+class TestGrouped(unittest.TestCase):
+    """Tests for _grouped helper function."""
+
+    def test_grouped_off_by_default(self):
+        self.assertFalse(
+            _grouped(
+                MergedConfig({}, argparse.Namespace()),
+                logging.getLogger("test")
+            ),
+            "_grouped should not use OPC groups by default"
+        )
+
+    def test_grouped_needs_shards(self):
+        shards = random.choice(["hash", "device"])
+        grouped = [
+            _grouped(
+                MergedConfig(
+                    {"groups": True, "shards": value}, argparse.Namespace()
+                ),
+                logging.getLogger("test")
+            )
+            for value in ["none", shards]
+        ]
+        self.assertEqual(
+            grouped,
+            [False, True],
+            "_grouped should use OPC groups only with shards"
+        )
+
+
+class TestWatchdog(unittest.TestCase):
+    """Tests for _watchdog helper function."""
+
+    def test_watchdog_off_by_default(self):
+        self.assertFalse(
+            _watchdog(MergedConfig({}, argparse.Namespace()), []).is_present(),
+            "_watchdog should not watch workers without a deadline"
+        )
+
+    def test_watchdog_uses_read_deadline(self):
+        deadline = random.randint(1, 60) * 1000
+        cfg = MergedConfig({"read-deadline": deadline}, argparse.Namespace())
+        self.assertEqual(
+            _watchdog(cfg, []).map(repr),
+            Some("Watchdog(deadline=%r, workers=0)" % (deadline / 1000.0)),
+            "_watchdog should abandon calls after read_deadline"
+        )
+
+
+class TestProcesses(unittest.TestCase):
+    """Tests for multi-process helper functions."""
+
+    def test_split_keeps_every_tag_once(self):
+        tags = [TagPath("COM1.T%d" % i) for i in range(random.randint(1, 50))]
+        shards = _split(tags, random.randint(1, 8))
+        self.assertEqual(
+            sorted(t.text() for shard in shards for t in shard),
+            sorted(t.text() for t in tags),
+            "_split should place every tag in exactly one process"
+        )
+
+    def test_split_is_stable(self):
+        tags = [TagPath("COM1.T%d" % i) for i in range(20)]
+        self.assertEqual(
+            [[t.text() for t in s] for s in _split(tags, 3)],
+            [[t.text() for t in s] for s in _split(list(tags), 3)],
+            "_split should place tags the same way every run"
+        )
+
+    def test_collect_keeps_latest_report_per_process(self):
+        reports = Queue.Queue()
+        count = random.randint(2, 10)
+        for value in range(count):
+            reports.put((value % 2, {"overruns": value}))
+        latest = {}
+        _collect(reports, latest)
+        self.assertEqual(
+            (latest, reports.empty()),
+            ({0: {"overruns": (count - 1) // 2 * 2},
+              1: {"overruns": (count - 2) // 2 * 2 + 1}}, True),
+            "_collect should drain reports and keep the latest per process"
+        )
+
+    def test_aggregate_sums_processes(self):
+        first = random.randint(0, 100)
+        second = random.randint(0, 100)
+        reports = {
+            0: {"overruns": first, "reads": {"base": 1.0, "actual": 0.5}},
+            1: {"overruns": second, "reads": {"base": 2.0, "actual": 2.0}}
+        }
+        combined = _aggregate(reports, 1)
+        self.assertEqual(
+            (combined["alive"], combined["overruns"], combined["reads"]),
+            (1, first + second, {"base": 3.0, "actual": 2.5, "saved": 0.0}),
+            "_aggregate should sum overruns and read rates"
+        )
+
+    def test_serve_stops_bridge(self):
+        class Recording:
+            def __init__(self):
+                self.calls = []
+
+            def start(self, tags, interval, topic):
+                self.calls.append("start")
+
+            def stop(self):
+                self.calls.append("stop")
+
+        bridge = Recording()
+        cfg = MergedConfig({"mqtt-topic": "t"}, argparse.Namespace())
+        _serve(cfg, bridge, [], lambda: False, lambda stats: None)
+        self.assertEqual(
+            bridge.calls,
+            ["start", "stop"],
+            "_serve should start and stop the bridge"
+        )
+
+
+class TestBands(unittest.TestCase):
+    """Tests for _bands helper function."""
+
+    def test_bands_uses_absolute_rule(self):
+        width = random.randint(1, 10) / 10.0
+        bands = _bands(
+            [Deadband("*.Temp", width, 0)], [TagPath("COM1.Temp")], {}
+        )
+        self.assertEqual(
+            bands,
+            {"COM1.Temp": width},
+            "_bands should use absolute width"
+        )
+
+    def test_bands_uses_percent_of_range(self):
+        tag = TagPath("COM1.Level")
+        bands = _bands([Deadband("*", 0, 2)], [tag], {tag: (0.0, 50.0)})
+        self.assertEqual(
+            bands,
+            {"COM1.Level": 1.0},
+            "_bands should use percent of EU range"
+        )
+
+    def test_bands_skips_percent_without_range(self):
+        bands = _bands([Deadband("*", 0, 2)], [TagPath("COM1.Level")], {})
+        self.assertEqual(
+            bands,
+            {},
+            "_bands should skip percent rule without EU range"
+        )
+
+    def test_bands_uses_first_matching_rule(self):
+        rules = [Deadband("*.Temp", 0.5, 0), Deadband("*", 2.0, 0)]
+        bands = _bands(rules, [TagPath("A.Temp"), TagPath("A.Flow")], {})
+        self.assertEqual(
+            bands,
+            {"A.Temp": 0.5, "A.Flow": 2.0},
+            "_bands should use first matching rule"
+        )
+
+    def test_bands_skips_unmatched_tags(self):
+        bands = _bands([Deadband("*.Temp", 0.5, 0)], [TagPath("A.Flow")], {})
+        self.assertEqual(
+            bands,
+            {},
+            "_bands should skip tags without matching rule"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
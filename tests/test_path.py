@@ -105,5 +105,20 @@ class TestTagPath(unittest.TestCase):
         )
 
 
+    def test_tag_path_device_takes_leading_segments(self):
+        self.assertEqual(
+            TagPath("COM1.Device.Sensor").device(2),
+            "COM1.Device",
+            "TagPath.device should join leading segments"
+        )
+
+    def test_tag_path_device_of_short_path_is_whole_path(self):
+        self.assertEqual(
+            TagPath("COM1").device(random.randint(1, 5)),
+            "COM1",
+            "TagPath.device should return short path whole"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
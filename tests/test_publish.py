@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for InlineStage and PublishStage.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import unittest
+
+from opcda_to_mqtt.sync.publish import InlineStage, PublishStage
+
+logging.disable(logging.CRITICAL)
+
+
+class TestInlineStage(unittest.TestCase):
+    """Tests for InlineStage."""
+
+    def test_inline_stage_runs_job_at_once(self):
+        done = []
+        InlineStage().submit(lambda: done.append(1))
+        self.assertEqual(
+            done,
+            [1],
+            "InlineStage should run the job on submit"
+        )
+
+
+class TestPublishStage(unittest.TestCase):
+    """Tests for PublishStage."""
+
+    def test_publish_stage_runs_jobs_in_order(self):
+        done = []
+        count = random.randint(1, 100)
+        stage = PublishStage()
+        stage.start()
+        for index in range(count):
+            stage.submit(lambda i=index: done.append(i))
+        stage.stop()
+        self.assertEqual(
+            (done, stage.stats()["published"]),
+            (list(range(count)), count),
+            "PublishStage should run every job in order before stopping"
+        )
+
+    def test_publish_stage_runs_jobs_off_caller_thread(self):
+        threads = []
+        stage = PublishStage()
+        stage.start()
+        stage.submit(lambda: threads.append(threading.current_thread()))
+        stage.stop()
+        self.assertNotEqual(
+            threads,
+            [threading.current_thread()],
+            "PublishStage should run jobs on its own thread"
+        )
+
+    def test_publish_stage_drops_oldest_when_full(self):
+        done = []
+        stage = PublishStage(2, "drop-oldest")
+        for index in range(5):
+            stage.submit(lambda i=index: done.append(i))
+        stage.start()
+        stage.stop()
+        stats = stage.stats()
+        self.assertEqual(
+            (done, stats["dropped"], stats["peak"]),
+            ([3, 4], 3, 2),
+            "PublishStage should drop the oldest jobs when full"
+        )
+
+    def test_publish_stage_survives_failing_job(self):
+        done = []
+        stage = PublishStage()
+        stage.start()
+        stage.submit(lambda: 1 / 0)
+        stage.submit(lambda: done.append(1))
+        stage.stop()
+        self.assertEqual(
+            (done, stage.stats()["errors"]),
+            ([1], 1),
+            "PublishStage should count failed jobs and keep going"
+        )
+
+    def test_publish_stage_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            PublishStage(10, "drop-random")
+
+    def test_publish_stage_repr_shows_size(self):
+        stage = PublishStage()
+        stage.submit(lambda: None)
+        self.assertEqual(
+            repr(stage),
+            "PublishStage(size=1)",
+            "PublishStage repr should show size"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
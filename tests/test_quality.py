@@ -69,6 +69,14 @@ class TestOpcQuality(unittest.TestCase):
             "OpcQuality.is_good should return False for Uncertain"
         )
 
+    def test_opcquality_is_bad_for_bad_and_error(self):
+        self.assertEqual(
+            [OpcQuality(code).is_bad() for code in
+             ["BadCommFailure", "Error", "Uncertain", "Good"]],
+            [True, True, False, False],
+            "OpcQuality.is_bad should hold for Bad codes and Error"
+        )
+
     def test_opcquality_equals_another_with_same_code(self):
         self.assertEqual(
             OpcQuality("Good"),
@@ -11,7 +11,7 @@ import time
 import unittest
 
 from opcda_to_mqtt.sync.queue import TaskQueue
-from opcda_to_mqtt.sync.task import ReadTask
+from opcda_to_mqtt.sync.task import ReadTask, BatchReadTask
 from opcda_to_mqtt.domain.path import TagPath
 
 logging.disable(logging.CRITICAL)
@@ -118,6 +118,44 @@ class TestTaskQueue(unittest.TestCase):
             "TaskQueue should handle multiple producers"
         )
 
+    def test_queue_put_many_keeps_order(self):
+        queue = TaskQueue()
+        items = random.sample(range(1000), random.randint(2, 20))
+        queue.put_many(items)
+        self.assertEqual(
+            queue.get_many(len(items)),
+            items,
+            "TaskQueue.get_many should return put_many items in order"
+        )
+
+    def test_queue_get_many_respects_limit(self):
+        queue = TaskQueue()
+        queue.put_many(list(range(10)))
+        limit = random.randint(1, 9)
+        self.assertEqual(
+            (len(queue.get_many(limit)), queue.size()),
+            (limit, 10 - limit),
+            "TaskQueue.get_many should take at most limit items"
+        )
+
+    def test_queue_get_many_returns_sentinel_alone(self):
+        queue = TaskQueue()
+        queue.put_many([1, 2, None, None])
+        self.assertEqual(
+            [queue.get_many(10) for _ in range(3)],
+            [[1, 2], [None], [None]],
+            "TaskQueue.get_many should hand out each sentinel alone"
+        )
+
+    def test_queue_drain_keeps_sentinels(self):
+        queue = TaskQueue()
+        queue.put_many([1, None, 2])
+        self.assertEqual(
+            (queue.drain(), queue.size(), queue.get()),
+            ([1, 2], 0, None),
+            "TaskQueue.drain should take tasks and leave sentinels"
+        )
+
     def test_queue_repr_shows_size(self):
         queue = TaskQueue()
         queue.put(ReadTask(TagPath("Tag"), lambda r: r))
@@ -128,5 +166,199 @@ class TestTaskQueue(unittest.TestCase):
         )
 
 
+class TestBoundedTaskQueue(unittest.TestCase):
+    """Tests for TaskQueue with a capacity."""
+
+    def _task(self, path, shed):
+        """
+        Build a task recording when it is shed.
+
+        Args:
+            path: Tag path string
+            shed: List collecting shed tag paths
+
+        Returns:
+            BatchReadTask for the tag
+        """
+        return BatchReadTask(
+            [TagPath(path)], lambda r: r, lambda: shed.append(path)
+        )
+
+    def test_queue_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            TaskQueue(10, "drop-random")
+
+    def test_queue_drop_oldest_sheds_oldest(self):
+        shed = []
+        queue = TaskQueue(2, "drop-oldest")
+        for path in ["A", "B", "C"]:
+            queue.put(self._task(path, shed))
+        self.assertEqual(
+            (shed, queue.get().tags()[0].text(), queue.stats()["shed"]),
+            (["A"], "B", 1),
+            "TaskQueue should shed the oldest task when full"
+        )
+
+    def test_queue_never_exceeds_capacity(self):
+        shed = []
+        capacity = random.randint(1, 10)
+        queue = TaskQueue(capacity, "drop-oldest")
+        for index in range(capacity * 3):
+            queue.put(self._task("T%d" % index, shed))
+        self.assertEqual(
+            (queue.size(), len(shed)),
+            (capacity, capacity * 2),
+            "TaskQueue should stay within capacity"
+        )
+
+    def test_queue_coalesce_drops_duplicate(self):
+        shed = []
+        queue = TaskQueue(2, "coalesce")
+        for path in ["A", "B", "A"]:
+            queue.put(self._task(path, shed))
+        self.assertEqual(
+            (shed, queue.size(), queue.stats()["coalesced"]),
+            ([], 2, 1),
+            "TaskQueue should drop a new duplicate without shedding"
+        )
+
+    def test_queue_coalesce_sheds_oldest_without_duplicate(self):
+        shed = []
+        queue = TaskQueue(2, "coalesce")
+        for path in ["A", "B", "C"]:
+            queue.put(self._task(path, shed))
+        self.assertEqual(
+            shed,
+            ["A"],
+            "TaskQueue should shed oldest when nothing coalesces"
+        )
+
+    def test_queue_block_waits_for_room(self):
+        shed = []
+        queue = TaskQueue(1, "block")
+        queue.put(self._task("A", shed))
+        done = []
+        producer = threading.Thread(
+            target=lambda: done.append(queue.put(self._task("B", shed)))
+        )
+        producer.start()
+        time.sleep(0.02)
+        waiting = not done
+        queue.get()
+        producer.join()
+        self.assertEqual(
+            (waiting, queue.get().tags()[0].text(), shed),
+            (True, "B", []),
+            "TaskQueue should block the producer while full"
+        )
+
+    def test_queue_close_releases_blocked_producer(self):
+        shed = []
+        queue = TaskQueue(1, "block")
+        queue.put(self._task("A", shed))
+        producer = threading.Thread(
+            target=lambda: queue.put_many(
+                [self._task("B", shed), self._task("C", shed)]
+            )
+        )
+        producer.start()
+        time.sleep(0.02)
+        queue.close()
+        producer.join(1.0)
+        self.assertEqual(
+            (producer.is_alive(), shed, queue.stats()["shed"]),
+            (False, ["B", "C"], 2),
+            "TaskQueue.close should shed the tasks of blocked producers"
+        )
+
+    def test_queue_coalesce_releases_duplicate(self):
+        seen = []
+        queue = TaskQueue(1, "coalesce")
+        queue.put(BatchReadTask([TagPath("A")], lambda r: seen.append(1)))
+        queue.put(BatchReadTask(
+            [TagPath("A")], lambda r: seen.append(2), lambda: seen.append(3)
+        ))
+        queue.get().answer({})
+        self.assertEqual(
+            seen,
+            [1, 3],
+            "TaskQueue should release a coalesced task without answering it"
+        )
+
+    def test_queue_put_many_applies_policy(self):
+        shed = []
+        queue = TaskQueue(2, "drop-oldest")
+        queue.put_many([self._task(path, shed) for path in "ABCD"])
+        self.assertEqual(
+            (shed, [t.tags()[0].text() for t in queue.get_many(5)]),
+            (["A", "B"], ["C", "D"]),
+            "TaskQueue.put_many should shed like repeated put"
+        )
+
+    def test_queue_sentinels_ignore_capacity(self):
+        queue = TaskQueue(1, "block")
+        queue.put(self._task("A", []))
+        queue.put(None)
+        queue.get()
+        self.assertIsNone(
+            queue.get(),
+            "TaskQueue should accept sentinels when full"
+        )
+
+
+class TestKeyedTaskQueue(unittest.TestCase):
+    """Tests for TaskQueue coalescing per tag."""
+
+    def test_queue_keeps_one_task_per_tag(self):
+        queue = TaskQueue(keyed=True)
+        count = random.randint(2, 10)
+        for _ in range(count):
+            for path in ["A", "B"]:
+                queue.put(BatchReadTask([TagPath(path)], lambda r: r))
+        self.assertEqual(
+            (queue.size(), queue.stats()["coalesced"]),
+            (2, (count - 1) * 2),
+            "Keyed TaskQueue should hold one waiting task per tag"
+        )
+
+    def test_queue_requeues_after_get(self):
+        queue = TaskQueue(keyed=True)
+        queue.put(BatchReadTask([TagPath("A")], lambda r: r))
+        queue.get()
+        queue.put(BatchReadTask([TagPath("A")], lambda r: r))
+        self.assertEqual(
+            queue.size(),
+            1,
+            "Keyed TaskQueue should queue a tag again once taken"
+        )
+
+    def test_queue_keyed_answers_once_per_read(self):
+        seen = []
+        coalesced = []
+        queue = TaskQueue(keyed=True)
+        count = random.randint(2, 10)
+        for index in range(count):
+            queue.put(BatchReadTask(
+                [TagPath("A")], lambda r, i=index: seen.append(i),
+                lambda i=index: coalesced.append(i)
+            ))
+        queue.get().answer({"A": (1, "Good", "t")})
+        self.assertEqual(
+            (seen, coalesced),
+            ([0], list(range(1, count))),
+            "Keyed TaskQueue should answer once and release absorbed tasks"
+        )
+
+    def test_queue_keyed_accepts_plain_items(self):
+        queue = TaskQueue(keyed=True)
+        queue.put(ReadTask(TagPath("A"), lambda r: r))
+        queue.put(ReadTask(TagPath("A"), lambda r: r))
+        self.assertEqual(
+            queue.size(),
+            2,
+            "Keyed TaskQueue should queue tasks that cannot absorb"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
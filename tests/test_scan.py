@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ScanClass.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.sync.scan import ScanClass, Chunk
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class TestScanClass(unittest.TestCase):
+    """Tests for ScanClass."""
+
+    def test_scan_class_matches_glob_pattern(self):
+        self.assertTrue(
+            ScanClass("*.Alarm*", Milliseconds(100)).matches(
+                TagPath("COM1.Alarm 3")
+            ),
+            "ScanClass should match glob pattern"
+        )
+
+    def test_scan_class_rejects_other_tags(self):
+        self.assertFalse(
+            ScanClass("*.Alarm*", Milliseconds(100)).matches(
+                TagPath("COM1.Temp")
+            ),
+            "ScanClass should not match other tags"
+        )
+
+    def test_scan_class_returns_interval(self):
+        amount = random.randint(1, 100000)
+        self.assertEqual(
+            ScanClass("*", Milliseconds(amount)).interval().amount(),
+            amount,
+            "ScanClass should return its interval"
+        )
+
+    def test_scan_class_repr_shows_pattern_and_interval(self):
+        self.assertEqual(
+            repr(ScanClass("*.Alarm*", Milliseconds(100))),
+            "ScanClass('*.Alarm*', 100)",
+            "ScanClass repr should show pattern and interval"
+        )
+
+
+def _read(chunk, values, quality="Good"):
+    """
+    Read the due tags of a chunk.
+
+    Args:
+        chunk: Chunk under test
+        values: Dict mapping tag path strings to values, 1 for
+            tags not listed
+        quality: Quality of every result
+
+    Returns:
+        Tuple of (list of tag path strings read, seconds until
+        the next read)
+    """
+    tags = chunk.due()
+    results = [(values.get(t.text(), 1), quality, "t") for t in tags]
+    return [t.text() for t in tags], chunk.observe(tags, results)
+
+
+class TestChunk(unittest.TestCase):
+    """Tests for Chunk."""
+
+    def test_chunk_starts_at_base_period(self):
+        chunk = Chunk(
+            [TagPath("A")], Milliseconds(500), Some(Milliseconds(8000))
+        )
+        self.assertEqual(
+            _read(chunk, {})[1],
+            0.5,
+            "Chunk should start at base period"
+        )
+
+    def test_chunk_doubles_period_while_static(self):
+        chunk = Chunk(
+            [TagPath("A")], Milliseconds(500), Some(Milliseconds(8000))
+        )
+        periods = [_read(chunk, {})[1] for _ in range(4)]
+        self.assertEqual(
+            periods,
+            [0.5, 1.0, 2.0, 4.0],
+            "Chunk should double period while static"
+        )
+
+    def test_chunk_stops_at_ceiling(self):
+        chunk = Chunk(
+            [TagPath("A")], Milliseconds(500), Some(Milliseconds(3000))
+        )
+        for _ in range(random.randint(5, 20)):
+            _read(chunk, {})
+        self.assertEqual(
+            chunk.period(),
+            3.0,
+            "Chunk period should not exceed ceiling"
+        )
+
+    def test_chunk_snaps_back_on_change(self):
+        chunk = Chunk(
+            [TagPath("A")], Milliseconds(500), Some(Milliseconds(8000))
+        )
+        for _ in range(5):
+            _read(chunk, {})
+        self.assertEqual(
+            _read(chunk, {"A": 2})[1],
+            0.5,
+            "Chunk should return to base period on change"
+        )
+
+    def test_chunk_snaps_back_on_quality_change(self):
+        chunk = Chunk(
+            [TagPath("A")], Milliseconds(500), Some(Milliseconds(8000))
+        )
+        for _ in range(5):
+            _read(chunk, {})
+        self.assertEqual(
+            _read(chunk, {}, "Bad")[1],
+            0.5,
+            "Chunk should return to base period on quality change"
+        )
+
+    def test_chunk_without_ceiling_keeps_base(self):
+        chunk = Chunk([TagPath("A")], Milliseconds(500), Empty())
+        for _ in range(5):
+            _read(chunk, {})
+        self.assertEqual(
+            chunk.period(),
+            0.5,
+            "Chunk without ceiling should keep base period"
+        )
+
+    def test_chunk_skips_static_tags_beside_busy_ones(self):
+        chunk = Chunk(
+            [TagPath("Busy"), TagPath("Still")], Milliseconds(500),
+            Some(Milliseconds(2000))
+        )
+        reads = [_read(chunk, {"Busy": i}) for i in range(8)]
+        self.assertEqual(
+            [r[0] for r in reads],
+            [["Busy", "Still"], ["Busy", "Still"], ["Busy"],
+             ["Busy", "Still"], ["Busy"], ["Busy"], ["Busy"],
+             ["Busy", "Still"]],
+            "Chunk should keep reading busy tags and skip static ones"
+        )
+
+    def test_chunk_tracks_tags_by_path(self):
+        tags = [TagPath("A"), TagPath("B")]
+        chunk = Chunk(tags, Milliseconds(500), Some(Milliseconds(8000)))
+        chunk.due()
+        chunk.observe(tags, [(1, "Good", "t"), (2, "Good", "t")])
+        chunk.due()
+        chunk.observe([tags[1]], [(2, "Good", "t")])
+        chunk.due()
+        self.assertEqual(
+            chunk.observe(tags, [(1, "Good", "t"), (2, "Good", "t")]),
+            1.0,
+            "Chunk should compare each tag with its own last read"
+        )
+
+    def test_chunk_rates_show_saved_reads(self):
+        size = random.randint(1, 10)
+        chunk = Chunk(
+            [TagPath("T%d" % i) for i in range(size)],
+            Milliseconds(500), Some(Milliseconds(1000))
+        )
+        _read(chunk, {})
+        _read(chunk, {})
+        self.assertEqual(
+            chunk.rates(),
+            (size * 2.0, size * 1.0),
+            "Chunk rates should compare base and current period"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ShardedQueue and Shard.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import unittest
+
+from opcda_to_mqtt.sync.shard import ShardedQueue
+from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.task import BatchReadTask
+from opcda_to_mqtt.sync.worker import FakeWorker
+from opcda_to_mqtt.domain.path import TagPath
+
+logging.disable(logging.CRITICAL)
+
+
+def _task(path, shed=None):
+    """
+    Build a read task for one tag.
+
+    Args:
+        path: Tag path string
+        shed: Optional list collecting shed tag paths
+
+    Returns:
+        BatchReadTask ignoring its results
+    """
+    return BatchReadTask(
+        [TagPath(path)], lambda results: None,
+        lambda: shed.append(path) if shed is not None else None
+    )
+
+
+def _sharded(count):
+    """
+    Build a ShardedQueue keyed by full tag path.
+
+    Args:
+        count: Number of shards
+
+    Returns:
+        ShardedQueue over unbounded TaskQueues
+    """
+    return ShardedQueue(
+        [TaskQueue() for _ in range(count)], lambda tag: tag.text()
+    )
+
+
+def _owners(queue, paths):
+    """
+    Find the shard each tag lands on.
+
+    Args:
+        queue: ShardedQueue to route through
+        paths: List of tag path strings
+
+    Returns:
+        Dict mapping tag path to shard index
+    """
+    owners = {}
+    for path in paths:
+        queue.put(_task(path))
+        for index, counters in enumerate(queue.stats()["shards"]):
+            if counters["size"]:
+                owners[path] = index
+                queue.shard(index).get()
+    return owners
+
+
+class TestShardedQueue(unittest.TestCase):
+    """Tests for ShardedQueue."""
+
+    def test_sharded_queue_routes_same_key_to_same_shard(self):
+        queue = _sharded(random.randint(2, 8))
+        for _ in range(3):
+            queue.put(_task("COM1.T1"))
+        sizes = [s["size"] for s in queue.stats()["shards"]]
+        self.assertEqual(
+            sorted(sizes)[-1],
+            3,
+            "ShardedQueue should route one tag to one shard"
+        )
+
+    def test_sharded_queue_spreads_tags(self):
+        count = random.randint(2, 4)
+        queue = _sharded(count)
+        for index in range(200):
+            queue.put(_task("COM1.T%d" % index))
+        self.assertTrue(
+            all(s["size"] for s in queue.stats()["shards"]),
+            "ShardedQueue should give every shard some tags"
+        )
+
+    def test_sharded_queue_deals_sentinels(self):
+        count = random.randint(2, 8)
+        queue = _sharded(count)
+        queue.put_many([None] * count)
+        self.assertEqual(
+            [queue.shard(index).get() for index in range(count)],
+            [None] * count,
+            "ShardedQueue should give each shard one sentinel"
+        )
+
+    def test_sharded_queue_retire_moves_waiting_tasks(self):
+        queue = _sharded(3)
+        for index in range(30):
+            queue.put(_task("T%d" % index))
+        dead = max(
+            range(3), key=lambda i: queue.stats()["shards"][i]["size"]
+        )
+        waiting = queue.stats()["shards"][dead]["size"]
+        queue.shard(dead).retire()
+        stats = queue.stats()
+        self.assertEqual(
+            (stats["size"], stats["moved"], stats["shards"][dead]),
+            (30, waiting, {
+                "size": 0, "shed": 0, "coalesced": 0, "live": False
+            }),
+            "ShardedQueue should move a retired shard's tasks"
+        )
+
+    def test_sharded_queue_keeps_other_keys_on_retire(self):
+        paths = ["T%d" % index for index in range(50)]
+        queue = _sharded(4)
+        before = _owners(queue, paths)
+        dead = random.randint(0, 3)
+        queue.retire(dead)
+        after = _owners(queue, paths)
+        self.assertEqual(
+            [p for p in paths if before[p] != dead and after[p] != before[p]],
+            [],
+            "ShardedQueue should keep tags of live shards in place"
+        )
+
+    def test_sharded_queue_restore_routes_back(self):
+        paths = ["T%d" % index for index in range(50)]
+        queue = _sharded(3)
+        before = _owners(queue, paths)
+        dead = random.randint(0, 2)
+        queue.shard(dead).retire()
+        queue.shard(dead).restore()
+        self.assertEqual(
+            _owners(queue, paths),
+            before,
+            "ShardedQueue should route keys back to a restored shard"
+        )
+
+    def test_sharded_queue_sheds_without_live_shards(self):
+        shed = []
+        queue = _sharded(1)
+        queue.retire(0)
+        queue.put(_task("A", shed))
+        self.assertEqual(
+            shed,
+            ["A"],
+            "ShardedQueue should shed tasks when no shard is left"
+        )
+
+    def test_sharded_queue_failed_worker_hands_over(self):
+        queue = _sharded(2)
+        failing = BatchReadTask([TagPath("X")], None)
+        index = _owners(queue, ["X"])["X"]
+        errors = []
+        worker = FakeWorker(
+            queue.shard(index), {},
+            failed=lambda e: (errors.append(e), queue.retire(index))
+        )
+        worker.start()
+        queue.put(failing)
+        worker.join()
+        queue.put(_task("X"))
+        self.assertEqual(
+            (len(errors), queue.stats()["shards"][1 - index]["size"]),
+            (1, 1),
+            "ShardedQueue should route to a live shard after a failure"
+        )
+
+    def test_sharded_queue_repr_shows_shards(self):
+        queue = _sharded(3)
+        queue.retire(1)
+        self.assertEqual(
+            repr(queue),
+            "ShardedQueue(shards=3, live=2)",
+            "ShardedQueue repr should show shard counts"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
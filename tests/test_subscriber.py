@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ClientSubscriber and FakeSubscriptionClient.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import time
+import unittest
+
+from opcda_to_mqtt.sync.subscriber import (
+    ClientSubscriber, FakeSubscriptionClient
+)
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+
+logging.disable(logging.CRITICAL)
+
+QUICK = Backoff(0.001, 0.001)
+
+
+class TestFakeSubscriptionClient(unittest.TestCase):
+    """Tests for FakeSubscriptionClient."""
+
+    def test_fake_client_emits_initial_values(self):
+        value = random.randint(1, 1000)
+        client = FakeSubscriptionClient({"A": value})
+        events = []
+        client.subscribe(["A"], 100, lambda *e: events.append(e))
+        client.pump(0.01)
+        self.assertEqual(
+            events[0][:3],
+            ("A", value, "Good"),
+            "FakeSubscriptionClient should emit initial values"
+        )
+
+    def test_fake_client_emits_change(self):
+        client = FakeSubscriptionClient({"A": 1})
+        events = []
+        client.subscribe(["A"], 100, lambda *e: events.append(e))
+        value = random.randint(2, 1000)
+        client.change("A", value)
+        client.pump(0.01)
+        self.assertEqual(
+            events[-1][1],
+            value,
+            "FakeSubscriptionClient should emit changed value"
+        )
+
+    def test_fake_client_ignores_unchanged_value(self):
+        client = FakeSubscriptionClient({"A": 1})
+        events = []
+        client.subscribe(["A"], 100, lambda *e: events.append(e))
+        client.change("A", 1)
+        client.pump(0.01)
+        self.assertEqual(
+            len(events),
+            1,
+            "FakeSubscriptionClient should not emit unchanged value"
+        )
+
+    def test_fake_client_emits_quality_change(self):
+        client = FakeSubscriptionClient({"A": 1})
+        events = []
+        client.subscribe(["A"], 100, lambda *e: events.append(e))
+        client.change("A", 1, "Bad")
+        client.pump(0.01)
+        self.assertEqual(
+            events[-1][2],
+            "Bad",
+            "FakeSubscriptionClient should emit quality change"
+        )
+
+    def test_fake_client_records_rate(self):
+        client = FakeSubscriptionClient({})
+        rate = random.randint(10, 1000)
+        client.subscribe([], rate, lambda *e: e)
+        self.assertEqual(
+            client.rate(),
+            rate,
+            "FakeSubscriptionClient should record update rate"
+        )
+
+
+class FlakySubscriptionClient(FakeSubscriptionClient):
+    """Fake data-change client whose first connects fail."""
+
+    def __init__(self, readings, failures):
+        FakeSubscriptionClient.__init__(self, readings)
+        self.failures = failures
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        if self.connects <= self.failures:
+            raise IOError("server unavailable")
+
+
+class TestClientSubscriber(unittest.TestCase):
+    """Tests for ClientSubscriber."""
+
+    def test_subscriber_forwards_changes_as_tag_results(self):
+        client = FakeSubscriptionClient({"A": 1})
+        results = []
+        subscriber = ClientSubscriber(client, 0.005)
+        subscriber.subscribe(
+            [TagPath("A")], Milliseconds(100),
+            lambda tag, result: results.append((tag, result[0]))
+        )
+        subscriber.start()
+        try:
+            time.sleep(0.03)
+            client.change("A", 2)
+            time.sleep(0.03)
+        finally:
+            subscriber.stop()
+            subscriber.join()
+        self.assertEqual(
+            results,
+            [(TagPath("A"), 1), (TagPath("A"), 2)],
+            "ClientSubscriber should forward changes as tag results"
+        )
+
+    def test_subscriber_requests_interval_as_rate(self):
+        client = FakeSubscriptionClient({})
+        amount = random.randint(10, 1000)
+        subscriber = ClientSubscriber(client, 0.005)
+        subscriber.subscribe(
+            [TagPath("A")], Milliseconds(amount), lambda *a: a
+        )
+        subscriber.start()
+        time.sleep(0.02)
+        subscriber.stop()
+        subscriber.join()
+        self.assertEqual(
+            client.rate(),
+            amount,
+            "ClientSubscriber should request interval as update rate"
+        )
+
+    def test_subscriber_closes_client_on_stop(self):
+        closed = threading.Event()
+        client = FakeSubscriptionClient({})
+        client.close = closed.set
+        subscriber = ClientSubscriber(client, 0.005)
+        subscriber.subscribe([TagPath("A")], Milliseconds(100), lambda *a: a)
+        subscriber.start()
+        subscriber.stop()
+        subscriber.join()
+        self.assertTrue(
+            closed.is_set(),
+            "ClientSubscriber should close client on stop"
+        )
+
+    def test_subscriber_reconnects_after_failed_connect(self):
+        failures = random.randint(1, 4)
+        client = FlakySubscriptionClient({"A": 1}, failures)
+        errors = []
+        results = []
+        subscriber = ClientSubscriber(
+            client, 0.005, errors.append, QUICK
+        )
+        subscriber.subscribe(
+            [TagPath("A")], Milliseconds(100),
+            lambda tag, result: results.append(result[0])
+        )
+        subscriber.start()
+        try:
+            time.sleep(0.05)
+        finally:
+            subscriber.stop()
+            subscriber.join()
+        self.assertEqual(
+            (len(errors), subscriber.stats(), results),
+            (failures, {"restarts": failures}, [1]),
+            "ClientSubscriber should report failed connects and retry"
+        )
+
+    def test_subscriber_closes_client_after_failed_connect(self):
+        closes = []
+        client = FlakySubscriptionClient({}, 1)
+        client.close = lambda: closes.append(client.connects)
+        subscriber = ClientSubscriber(client, 0.005, backoff=QUICK)
+        subscriber.subscribe([TagPath("A")], Milliseconds(100), lambda *a: a)
+        subscriber.start()
+        try:
+            time.sleep(0.03)
+        finally:
+            subscriber.stop()
+            subscriber.join()
+        self.assertEqual(
+            closes,
+            [1, 2],
+            "ClientSubscriber should close client after a failed connect"
+        )
+
+    def test_subscriber_keeps_connection_after_failed_callback(self):
+        client = FakeSubscriptionClient({"A": 1})
+        errors = []
+        results = []
+
+        def callback(tag, result):
+            results.append(result[0])
+            if len(results) == 1:
+                raise ValueError("publish failed")
+
+        subscriber = ClientSubscriber(
+            client, 0.005, errors.append, QUICK
+        )
+        subscriber.subscribe([TagPath("A")], Milliseconds(100), callback)
+        subscriber.start()
+        try:
+            time.sleep(0.05)
+        finally:
+            subscriber.stop()
+            subscriber.join()
+        self.assertEqual(
+            ([str(e) for e in errors], results, subscriber.stats()),
+            (["publish failed"], [1], {"restarts": 0}),
+            "ClientSubscriber should keep connection after failed callback"
+        )
+
+    def test_subscriber_repr_shows_tag_count(self):
+        subscriber = ClientSubscriber(FakeSubscriptionClient({}))
+        count = random.randint(2, 9)
+        subscriber.subscribe(
+            [TagPath("T%d" % i) for i in range(count)],
+            Milliseconds(100), lambda *a: a
+        )
+        self.assertIn(
+            str(count),
+            repr(subscriber),
+            "ClientSubscriber repr should show tag count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for SubscriptionBridge.
+"""
+from __future__ import print_function
+
+import json
+import logging
+import random
+import time
+import unittest
+
+from opcda_to_mqtt.sync.subscription import SubscriptionBridge
+from opcda_to_mqtt.sync.subscriber import (
+    ClientSubscriber, FakeSubscriptionClient
+)
+from opcda_to_mqtt.mqtt.fake import FakeMqttBroker
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.domain.interval import Milliseconds
+
+logging.disable(logging.CRITICAL)
+
+
+class BrokenBroker:
+    """Stand-in for a broker whose publishes fail."""
+
+    def publish(self, topic, message):
+        raise IOError("broker unavailable")
+
+
+class TestSubscriptionBridge(unittest.TestCase):
+    """Tests for SubscriptionBridge."""
+
+    def test_subscription_bridge_publishes_initial_values(self):
+        value = random.randint(1, 100)
+        client = FakeSubscriptionClient({"Tag": value})
+        broker = FakeMqttBroker()
+        bridge = SubscriptionBridge([ClientSubscriber(client, 0.005)], broker)
+        bridge.start([TagPath("Tag")], Milliseconds(100), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            json.loads(broker.messages()[0][1])["value"],
+            value,
+            "SubscriptionBridge should publish initial values"
+        )
+
+    def test_subscription_bridge_publishes_only_changes(self):
+        client = FakeSubscriptionClient({"A": 1, "B": 1})
+        broker = FakeMqttBroker()
+        bridge = SubscriptionBridge([ClientSubscriber(client, 0.005)], broker)
+        bridge.start([TagPath("A"), TagPath("B")], Milliseconds(100), "t")
+        time.sleep(0.03)
+        broker.clear()
+        client.change("A", 2)
+        client.change("B", 1)
+        time.sleep(0.03)
+        bridge.stop()
+        self.assertEqual(
+            [m[0] for m in broker.messages()],
+            ["t/A"],
+            "SubscriptionBridge should publish only changed tags"
+        )
+
+    def test_subscription_bridge_splits_tags_across_subscribers(self):
+        clients = [FakeSubscriptionClient({}) for _ in range(3)]
+        broker = FakeMqttBroker()
+        bridge = SubscriptionBridge(
+            [ClientSubscriber(c, 0.005) for c in clients], broker
+        )
+        tags = [TagPath("Tag%d" % i) for i in range(7)]
+        bridge.start(tags, Milliseconds(100), "t")
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            len(set(m[0] for m in broker.messages())),
+            7,
+            "SubscriptionBridge should subscribe every tag once"
+        )
+
+    def test_subscription_bridge_skips_idle_subscribers(self):
+        broker = FakeMqttBroker()
+        subscribers = [
+            ClientSubscriber(FakeSubscriptionClient({}), 0.005)
+            for _ in range(5)
+        ]
+        bridge = SubscriptionBridge(subscribers, broker)
+        bridge.start([TagPath("Tag")], Milliseconds(100), "t")
+        time.sleep(0.02)
+        bridge.stop()
+        self.assertEqual(
+            len(broker.messages()),
+            1,
+            "SubscriptionBridge should skip subscribers without tags"
+        )
+
+    def test_subscription_bridge_counts_failed_publishes(self):
+        count = random.randint(2, 6)
+        client = FakeSubscriptionClient(
+            dict(("T%d" % i, i) for i in range(count))
+        )
+        broker = FakeMqttBroker()
+        broker.publish = BrokenBroker().publish
+        subscriber = ClientSubscriber(client, 0.005)
+        bridge = SubscriptionBridge([subscriber], broker)
+        bridge.start(
+            [TagPath("T%d" % i) for i in range(count)],
+            Milliseconds(100), "t"
+        )
+        time.sleep(0.05)
+        bridge.stop()
+        self.assertEqual(
+            (bridge.stats()["publish"], subscriber.stats()),
+            ({"errors": count}, {"restarts": 0}),
+            "SubscriptionBridge should count failed publishes, not reconnect"
+        )
+
+    def test_subscription_bridge_repr_shows_subscriber_count(self):
+        count = random.randint(2, 5)
+        subscribers = [
+            ClientSubscriber(FakeSubscriptionClient({})) for _ in range(count)
+        ]
+        bridge = SubscriptionBridge(subscribers, FakeMqttBroker())
+        self.assertIn(
+            str(count),
+            repr(bridge),
+            "SubscriptionBridge repr should show subscriber count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
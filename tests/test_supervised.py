@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for SupervisedWorker.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import threading
+import time
+import unittest
+
+from opcda_to_mqtt.sync.supervised import SupervisedWorker
+from opcda_to_mqtt.sync.backoff import Backoff
+from opcda_to_mqtt.sync.limit import ConcurrencyLimit, LimitedQueue
+from opcda_to_mqtt.sync.queue import TaskQueue
+from opcda_to_mqtt.sync.task import BatchReadTask
+from opcda_to_mqtt.sync.worker import FakeOpcClient
+from opcda_to_mqtt.domain.path import TagPath
+from opcda_to_mqtt.result.optional import Empty
+
+logging.disable(logging.CRITICAL)
+
+QUICK = Backoff(0.001, 0.001)
+
+
+class FlakyClient(FakeOpcClient):
+    """Fake client whose reads raise for chosen tags."""
+
+    def __init__(self, readings, broken):
+        FakeOpcClient.__init__(self, readings)
+        self.broken = broken
+        self.closed = False
+
+    def read(self, tags, sync=True):
+        names = tags if isinstance(tags, list) else [tags]
+        if any(name in self.broken for name in names):
+            raise IOError("read failed")
+        return FakeOpcClient.read(self, tags, sync)
+
+    def close(self):
+        self.closed = True
+
+
+class HangingClient(FakeOpcClient):
+    """Fake client whose reads block until released."""
+
+    def __init__(self, readings):
+        FakeOpcClient.__init__(self, readings)
+        self.release = threading.Event()
+
+    def read(self, tags, sync=True):
+        self.release.wait()
+        return FakeOpcClient.read(self, tags, sync)
+
+    def close(self):
+        pass
+
+
+class ScriptedWorker(SupervisedWorker):
+    """Worker connecting with scripted clients or errors."""
+
+    def __init__(self, queue, connections, **kwargs):
+        SupervisedWorker.__init__(self, queue, **kwargs)
+        self.connections = list(connections)
+        self.clients = []
+
+    def _connect(self):
+        outcome = self.connections.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        self.clients.append(outcome)
+        return outcome
+
+
+class TestSupervisedWorker(unittest.TestCase):
+    """Tests for SupervisedWorker."""
+
+    def test_worker_fails_task_and_keeps_serving(self):
+        queue = TaskQueue()
+        value = random.randint(0, 100)
+        seen = []
+        errors = []
+        worker = ScriptedWorker(
+            queue,
+            [FlakyClient({}, ["Bad"]), FlakyClient({"Good": value}, [])],
+            failed=errors.append, backoff=QUICK
+        )
+        queue.put(BatchReadTask([TagPath("Bad")], seen.append))
+        queue.put(BatchReadTask([TagPath("Good")], seen.append))
+        queue.put(None)
+        worker.start()
+        worker.join()
+        self.assertEqual(
+            ([r[0][1] for r in seen], seen[1][0][0], len(errors)),
+            (["Error", "Good"], value, 1),
+            "SupervisedWorker should fail the task and go on reading"
+        )
+
+    def test_worker_reconnects_after_failed_read(self):
+        queue = TaskQueue()
+        worker = ScriptedWorker(
+            queue, [FlakyClient({}, ["Bad"]), FlakyClient({}, [])],
+            backoff=QUICK
+        )
+        queue.put(BatchReadTask([TagPath("Bad")], lambda r: r))
+        queue.put(None)
+        worker.start()
+        worker.join()
+        self.assertEqual(
+            ([c.closed for c in worker.clients], worker.stats()),
+            ([True, True], {"live": True, "restarts": 1}),
+            "SupervisedWorker should close and replace its connection"
+        )
+
+    def test_worker_retries_connect(self):
+        queue = TaskQueue()
+        failures = random.randint(1, 5)
+        recovered = []
+        worker = ScriptedWorker(
+            queue,
+            [IOError("down")] * failures + [FlakyClient({}, [])],
+            recovered=lambda: recovered.append(1), backoff=QUICK
+        )
+        queue.put(None)
+        worker.start()
+        worker.join()
+        self.assertEqual(
+            (worker.stats()["restarts"], recovered),
+            (failures, [1]),
+            "SupervisedWorker should retry until it connects"
+        )
+
+    def test_worker_stops_while_reconnecting(self):
+        queue = TaskQueue()
+        worker = ScriptedWorker(
+            queue, [IOError("down")] * 10, backoff=Backoff(60.0, 60.0)
+        )
+        worker.start()
+        time.sleep(0.02)
+        worker.stop()
+        worker.join()
+        self.assertEqual(
+            worker.stats(),
+            {"live": False, "restarts": 1},
+            "SupervisedWorker should stop without waiting out backoff"
+        )
+
+    def test_worker_sheds_held_tasks_on_stop(self):
+        queue = TaskQueue()
+        shed = []
+        worker = ScriptedWorker(
+            queue, [FlakyClient({}, ["A"])] + [IOError("down")] * 10,
+            drain=2, backoff=Backoff(60.0, 60.0)
+        )
+        queue.put_many([
+            BatchReadTask([TagPath("A")], lambda r: r),
+            BatchReadTask([TagPath("B")], None, lambda: shed.append("B"))
+        ])
+        worker.start()
+        time.sleep(0.02)
+        worker.stop()
+        worker.join()
+        self.assertEqual(
+            shed,
+            ["B"],
+            "SupervisedWorker should shed tasks it could not run"
+        )
+
+    def test_worker_abandon_without_call_is_refused(self):
+        worker = ScriptedWorker(TaskQueue(), [])
+        self.assertEqual(
+            (worker.abandon(IOError("stuck")), worker.busy_since()),
+            (False, Empty()),
+            "SupervisedWorker should not abandon while idle"
+        )
+
+    def test_worker_waiting_for_slot_is_not_busy(self):
+        limit = ConcurrencyLimit(1, 10.0)
+        started = limit.acquire()
+        queue = LimitedQueue(TaskQueue(), limit)
+        seen = []
+        worker = ScriptedWorker(
+            queue, [FakeOpcClient({"A": 1})], backoff=QUICK
+        )
+        worker.start()
+        queue.put(BatchReadTask([TagPath("A")], seen.append))
+        time.sleep(0.02)
+        waiting = worker.busy_since()
+        limit.release(started)
+        queue.put(None)
+        worker.join()
+        self.assertEqual(
+            (waiting, len(seen)),
+            (Empty(), 1),
+            "SupervisedWorker should not count waiting for a slot as busy"
+        )
+
+    def test_worker_abandons_hung_read(self):
+        queue = TaskQueue()
+        value = random.randint(0, 100)
+        hung = HangingClient({"A": -1})
+        seen = []
+        errors = []
+        worker = ScriptedWorker(
+            queue, [hung, FakeOpcClient({"A": value})],
+            failed=errors.append, backoff=QUICK
+        )
+        worker.start()
+        queue.put(BatchReadTask([TagPath("A")], seen.append))
+        while not worker.busy_since().is_present():
+            time.sleep(0.001)
+        abandoned = worker.abandon(IOError("stuck"))
+        queue.put(BatchReadTask([TagPath("A")], seen.append))
+        queue.put(None)
+        worker.join()
+        hung.release.set()
+        time.sleep(0.02)
+        self.assertEqual(
+            (abandoned, [r[0][:2] for r in seen], len(errors),
+             worker.stats()),
+            (True, [(None, "Error"), (value, "Good")], 1,
+             {"live": True, "restarts": 1}),
+            "SupervisedWorker should fail a hung read and carry on"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """
-Tests for Task and ReadTask.
+Tests for Task, ReadTask and BatchReadTask.
 """
 from __future__ import print_function
 
@@ -9,7 +9,7 @@ import random
 import string
 import unittest
 
-from opcda_to_mqtt.sync.task import ReadTask
+from opcda_to_mqtt.sync.task import ReadTask, BatchReadTask
 from opcda_to_mqtt.sync.worker import FakeOpcClient
 from opcda_to_mqtt.domain.path import TagPath
 
@@ -79,6 +79,196 @@ class TestReadTask(unittest.TestCase):
         )
 
 
+class TestBatchReadTask(unittest.TestCase):
+    """Tests for BatchReadTask."""
+
+    def test_batch_task_reads_all_tags_in_one_call(self):
+        count = random.randint(2, 10)
+        paths = ["Tag%d" % i for i in range(count)]
+        calls = []
+        class Recording:
+            def read(self, tags, sync=True):
+                calls.append(tags)
+                return [(t, 0, "Good", "ts") for t in tags]
+        task = BatchReadTask([TagPath(p) for p in paths], lambda r: r)
+        task.execute(Recording())
+        self.assertEqual(
+            calls,
+            [paths],
+            "BatchReadTask should read all tags in one call"
+        )
+
+    def test_batch_task_passes_results_in_tag_order(self):
+        readings = dict(
+            ("Tag%d" % i, random.randint(1, 1000)) for i in range(5)
+        )
+        paths = sorted(readings.keys())
+        results = []
+        task = BatchReadTask(
+            [TagPath(p) for p in paths], lambda r: results.extend(r)
+        )
+        task.execute(FakeOpcClient(readings))
+        self.assertEqual(
+            [r[0] for r in results],
+            [readings[p] for p in paths],
+            "BatchReadTask should pass results in tag order"
+        )
+
+    def test_batch_task_matches_results_by_name(self):
+        class Reversed:
+            def read(self, tags, sync=True):
+                return [(t, t + "!", "Good", "ts") for t in reversed(tags)]
+        results = []
+        task = BatchReadTask(
+            [TagPath("A"), TagPath("B")], lambda r: results.extend(r)
+        )
+        task.execute(Reversed())
+        self.assertEqual(
+            [r[0] for r in results],
+            ["A!", "B!"],
+            "BatchReadTask should match results by name"
+        )
+
+    def test_batch_task_reports_error_for_missing_item(self):
+        class Partial:
+            def read(self, tags, sync=True):
+                return [(tags[0], 1, "Good", "ts")]
+        results = []
+        task = BatchReadTask(
+            [TagPath("A"), TagPath("B")], lambda r: results.extend(r)
+        )
+        task.execute(Partial())
+        self.assertEqual(
+            results[1][1],
+            "Error",
+            "BatchReadTask should report Error for missing item"
+        )
+
+    def test_batch_task_tags_returns_copy(self):
+        task = BatchReadTask([TagPath("A")], lambda r: r)
+        task.tags().append(TagPath("B"))
+        self.assertEqual(
+            len(task.tags()),
+            1,
+            "BatchReadTask.tags should return a copy"
+        )
+
+    def test_batch_task_repr_shows_count(self):
+        count = random.randint(2, 9)
+        tags = [TagPath("Tag%d" % i) for i in range(count)]
+        self.assertIn(
+            str(count),
+            repr(BatchReadTask(tags, lambda r: r)),
+            "BatchReadTask repr should show tag count"
+        )
+
+
+    def test_batch_task_reports_shedding(self):
+        skipped = []
+        task = BatchReadTask(
+            [TagPath("Tag")], lambda r: r, lambda: skipped.append(1)
+        )
+        task.shed()
+        self.assertEqual(
+            skipped,
+            [1],
+            "BatchReadTask.shed should call skipped"
+        )
+
+    def test_batch_task_coalesces_absorbed_tasks(self):
+        value = random.randint(0, 1000)
+        client = FakeOpcClient({"A": value, "B": value + 1})
+        seen = []
+        host = BatchReadTask(
+            [TagPath("A"), TagPath("B")], lambda r: seen.append(len(r))
+        )
+        rider = BatchReadTask(
+            [TagPath("B")], lambda r: seen.append(r[0][0]),
+            lambda: seen.append("coalesced")
+        )
+        absorbed = host.absorb(rider)
+        host.execute(client)
+        self.assertEqual(
+            (absorbed, seen),
+            (True, [2, "coalesced"]),
+            "BatchReadTask should coalesce absorbed tasks, not answer them"
+        )
+
+    def test_batch_task_coalesces_absorbed_tasks_when_callback_raises(self):
+        coalesced = []
+
+        def callback(results):
+            raise IOError("publish failed")
+
+        host = BatchReadTask([TagPath("A")], callback)
+        host.absorb(BatchReadTask(
+            [TagPath("A")], lambda r: r, lambda: coalesced.append(1)
+        ))
+        self.assertRaises(IOError, host.answer, {})
+        self.assertEqual(
+            coalesced,
+            [1],
+            "BatchReadTask should release absorbed tasks if callback raises"
+        )
+
+    def test_batch_task_fail_reports_error_quality(self):
+        seen = []
+        count = random.randint(1, 10)
+        task = BatchReadTask(
+            [TagPath("T%d" % i) for i in range(count)], seen.append
+        )
+        task.fail(IOError("read failed"))
+        self.assertEqual(
+            seen,
+            [[(None, "Error", None)] * count],
+            "BatchReadTask.fail should report every tag as Error"
+        )
+
+    def test_batch_task_fail_after_answer_is_ignored(self):
+        seen = []
+        task = BatchReadTask([TagPath("A")], seen.append)
+        task.execute(FakeOpcClient({"A": 1}))
+        task.fail(IOError("publish failed"))
+        self.assertEqual(
+            len(seen),
+            1,
+            "BatchReadTask.fail should not answer twice"
+        )
+
+    def test_batch_task_late_read_after_fail_is_dropped(self):
+        seen = []
+        task = BatchReadTask([TagPath("A")], seen.append)
+        task.fail(IOError("read hung"))
+        task.execute(FakeOpcClient({"A": random.randint(0, 100)}))
+        self.assertEqual(
+            seen,
+            [[(None, "Error", None)]],
+            "BatchReadTask should drop a read returning after fail"
+        )
+
+    def test_batch_task_refuses_other_tags(self):
+        host = BatchReadTask([TagPath("A")], lambda r: r)
+        self.assertFalse(
+            host.absorb(BatchReadTask([TagPath("A"), TagPath("B")], None)),
+            "BatchReadTask should not absorb tasks reading other tags"
+        )
+
+    def test_batch_task_sheds_absorbed_tasks(self):
+        skipped = []
+        host = BatchReadTask(
+            [TagPath("A")], lambda r: r, lambda: skipped.append("host")
+        )
+        host.absorb(BatchReadTask(
+            [TagPath("A")], lambda r: r, lambda: skipped.append("rider")
+        ))
+        host.shed()
+        self.assertEqual(
+            skipped,
+            ["host", "rider"],
+            "BatchReadTask.shed should shed absorbed tasks too"
+        )
+
+
 class TestFakeOpcClient(unittest.TestCase):
     """Tests for FakeOpcClient."""
 
@@ -112,6 +302,16 @@ class TestFakeOpcClient(unittest.TestCase):
             "FakeOpcClient.read should return 0 for unknown tag"
         )
 
+    def test_fake_client_read_list_returns_named_tuples(self):
+        value = random.randint(1, 1000)
+        client = FakeOpcClient({"A": value})
+        result = client.read(["A", "B"], sync=True)
+        self.assertEqual(
+            [(r[0], r[1]) for r in result],
+            [("A", value), ("B", 0)],
+            "FakeOpcClient.read should return named tuples for list"
+        )
+
     def test_fake_client_connect_does_not_raise(self):
         client = FakeOpcClient({})
         client.connect("ProgID")
@@ -11,6 +11,7 @@ import time
 import unittest
 
 from opcda_to_mqtt.sync.timer import TimerThread
+from opcda_to_mqtt.sync.histogram import Histogram
 
 logging.disable(logging.CRITICAL)
 
@@ -129,6 +130,39 @@ class TestTimerThread(unittest.TestCase):
         finally:
             timer.stop()
 
+    def test_timer_ignores_wall_clock(self):
+        now = [0.0]
+        timer = TimerThread(lambda: now[0])
+        timer.start()
+        fired = []
+        try:
+            timer.schedule(1000.0, lambda: fired.append(1))
+            time.sleep(0.02)
+            self.assertEqual(
+                fired,
+                [],
+                "TimerThread should wait on its own clock"
+            )
+        finally:
+            timer.stop()
+
+    def test_timer_records_lateness(self):
+        timer = TimerThread()
+        timer.start()
+        try:
+            count = random.randint(1, 5)
+            for _ in range(count):
+                timer.schedule(0.0, lambda: 1)
+            time.sleep(0.05)
+            lateness = timer.stats()["lateness"]
+            self.assertEqual(
+                (lateness["count"], sum(lateness["buckets"])),
+                (count, count),
+                "TimerThread should record lateness of every callback"
+            )
+        finally:
+            timer.stop()
+
     def test_timer_repr_shows_pending(self):
         timer = TimerThread()
         timer.start()
@@ -171,5 +205,40 @@ class TestTimerThread(unittest.TestCase):
             timer.stop()
 
 
+class TestHistogram(unittest.TestCase):
+    """Tests for Histogram."""
+
+    def test_histogram_counts_into_bucket_by_bound(self):
+        histogram = Histogram([1, 10, 100])
+        histogram.record(0.005)
+        histogram.record(0.010)
+        histogram.record(0.5)
+        self.assertEqual(
+            histogram.stats()["buckets"],
+            [0, 2, 0, 1],
+            "Histogram should count delays up to each bound"
+        )
+
+    def test_histogram_counts_negative_as_zero(self):
+        histogram = Histogram([1])
+        histogram.record(-random.random())
+        self.assertEqual(
+            histogram.stats()["buckets"],
+            [1, 0],
+            "Histogram should count early fires as zero"
+        )
+
+    def test_histogram_reports_mean_and_max(self):
+        histogram = Histogram([1])
+        histogram.record(0.002)
+        histogram.record(0.004)
+        stats = histogram.stats()
+        self.assertEqual(
+            (stats["mean"], stats["max"]),
+            (3.0, 4.0),
+            "Histogram should report mean and max in milliseconds"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
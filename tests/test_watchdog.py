@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Watchdog.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import time
+import unittest
+
+from opcda_to_mqtt.sync.watchdog import Watchdog
+from opcda_to_mqtt.result.optional import Some, Empty
+
+logging.disable(logging.CRITICAL)
+
+
+class StuckWorker:
+    """Fake worker reporting a fixed call start time."""
+
+    def __init__(self, started):
+        self.started = started
+        self.errors = []
+
+    def busy_since(self):
+        return self.started
+
+    def abandon(self, error):
+        if not self.started.is_present():
+            return False
+        self.errors.append(error)
+        self.started = Empty()
+        return True
+
+
+class TestWatchdog(unittest.TestCase):
+    """Tests for Watchdog."""
+
+    def test_watchdog_abandons_overdue_calls(self):
+        now = random.uniform(100.0, 1000.0)
+        stuck = StuckWorker(Some(now - 12.0))
+        fresh = StuckWorker(Some(now - 1.0))
+        idle = StuckWorker(Empty())
+        watchdog = Watchdog([stuck, fresh, idle], 10.0, lambda: now)
+        self.assertEqual(
+            (watchdog.check(), len(stuck.errors), len(fresh.errors)),
+            (1, 1, 0),
+            "Watchdog should abandon only calls past the deadline"
+        )
+
+    def test_watchdog_counts_stuck_durations(self):
+        now = random.uniform(100.0, 1000.0)
+        workers = [StuckWorker(Some(now - 3.0)) for _ in range(3)]
+        watchdog = Watchdog(workers, 1.0, lambda: now)
+        watchdog.check()
+        watchdog.check()
+        stats = watchdog.stats()
+        self.assertEqual(
+            (stats["stuck"], stats["duration"]["count"],
+             stats["duration"]["buckets"][2]),
+            (3, 3, 3),
+            "Watchdog should count each abandoned call once"
+        )
+
+    def test_watchdog_thread_checks_workers(self):
+        worker = StuckWorker(Some(time.time() - 60.0))
+        watchdog = Watchdog([worker], 0.01, time.time)
+        watchdog.start()
+        time.sleep(0.2)
+        watchdog.stop()
+        self.assertEqual(
+            (len(worker.errors), watchdog.stats()["stuck"]),
+            (1, 1),
+            "Watchdog thread should abandon hung calls on its own"
+        )
+
+    def test_watchdog_repr_shows_deadline(self):
+        self.assertEqual(
+            repr(Watchdog([StuckWorker(Empty())], 30.0)),
+            "Watchdog(deadline=30.0, workers=1)",
+            "Watchdog repr should show deadline and worker count"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
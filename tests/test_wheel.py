@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for WheelTimer.
+"""
+from __future__ import print_function
+
+import logging
+import random
+import time
+import unittest
+
+from opcda_to_mqtt.sync.clock import monotonic
+from opcda_to_mqtt.sync.wheel import WheelTimer
+
+logging.disable(logging.CRITICAL)
+
+
+class TestWheelTimer(unittest.TestCase):
+    """Tests for WheelTimer."""
+
+    def test_wheel_starts_with_no_pending(self):
+        self.assertEqual(
+            WheelTimer(0.01, 64).pending(),
+            0,
+            "WheelTimer should start with no pending"
+        )
+
+    def test_wheel_schedule_increases_pending(self):
+        timer = WheelTimer(0.01, 64)
+        timer.start()
+        try:
+            count = random.randint(1, 20)
+            for _ in range(count):
+                timer.schedule(10.0, lambda: 1)
+            self.assertEqual(
+                timer.pending(),
+                count,
+                "WheelTimer.schedule should increase pending"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_fires_callback_after_delay(self):
+        timer = WheelTimer(0.005, 64)
+        timer.start()
+        fired = []
+        try:
+            timer.schedule(0.02, lambda: fired.append(1))
+            time.sleep(0.08)
+            self.assertEqual(
+                (len(fired), timer.pending()),
+                (1, 0),
+                "WheelTimer should fire callback after delay"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_does_not_fire_early(self):
+        timer = WheelTimer(0.05, 64)
+        timer.start()
+        fired = []
+        try:
+            time.sleep(0.07)
+            start = monotonic()
+            timer.schedule(0.05, lambda: fired.append(monotonic() - start))
+            time.sleep(0.15)
+            self.assertGreaterEqual(
+                fired[0],
+                0.049,
+                "WheelTimer should not fire before delay"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_waits_whole_turns_for_long_delays(self):
+        timer = WheelTimer(0.005, 4)
+        timer.start()
+        fired = []
+        try:
+            start = monotonic()
+            timer.schedule(0.1, lambda: fired.append(monotonic() - start))
+            time.sleep(0.2)
+            self.assertGreaterEqual(
+                fired[0],
+                0.095,
+                "WheelTimer should keep turns for delays beyond the wheel"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_fires_slot_as_batch(self):
+        timer = WheelTimer(0.01, 64)
+        timer.start()
+        fired = []
+        try:
+            count = random.randint(10, 100)
+            for index in range(count):
+                timer.schedule(0.02, lambda i=index: fired.append(i))
+            time.sleep(0.1)
+            self.assertEqual(
+                sorted(fired),
+                list(range(count)),
+                "WheelTimer should fire every callback of a slot"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_records_lateness(self):
+        timer = WheelTimer(0.005, 64)
+        timer.start()
+        try:
+            timer.schedule(0.01, lambda: 1)
+            time.sleep(0.05)
+            self.assertEqual(
+                timer.stats()["lateness"]["count"],
+                1,
+                "WheelTimer should record lateness of fired callbacks"
+            )
+        finally:
+            timer.stop()
+
+    def test_wheel_stops_promptly(self):
+        timer = WheelTimer(10.0, 8)
+        timer.start()
+        start = monotonic()
+        timer.stop()
+        self.assertLess(
+            monotonic() - start,
+            1.0,
+            "WheelTimer should stop without waiting a tick"
+        )
+
+    def test_wheel_repr_shows_slots(self):
+        slots = random.randint(1, 1000)
+        self.assertEqual(
+            repr(WheelTimer(0.01, slots)),
+            "WheelTimer(slots=%d, pending=0)" % slots,
+            "WheelTimer repr should show slots and pending"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
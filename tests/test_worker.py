@@ -133,6 +133,35 @@ class TestFakeWorker(unittest.TestCase):
             "FakeWorker.executed should return a copy"
         )
 
+    def test_worker_reports_failure(self):
+        queue = TaskQueue()
+        errors = []
+        worker = FakeWorker(queue, {}, failed=errors.append)
+        worker.start()
+        queue.put(ReadTask(TagPath("Tag"), None))
+        worker.join()
+        self.assertEqual(
+            len(errors),
+            1,
+            "FakeWorker should report the error that stopped it"
+        )
+
+    def test_worker_drains_several_tasks_per_wakeup(self):
+        queue = TaskQueue()
+        count = random.randint(2, 20)
+        queue.put_many(
+            [ReadTask(TagPath("T%d" % i), lambda r: r) for i in range(count)]
+            + [None]
+        )
+        worker = FakeWorker(queue, {}, count)
+        worker.start()
+        worker.join()
+        self.assertEqual(
+            (len(worker.executed()), worker.wakeups()),
+            (count, 1),
+            "FakeWorker should take all waiting tasks in one wakeup"
+        )
+
 
 if __name__ == "__main__":
     unittest.main()